@@ -1,3 +1,29 @@
 """Define the aiopurpleair package."""
 
-from .api import API  # noqa
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import API
+
+__all__ = ["API"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the API object (and its dependencies) only when it's first used.
+
+    Args:
+        name: The name of the attribute.
+
+    Returns:
+        The attribute.
+
+    Raises:
+        AttributeError: Raised when the attribute doesn't exist.
+    """
+    if name == "API":
+        from .api import API  # pylint: disable=import-outside-toplevel
+
+        return API
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
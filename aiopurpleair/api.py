@@ -2,17 +2,47 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+import asyncio
+import time
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+from functools import cached_property
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, cast
 
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientResponse, ClientSession, ClientTimeout
 from aiohttp.client_exceptions import ClientError
 from pydantic import ValidationError
 
 from aiopurpleair.const import LOGGER
-from aiopurpleair.endpoints.sensors import SensorsEndpoints
-from aiopurpleair.errors import RequestError, raise_error
+from aiopurpleair.errors import RequestError, ServiceUnavailableError, raise_error
+from aiopurpleair.helpers.batcher import BatchSettings
+from aiopurpleair.helpers.cache import CacheSettings, ResponseCache
+from aiopurpleair.helpers.coalesce import SingleFlight, get_params_key
+from aiopurpleair.helpers.connector import (
+    ConnectionStats,
+    ConnectorSettings,
+    build_connection_trace_config,
+)
+from aiopurpleair.helpers.instrumentation import (
+    Instrumentation,
+    RequestMetrics,
+    build_timing_trace_config,
+    get_row_count,
+)
+from aiopurpleair.helpers.jsonlib import JSONDecoder, get_json_decoder
 from aiopurpleair.helpers.model import PurpleAirBaseModel, PurpleAirBaseModelT
+from aiopurpleair.helpers.ratelimit import (
+    RateLimiter,
+    RateLimitSettings,
+    get_response_points,
+)
+from aiopurpleair.helpers.retry import RetryPolicy, get_retry_after
 from aiopurpleair.models.keys import GetKeysResponse
+from aiopurpleair.util.dt import utc_to_timestamp
+
+if TYPE_CHECKING:
+    from aiopurpleair.endpoints.sensors import SensorsEndpoints
 
 API_URL_BASE = "https://api.purpleair.com/v1"
 
@@ -28,18 +58,144 @@ class API:
         self,
         api_key: str,
         *,
+        base_url: str = API_URL_BASE,
         session: ClientSession | None = None,
+        connector_settings: ConnectorSettings | None = None,
+        batch_settings: BatchSettings | None = None,
+        coalesce_requests: bool = True,
+        cache_settings: CacheSettings | None = None,
+        rate_limit_settings: RateLimitSettings | None = None,
+        retry_policy: RetryPolicy | None = None,
+        json_decoder: JSONDecoder | None = None,
     ) -> None:
         """Initialize.
 
         Args:
             api_key: A PurpleAir API key.
+            base_url: The base URL of the API (e.g., to point at a local stand-in
+                server; see aiopurpleair.testing).
             session: An optional aiohttp ClientSession.
+            connector_settings: Optional settings for the pooled connector that is
+                used when no session is provided.
+            batch_settings: If provided, concurrent single-sensor requests are merged
+                into batched requests with these settings.
+            coalesce_requests: Whether identical GET requests that are in flight at the
+                same time should share a single network call (and parsed result).
+            cache_settings: If provided, GET responses are cached in memory with these
+                settings.
+            rate_limit_settings: If provided, requests are scheduled to stay within an
+                API points budget with these settings.
+            retry_policy: If provided, failed requests are retried (and an unhealthy
+                API is given time to recover) according to this policy.
+            json_decoder: A function that decodes JSON response bodies (defaults to the
+                fastest installed decoder; see get_json_decoder).
         """
         self._api_key = api_key
+        self._base_url = base_url
+        self._batch_settings = batch_settings
+        self._coalesce_requests = coalesce_requests
+        self._json_decoder = json_decoder or get_json_decoder()
+        self._connector_settings = connector_settings or ConnectorSettings()
+        self._owned_session: ClientSession | None = None
         self._session = session
 
-        self.sensors = SensorsEndpoints(self.async_request)
+        self._revalidation_tasks: dict[Hashable, asyncio.Task[None]] = {}
+        self._single_flight: SingleFlight[Any] = SingleFlight()
+
+        self.cache = ResponseCache(cache_settings) if cache_settings else None
+        self.coalescing_stats = self._single_flight.stats
+        self.connection_stats = ConnectionStats()
+        self.instrumentation = Instrumentation()
+        self.rate_limiter = (
+            RateLimiter(rate_limit_settings) if rate_limit_settings else None
+        )
+        self.retry_policy = retry_policy
+
+    @cached_property
+    def sensors(self) -> SensorsEndpoints:
+        """Return the sensor endpoints.
+
+        They're built (and the sensor models imported) the first time they're used, so
+        that importing and creating an API object stays cheap.
+
+        Returns:
+            A SensorsEndpoints object.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from aiopurpleair.endpoints.sensors import SensorsEndpoints
+
+        return SensorsEndpoints(
+            self.async_request,
+            self.async_request_stream,
+            self.async_request_bytes,
+            batch_settings=self._batch_settings,
+        )
+
+    async def __aenter__(self) -> API:
+        """Enter the API context.
+
+        Returns:
+            This API object.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the API context (closing the owned session).
+
+        Args:
+            exc_type: The type of a raised exception (if any).
+            exc_val: A raised exception (if any).
+            exc_tb: The traceback of a raised exception (if any).
+        """
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Stop any background work and close the session owned by this API object.
+
+        A session passed in by the caller is never closed, since it belongs to them.
+        """
+        # Background refreshes are waited for, so that none of them is still using the
+        # session once it's closed:
+        tasks = list(self._revalidation_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.close()
+
+        if self._owned_session is not None:
+            await self._owned_session.close()
+            self._owned_session = None
+
+    def _get_session(self) -> ClientSession:
+        """Get the session to use for a request.
+
+        A session passed in by the caller takes priority; otherwise, a single pooled
+        session is created on first use and kept for the life of this object.
+
+        Returns:
+            An aiohttp ClientSession.
+        """
+        if self._session and not self._session.closed:
+            return self._session
+
+        if self._owned_session is None or self._owned_session.closed:
+            self._owned_session = ClientSession(
+                connector=self._connector_settings.build_connector(),
+                timeout=ClientTimeout(total=DEFAULT_TIMEOUT),
+                trace_configs=[
+                    build_connection_trace_config(self.connection_stats),
+                    build_timing_trace_config(),
+                ],
+            )
+
+        return self._owned_session
 
     async def async_check_api_key(self) -> GetKeysResponse:
         """Check the validity of the API key.
@@ -58,6 +214,12 @@ class API:
     ) -> PurpleAirBaseModelT:
         """Make an API request.
 
+        If request coalescing is enabled, identical GET requests (i.e., with the same
+        endpoint, query parameters, and response model) that are in flight at the same
+        time share one network call and one parsed result. If response caching is
+        enabled, cached GET responses are returned while they're fresh; a stale
+        response is returned while it's refreshed in the background.
+
         Args:
             method: An HTTP method.
             endpoint: A relative API endpoint.
@@ -66,26 +228,262 @@ class API:
 
         Returns:
             An API response payload in the form of a Pydantic model.
+        """
+        if (
+            (self._coalesce_requests or self.cache is not None)
+            and method.lower() == "get"
+            and set(kwargs) <= {"params"}
+        ):
+            key = (endpoint, get_params_key(kwargs.get("params", {})), response_model)
+
+            if self.cache is not None:
+                now = time.time()
+                if (entry := self.cache.get(key, now)) is not None:
+                    if now >= entry.fresh_until:
+                        self._schedule_revalidation(
+                            key, method, endpoint, response_model, **kwargs
+                        )
+                    return cast(PurpleAirBaseModelT, entry.value)
+
+            return cast(
+                PurpleAirBaseModelT,
+                await self._async_get(key, method, endpoint, response_model, **kwargs),
+            )
+
+        response, _ = await self._async_request(
+            method, endpoint, response_model, **kwargs
+        )
+        return cast(PurpleAirBaseModelT, response)
+
+    async def _async_get(
+        self,
+        key: Hashable,
+        method: str,
+        endpoint: str,
+        response_model: type[PurpleAirBaseModel],
+        **kwargs: dict[str, Any],
+    ) -> PurpleAirBaseModel:
+        """Make a GET request (coalescing it and caching its response, if enabled).
+
+        Args:
+            key: The key that identifies identical requests.
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            response_model: A Pydantic model to parse the response data with.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+            An API response payload in the form of a Pydantic model.
+        """
+
+        async def async_request_and_cache() -> PurpleAirBaseModel:
+            """Make the request and cache its response.
+
+            Returns:
+                An API response payload in the form of a Pydantic model.
+            """
+            response, size = await self._async_request(
+                method, endpoint, response_model, **kwargs
+            )
+            if self.cache is not None:
+                now = time.time()
+                data_timestamp_utc = getattr(response, "data_timestamp_utc", None)
+                self.cache.set(
+                    key,
+                    response,
+                    size,
+                    utc_to_timestamp(data_timestamp_utc) if data_timestamp_utc else now,
+                    now,
+                )
+            return response
+
+        if self._coalesce_requests:
+            return cast(
+                PurpleAirBaseModel,
+                await self._single_flight.async_call(key, async_request_and_cache),
+            )
+        return await async_request_and_cache()
+
+    def _schedule_revalidation(
+        self,
+        key: Hashable,
+        method: str,
+        endpoint: str,
+        response_model: type[PurpleAirBaseModel],
+        **kwargs: dict[str, Any],
+    ) -> None:
+        """Refresh a stale cached response in the background.
+
+        Args:
+            key: The key that identifies identical requests.
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            response_model: A Pydantic model to parse the response data with.
+            **kwargs: Additional kwargs to send with the request.
+        """
+        if key in self._revalidation_tasks:
+            return
+
+        async def async_revalidate() -> None:
+            """Refresh the response (keeping the stale one upon an error)."""
+            try:
+                await self._async_get(key, method, endpoint, response_model, **kwargs)
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.warning("Error while refreshing %s: %s", endpoint, err)
+
+        task = asyncio.create_task(async_revalidate())
+        self._revalidation_tasks[key] = task
+        task.add_done_callback(lambda _: self._revalidation_tasks.pop(key, None))
+
+    async def _async_request(
+        self,
+        method: str,
+        endpoint: str,
+        response_model: type[PurpleAirBaseModel],
+        **kwargs: dict[str, Any],
+    ) -> tuple[PurpleAirBaseModel, int]:
+        """Make an API request over the network.
+
+        Args:
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            response_model: A Pydantic model to parse the response data with.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+            An API response payload in the form of a Pydantic model, along with the
+                size of the response body (in bytes).
 
         Raises:
             RequestError: Raised when response data can't be validated.
         """
-        url: str = f"{API_URL_BASE}{endpoint}"
+        with self.instrumentation.measure(method, endpoint) as metrics:
+            body, data = await self._async_request_body(
+                method, endpoint, metrics, decode=True, **kwargs
+            )
 
-        kwargs.setdefault("headers", {})
-        if self._api_key:
-            kwargs["headers"]["X-API-Key"] = self._api_key
+            LOGGER.debug("Data received for %s: %s", endpoint, data)
+
+            start = time.perf_counter()
+            try:
+                response = response_model.model_validate(data)
+            except ValidationError as err:
+                raise RequestError(
+                    f"Error while parsing response from {endpoint}: {err}"
+                ) from err
+            metrics.validate = time.perf_counter() - start
+
+        return response, len(body)
+
+    async def async_request_bytes(
+        self, method: str, endpoint: str, **kwargs: dict[str, Any]
+    ) -> bytes:
+        """Make an API request and get its undecoded response body.
+
+        This allows a response to be forwarded or stored without decoding (and
+        re-encoding) it. Responses aren't cached or coalesced, and since the number of
+        sensors in the response isn't known, it's charged its estimated cost (if rate
+        limiting).
+
+        Args:
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+            The response body.
+        """
+        with self.instrumentation.measure(method, endpoint) as metrics:
+            body, _ = await self._async_request_body(
+                method, endpoint, metrics, decode=False, **kwargs
+            )
+        return body
+
+    async def _async_request_body(
+        self,
+        method: str,
+        endpoint: str,
+        metrics: RequestMetrics,
+        *,
+        decode: bool,
+        **kwargs: dict[str, Any],
+    ) -> tuple[bytes, Any]:
+        """Get the body of an API response (retrying the request, if enabled).
+
+        Args:
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            metrics: The RequestMetrics object to fill in.
+            decode: Whether to decode the response body.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+            The response body, along with its decoded data (or None if not decoded).
+        """
+        if self.retry_policy is None:
+            return await self._async_send_request(
+                method, endpoint, metrics, decode=decode, **kwargs
+            )
+
+        return await self.retry_policy.async_call(
+            method,
+            lambda: self._async_send_request(
+                method, endpoint, metrics, decode=decode, **kwargs
+            ),
+        )
+
+    async def _async_send_request(
+        self,
+        method: str,
+        endpoint: str,
+        metrics: RequestMetrics,
+        *,
+        decode: bool,
+        **kwargs: dict[str, Any],
+    ) -> tuple[bytes, Any]:
+        """Make a single attempt at an API request over the network.
+
+        Args:
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            metrics: The RequestMetrics object to fill in.
+            decode: Whether to decode the (successful) response body.
+            **kwargs: Additional kwargs to send with the request.
 
-        if use_running_session := self._session and not self._session.closed:
-            session = self._session
-        else:
-            session = ClientSession(timeout=ClientTimeout(total=DEFAULT_TIMEOUT))
+        Returns:
+            The response body, along with its decoded data (or None if not decoded).
 
-        data: dict[str, Any] = {}
+        Raises:
+            RequestError: Raised upon an HTTP error.
+        """
+        session = self._get_session()
+        params = kwargs.get("params", {})
+        points = await self._async_acquire_points(endpoint, params)
+        actual_points = 0
+        metrics.start_attempt()
 
         try:
-            async with session.request(method, url, **kwargs) as resp:
-                data = await resp.json()
+            async with session.request(
+                method,
+                self._get_url(endpoint),
+                trace_request_ctx=metrics,
+                **self._get_request_kwargs(kwargs),
+            ) as resp:
+                metrics.status = resp.status
+                await self._async_raise_if_unavailable(resp)
+
+                start = time.perf_counter()
+                body = await resp.read()
+                metrics.download = time.perf_counter() - start
+                metrics.response_bytes = len(body)
+
+                # Error responses are always decoded (to find out what went wrong):
+                data: Any = None
+                if decode or not resp.ok:
+                    start = time.perf_counter()
+                    data = self._decode_json(endpoint, body)
+                    metrics.decode = time.perf_counter() - start
+                    metrics.rows = get_row_count(data)
                 raising_err = None
 
                 try:
@@ -93,20 +491,161 @@ class API:
                 except ClientError as err:
                     raising_err = err
 
-                raise_error(resp, data, raising_err)
+                if raising_err is not None:
+                    raise_error(resp, data, raising_err)
+                    raise RequestError(
+                        f"Error while querying {resp.url}: {resp.status}"
+                    ) from raising_err
+                if data is not None:
+                    raise_error(resp, data, None)
+
+                # Undecoded responses are charged their estimated cost:
+                actual_points = (
+                    points if data is None else get_response_points(params, data)
+                )
         finally:
-            if not use_running_session:
-                await session.close()
+            if self.rate_limiter is not None and points:
+                self.rate_limiter.settle(points, actual_points)
 
-        LOGGER.debug("Data received for %s: %s", endpoint, data)
+        return body, data
 
+    def _decode_json(self, endpoint: str, body: bytes) -> Any:
+        """Decode a JSON response body.
+
+        Args:
+            endpoint: The API endpoint that was queried.
+            body: The response body.
+
+        Returns:
+            The decoded data.
+
+        Raises:
+            RequestError: Raised when the response body isn't valid JSON.
+        """
         try:
-            return cast(PurpleAirBaseModelT, response_model.model_validate(data))
-        except ValidationError as err:
+            return self._json_decoder(body)
+        except Exception as err:  # pylint: disable=broad-except
             raise RequestError(
                 f"Error while parsing response from {endpoint}: {err}"
             ) from err
 
+    @asynccontextmanager
+    async def async_request_stream(
+        self, method: str, endpoint: str, **kwargs: dict[str, Any]
+    ) -> AsyncIterator[ClientResponse]:
+        """Make an API request whose response body is read incrementally.
+
+        Unlike async_request, the response body isn't read up front; instead, the
+        (successful) response is yielded so that its content can be streamed.
+
+        Args:
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Yields:
+            An aiohttp ClientResponse.
+
+        Raises:
+            RequestError: Raised upon an HTTP error.
+        """
+        session = self._get_session()
+        # The actual cost of a streamed response isn't known until it has been read,
+        # so it's charged its estimated cost:
+        await self._async_acquire_points(endpoint, kwargs.get("params", {}))
+
+        with self.instrumentation.measure(method, endpoint) as metrics:
+            metrics.start_attempt()
+
+            async with session.request(
+                method,
+                self._get_url(endpoint),
+                trace_request_ctx=metrics,
+                **self._get_request_kwargs(kwargs),
+            ) as resp:
+                metrics.status = resp.status
+                await self._async_raise_if_unavailable(resp)
+
+                try:
+                    resp.raise_for_status()
+                except ClientError as err:
+                    raise_error(
+                        resp, self._decode_json(endpoint, await resp.read()), err
+                    )
+                    raise RequestError(
+                        f"Error while querying {resp.url}: {resp.status}"
+                    ) from err
+
+                try:
+                    yield resp
+                finally:
+                    metrics.response_bytes = resp.content.total_bytes
+
+    async def _async_acquire_points(self, endpoint: str, params: dict[str, Any]) -> int:
+        """Wait until the API points budget allows a request (if rate limiting).
+
+        Args:
+            endpoint: A relative API endpoint.
+            params: The query parameters of the request.
+
+        Returns:
+            The estimated cost of the request that was charged.
+        """
+        if self.rate_limiter is None:
+            return 0
+
+        if points := self.rate_limiter.estimate_points(endpoint, params):
+            await self.rate_limiter.async_acquire(points)
+        return points
+
+    async def _async_raise_if_unavailable(self, resp: ClientResponse) -> None:
+        """Raise if a response shows that the API is unhealthy (or overloaded).
+
+        Args:
+            resp: An aiohttp ClientResponse.
+
+        Raises:
+            ServiceUnavailableError: Raised upon a server error or rate limiting.
+        """
+        if resp.status < 500 and resp.status != 429:
+            return
+
+        # Unhealthy servers (or the proxies in front of them) don't always return JSON:
+        try:
+            description = self._json_decoder(await resp.read())["description"]
+        except Exception:  # pylint: disable=broad-except
+            description = resp.reason or resp.status
+
+        raise ServiceUnavailableError(
+            f"Error while querying {resp.url}: {description}",
+            retry_after=get_retry_after(resp.headers.get("Retry-After")),
+        )
+
+    def _get_request_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Get the kwargs for a request (including authentication headers).
+
+        Args:
+            kwargs: The kwargs provided by the caller.
+
+        Returns:
+            The kwargs to send with the request.
+        """
+        kwargs.setdefault("headers", {})
+        if self._api_key:
+            kwargs["headers"]["X-API-Key"] = self._api_key
+        return kwargs
+
+    def _get_url(self, endpoint: str) -> str:
+        """Get the full URL for a relative API endpoint.
+
+        Args:
+            endpoint: A relative API endpoint.
+
+        Returns:
+            A full URL.
+        """
+        return f"{self._base_url}{endpoint}"
+
     def get_map_url(self, sensor_index: int) -> str:
         """Get the map URL for a sensor index.
 
@@ -0,0 +1,221 @@
+"""Define a local catalog of sensor locations."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, cast
+
+from aiopurpleair.endpoints.sensors import NearbySensorResult, SensorsEndpoints
+from aiopurpleair.errors import PurpleAirError
+from aiopurpleair.models.sensors import SensorModel
+from aiopurpleair.util.spatial import DEFAULT_CELL_SIZE_DEGREES, GridIndex
+
+CATALOG_FIELDS = ["latitude", "longitude", "location_type"]
+
+
+class SensorCatalog:
+    """Define a local, spatially indexed catalog of sensor locations.
+
+    Sensor locations almost never change, so they can be loaded once and queried
+    locally (without any API requests); live readings are then requested only for
+    the sensors that match a query.
+    """
+
+    def __init__(
+        self,
+        sensors: SensorsEndpoints,
+        *,
+        cell_size_degrees: float = DEFAULT_CELL_SIZE_DEGREES,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            sensors: The sensors endpoints manager from an API object.
+            cell_size_degrees: The size of each cell in the spatial index.
+        """
+        self._cell_size_degrees = cell_size_degrees
+        self._index: GridIndex | None = None
+        self._sensors = sensors
+        self._catalog: list[SensorModel] = []
+
+        self.data_timestamp_utc: datetime | None = None
+
+    def __len__(self) -> int:
+        """Return the number of sensors in the catalog.
+
+        Returns:
+            The number of sensors.
+        """
+        return len(self._catalog)
+
+    @property
+    def _grid(self) -> GridIndex:
+        """Return the spatial index (which only exists once the catalog is loaded).
+
+        Returns:
+            A GridIndex.
+
+        Raises:
+            PurpleAirError: Raised when the catalog hasn't been loaded.
+        """
+        if self._index is None:
+            raise PurpleAirError("The sensor catalog hasn't been loaded")
+        return self._index
+
+    async def async_load(self, **kwargs: Any) -> None:
+        """Load (or reload) the location of every sensor.
+
+        Sensors without a location are left out of the catalog.
+
+        Args:
+            **kwargs: Any of the filters accepted by async_get_sensors.
+        """
+        response = await self._sensors.async_get_sensors(list(CATALOG_FIELDS), **kwargs)
+
+        self._catalog = [
+            sensor
+            for sensor in response.data.values()
+            if sensor.latitude is not None and sensor.longitude is not None
+        ]
+        self._index = GridIndex(
+            [cast(float, sensor.latitude) for sensor in self._catalog],
+            [cast(float, sensor.longitude) for sensor in self._catalog],
+            cell_size_degrees=self._cell_size_degrees,
+        )
+        self.data_timestamp_utc = response.data_timestamp_utc
+
+    def get_nearby_sensors(
+        self,
+        latitude: float,
+        longitude: float,
+        distance_km: float,
+        *,
+        limit_results: int | None = None,
+    ) -> list[NearbySensorResult]:
+        """Get the catalog's sensors within a distance of a coordinate pair.
+
+        Args:
+            latitude: The latitude of the "search center."
+            longitude: The longitude of the "search center."
+            distance_km: The radius of the "search center."
+            limit_results: The number of results to limit.
+
+        Returns:
+            A sorted list of NearbySensorResult objects (whose sensors only contain
+                their location).
+        """
+        return self._get_results(
+            self._grid.within(
+                latitude, longitude, distance_km, limit=limit_results or None
+            )
+        )
+
+    def get_nearest_sensors(
+        self, latitude: float, longitude: float, count: int
+    ) -> list[NearbySensorResult]:
+        """Get the catalog's sensors nearest to a coordinate pair.
+
+        Args:
+            latitude: The latitude of the "search center."
+            longitude: The longitude of the "search center."
+            count: The number of sensors to get.
+
+        Returns:
+            A sorted list of NearbySensorResult objects (whose sensors only contain
+                their location).
+        """
+        return self._get_results(self._grid.nearest(latitude, longitude, count))
+
+    async def async_get_nearby_sensors(  # pylint: disable=too-many-arguments
+        self,
+        fields: list[str],
+        latitude: float,
+        longitude: float,
+        distance_km: float,
+        *,
+        limit_results: int | None = None,
+    ) -> list[NearbySensorResult]:
+        """Get live data for the sensors within a distance of a coordinate pair.
+
+        Args:
+            fields: The sensor data fields to include.
+            latitude: The latitude of the "search center."
+            longitude: The longitude of the "search center."
+            distance_km: The radius of the "search center."
+            limit_results: The number of results to limit.
+
+        Returns:
+            A sorted list of NearbySensorResult objects.
+        """
+        return await self._async_get_live_results(
+            fields,
+            self.get_nearby_sensors(
+                latitude, longitude, distance_km, limit_results=limit_results
+            ),
+        )
+
+    async def async_get_nearest_sensors(
+        self, fields: list[str], latitude: float, longitude: float, count: int
+    ) -> list[NearbySensorResult]:
+        """Get live data for the sensors nearest to a coordinate pair.
+
+        Args:
+            fields: The sensor data fields to include.
+            latitude: The latitude of the "search center."
+            longitude: The longitude of the "search center."
+            count: The number of sensors to get.
+
+        Returns:
+            A sorted list of NearbySensorResult objects.
+        """
+        return await self._async_get_live_results(
+            fields, self.get_nearest_sensors(latitude, longitude, count)
+        )
+
+    async def _async_get_live_results(
+        self, fields: list[str], results: list[NearbySensorResult]
+    ) -> list[NearbySensorResult]:
+        """Replace the sensors in a list of results with their live data.
+
+        Sensors that are missing from the live data (e.g., because they have been
+        removed since the catalog was loaded) are dropped.
+
+        Args:
+            fields: The sensor data fields to include.
+            results: A sorted list of NearbySensorResult objects from the catalog.
+
+        Returns:
+            A sorted list of NearbySensorResult objects.
+        """
+        if not results:
+            return []
+
+        response = await self._sensors.async_get_sensors(
+            fields,
+            sensor_indices=[result.sensor.sensor_index for result in results],
+        )
+
+        return [
+            NearbySensorResult(
+                sensor=response.data[result.sensor.sensor_index],
+                distance=result.distance,
+            )
+            for result in results
+            if result.sensor.sensor_index in response.data
+        ]
+
+    def _get_results(
+        self, matches: list[tuple[int, float]]
+    ) -> list[NearbySensorResult]:
+        """Get results for a list of matches from the spatial index.
+
+        Args:
+            matches: The positions of (and distances to) matching sensors.
+
+        Returns:
+            A list of NearbySensorResult objects.
+        """
+        return [
+            NearbySensorResult(sensor=self._catalog[position], distance=distance)
+            for position, distance in matches
+        ]
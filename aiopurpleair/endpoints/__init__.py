@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, Iterable
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
+from aiohttp import ClientResponse
 from pydantic import ValidationError
 
 from aiopurpleair.errors import InvalidRequestError
@@ -15,14 +17,23 @@ class APIEndpointsBase:  # pylint: disable=too-few-public-methods
     """Define a base API endpoints manager."""
 
     def __init__(
-        self, async_request: Callable[..., Awaitable[PurpleAirBaseModelT]]
+        self,
+        async_request: Callable[..., Awaitable[PurpleAirBaseModelT]],
+        async_request_stream: Callable[
+            ..., AbstractAsyncContextManager[ClientResponse]
+        ],
+        async_request_bytes: Callable[..., Awaitable[bytes]],
     ) -> None:
         """Initialize.
 
         Args:
             async_request: The request method from the API object.
+            async_request_stream: The streaming request method from the API object.
+            async_request_bytes: The undecoded request method from the API object.
         """
         self._async_request = async_request
+        self._async_request_bytes = async_request_bytes
+        self._async_request_stream = async_request_stream
 
     async def _async_endpoint_request_with_models(
         self,
@@ -41,6 +52,27 @@ class APIEndpointsBase:  # pylint: disable=too-few-public-methods
 
         Returns:
             An API response payload in the form of a Pydantic model.
+        """
+        return await self._async_request(
+            "get",
+            endpoint,
+            response_model,
+            params=self._get_request_params(query_param_map, request_model),
+        )
+
+    @staticmethod
+    def _get_request_params(
+        query_param_map: Iterable[tuple[str, Any]],
+        request_model: type[PurpleAirBaseModel],
+    ) -> dict[str, Any]:
+        """Validate API query parameters and get them in their final form.
+
+        Args:
+            query_param_map: A tuple of API query parameters to include (if they exist).
+            request_model: The Pydantic model for the request.
+
+        Returns:
+            The query parameters to send.
 
         Raises:
             InvalidRequestError: Raised on invalid parameters.
@@ -56,9 +88,4 @@ class APIEndpointsBase:  # pylint: disable=too-few-public-methods
         except ValidationError as err:
             raise InvalidRequestError(err) from err
 
-        return await self._async_request(
-            "get",
-            endpoint,
-            response_model,
-            params=request.model_dump(exclude_none=True),
-        )
+        return request.model_dump(exclude_none=True)
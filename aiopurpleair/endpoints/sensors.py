@@ -2,19 +2,65 @@
 
 from __future__ import annotations
 
+import asyncio
+import math
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, TypeVar, cast
 
+from aiohttp import ClientResponse
+from pydantic import ValidationError
+
+from aiopurpleair.const import SENSOR_FIELDS
 from aiopurpleair.endpoints import APIEndpointsBase
+from aiopurpleair.errors import NotFoundError, RequestError
+from aiopurpleair.helpers.batcher import BatchSettings, RequestBatcher
+from aiopurpleair.helpers.model import PurpleAirBaseModelT
+from aiopurpleair.helpers.stream import (
+    DEFAULT_CHUNK_SIZE,
+    JSONStreamError,
+    async_iter_json_array_items,
+)
+from aiopurpleair.models.columnar import SENSOR_FIELD_TYPES, GetSensorsColumnarResponse
 from aiopurpleair.models.sensors import (
     GetSensorRequest,
     GetSensorResponse,
+    GetSensorsRawResponse,
     GetSensorsRequest,
     GetSensorsResponse,
+    GetSensorsResponseBase,
+    GetSensorsSlimResponse,
     LocationType,
     SensorModel,
+    get_sensor_row_decoder,
 )
-from aiopurpleair.util.geo import GeoLocation
+from aiopurpleair.util.geo import (
+    GeoLocation,
+    get_nearby_positions,
+    get_nearest_positions,
+    group_bounding_boxes,
+)
+
+GetSensorsResponseT = TypeVar("GetSensorsResponseT", bound=GetSensorsResponseBase)
+
+# The default minimum size (in kilometers) of the areas whose "search centers" share a
+# request in async_get_nearby_sensors_many:
+DEFAULT_NEARBY_GROUP_SIZE_KM = 100
+
+# The default radius (in kilometers) of the first round of async_get_k_nearest_sensors
+# and the radius beyond which it stops:
+DEFAULT_K_NEAREST_INITIAL_DISTANCE_KM = 5
+DEFAULT_K_NEAREST_MAXIMUM_DISTANCE_KM = 2000
+
+# How much async_get_k_nearest_sensors overshoots the radius at which the density of
+# sensors predicts there to be k of them (and the most that it grows by in a round):
+K_NEAREST_DENSITY_MARGIN = 1.25
+K_NEAREST_GROWTH_FACTOR = 4
+
+# A batched sensor request is keyed by its sensor index and requested fields:
+SensorBatchKey = tuple[int, tuple[str, ...]]
 
 
 @dataclass
@@ -28,6 +74,31 @@ class NearbySensorResult:
 class SensorsEndpoints(APIEndpointsBase):
     """Define the API manager object."""
 
+    def __init__(
+        self,
+        async_request: Callable[..., Awaitable[PurpleAirBaseModelT]],
+        async_request_stream: Callable[
+            ..., AbstractAsyncContextManager[ClientResponse]
+        ],
+        async_request_bytes: Callable[..., Awaitable[bytes]],
+        *,
+        batch_settings: BatchSettings | None = None,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            async_request: The request method from the API object.
+            async_request_stream: The streaming request method from the API object.
+            async_request_bytes: The undecoded request method from the API object.
+            batch_settings: If provided, concurrent async_get_sensor calls are merged
+                into batched GET /v1/sensors requests with these settings.
+        """
+        super().__init__(async_request, async_request_stream, async_request_bytes)
+
+        self.batcher: RequestBatcher[SensorBatchKey, GetSensorResponse] | None = None
+        if batch_settings is not None:
+            self.batcher = RequestBatcher(self._async_get_sensor_batch, batch_settings)
+
     async def async_get_sensor(
         self,
         sensor_index: int,
@@ -37,6 +108,9 @@ class SensorsEndpoints(APIEndpointsBase):
     ) -> GetSensorResponse:
         """Get all sensors.
 
+        If batching is enabled, calls that request specific fields (without a read
+        key) are merged into a single GET /v1/sensors request.
+
         Args:
             sensor_index: The sensor index to get data for.
             fields: The optional sensor data fields to include.
@@ -45,6 +119,12 @@ class SensorsEndpoints(APIEndpointsBase):
         Returns:
             An API response payload in the form of a Pydantic model.
         """
+        if self.batcher is not None and fields and read_key is None:
+            # Validate the request up front, so that errors are raised to the caller
+            # rather than failing the whole batch:
+            self._get_request_params((("fields", fields),), GetSensorRequest)
+            return await self.batcher.async_load((sensor_index, tuple(fields)))
+
         response: GetSensorResponse = await self._async_endpoint_request_with_models(
             f"/sensors/{sensor_index}",
             (
@@ -56,6 +136,68 @@ class SensorsEndpoints(APIEndpointsBase):
         )
         return response
 
+    async def _async_get_sensor_batch(
+        self, keys: list[SensorBatchKey]
+    ) -> dict[SensorBatchKey, GetSensorResponse | Exception]:
+        """Get a batch of sensors with a single GET /v1/sensors request.
+
+        Args:
+            keys: The sensor indices (and requested fields) to get.
+
+        Returns:
+            A response (or an error) for each key.
+        """
+        response = await self._async_get_sensors(
+            GetSensorsRawResponse,
+            list(dict.fromkeys(field for _, fields in keys for field in fields)),
+            # GET /v1/sensors leaves out sensors that haven't been seen for a week by
+            # default, while GET /v1/sensors/:sensor_index doesn't:
+            max_age=0,
+            sensor_indices=list(
+                dict.fromkeys(sensor_index for sensor_index, _ in keys)
+            ),
+        )
+
+        decoder = get_sensor_row_decoder(tuple(response.fields))
+        rows = {row[0]: row for row in response.data}
+        results: dict[SensorBatchKey, GetSensorResponse | Exception] = {}
+
+        for key in keys:
+            sensor_index, fields = key
+            if sensor_index not in rows:
+                results[key] = NotFoundError(
+                    f"Error while querying /sensors: sensor {sensor_index} not found"
+                )
+                continue
+
+            try:
+                sensor = decoder(rows[sensor_index])
+            except ValidationError as err:
+                results[key] = RequestError(
+                    f"Error while parsing response from /sensors: {err}"
+                )
+                continue
+
+            # Each caller only gets the fields it asked for:
+            attributes = ["sensor_index"] + [
+                SENSOR_FIELD_TYPES[field][0]
+                for field in fields
+                if field in SENSOR_FIELD_TYPES
+            ]
+            results[key] = GetSensorResponse.model_construct(
+                api_version=response.api_version,
+                sensor=SensorModel.model_construct(
+                    **{
+                        attribute: getattr(sensor, attribute)
+                        for attribute in attributes
+                    }
+                ),
+                data_timestamp_utc=response.data_timestamp_utc,
+                timestamp_utc=response.timestamp_utc,
+            )
+
+        return results
+
     async def async_get_sensors(  # pylint: disable=too-many-arguments
         self,
         fields: list[str],
@@ -87,25 +229,277 @@ class SensorsEndpoints(APIEndpointsBase):
         Returns:
             An API response payload in the form of a Pydantic model.
         """
-        response: GetSensorsResponse = await self._async_endpoint_request_with_models(
+        return await self._async_get_sensors(
+            GetSensorsResponse,
+            fields,
+            location_type=location_type,
+            max_age=max_age,
+            modified_since_utc=modified_since_utc,
+            nw_latitude=nw_latitude,
+            nw_longitude=nw_longitude,
+            read_keys=read_keys,
+            se_latitude=se_latitude,
+            se_longitude=se_longitude,
+            sensor_indices=sensor_indices,
+        )
+
+    async def async_get_sensors_columnar(
+        self, fields: list[str], **kwargs: Any
+    ) -> GetSensorsColumnarResponse:
+        """Get all sensors, storing their data in typed columns.
+
+        This is far more memory-efficient than async_get_sensors for large responses,
+        since SensorModel objects are only built on demand.
+
+        Args:
+            fields: The sensor data fields to include.
+            **kwargs: Any of the filters accepted by async_get_sensors.
+
+        Returns:
+            An API response payload in the form of a Pydantic model.
+        """
+        return await self._async_get_sensors(
+            GetSensorsColumnarResponse, fields, **kwargs
+        )
+
+    async def async_get_sensors_raw(
+        self, fields: list[str], **kwargs: Any
+    ) -> GetSensorsRawResponse:
+        """Get all sensors as the API's untouched rows.
+
+        No model is built for any sensor; the response holds the field names, the
+        position of each field in a row (column_index), the rows themselves, and the
+        validated response metadata.
+
+        Args:
+            fields: The sensor data fields to include.
+            **kwargs: Any of the filters accepted by async_get_sensors.
+
+        Returns:
+            An API response payload in the form of a Pydantic model.
+        """
+        return await self._async_get_sensors(GetSensorsRawResponse, fields, **kwargs)
+
+    async def async_get_sensors_slim(
+        self, fields: list[str], **kwargs: Any
+    ) -> GetSensorsSlimResponse:
+        """Get all sensors, as models that only hold the requested fields.
+
+        This uses a fraction of the memory of async_get_sensors (while keeping
+        attribute access to every requested field); see get_slim_sensor_model.
+
+        Args:
+            fields: The sensor data fields to include.
+            **kwargs: Any of the filters accepted by async_get_sensors.
+
+        Returns:
+            An API response payload in the form of a Pydantic model.
+        """
+        return await self._async_get_sensors(GetSensorsSlimResponse, fields, **kwargs)
+
+    async def async_get_sensors_bytes(self, fields: list[str], **kwargs: Any) -> bytes:
+        """Get all sensors as an undecoded JSON response body.
+
+        This is useful for forwarding or storing responses without the cost of decoding
+        (and re-encoding) them.
+
+        Args:
+            fields: The sensor data fields to include.
+            **kwargs: Any of the filters accepted by async_get_sensors.
+
+        Returns:
+            The JSON response body.
+        """
+        return await self._async_request_bytes(
+            "get",
             "/sensors",
-            (
-                ("fields", fields),
-                ("location_type", location_type),
-                ("max_age", max_age),
-                ("modified_since", modified_since_utc),
-                ("nwlat", nw_latitude),
-                ("nwlng", nw_longitude),
-                ("read_keys", read_keys),
-                ("selat", se_latitude),
-                ("selng", se_longitude),
-                ("show_only", sensor_indices),
+            params=self._get_request_params(
+                self._get_sensors_query_param_map(fields, **kwargs), GetSensorsRequest
             ),
+        )
+
+    async def async_iter_sensors(
+        self, fields: list[str], **kwargs: Any
+    ) -> AsyncIterator[SensorModel]:
+        """Get all sensors, yielding each one as soon as it has been received.
+
+        The response is parsed incrementally as it streams in, so memory usage stays
+        bounded no matter how many sensors the response contains.
+
+        Args:
+            fields: The sensor data fields to include.
+            **kwargs: Any of the filters accepted by async_get_sensors.
+
+        Yields:
+            SensorModel objects.
+
+        Raises:
+            RequestError: Raised when a sensor can't be validated.
+        """
+        async for response_fields, row in self._async_iter_sensor_data(
+            fields, **kwargs
+        ):
+            try:
+                yield get_sensor_row_decoder(response_fields)(row)
+            except ValidationError as err:
+                raise RequestError(
+                    f"Error while parsing response from /sensors: {err}"
+                ) from err
+
+    async def async_iter_sensor_rows(
+        self, fields: list[str], **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Get all sensors, yielding each one's raw data as soon as it's been received.
+
+        Args:
+            fields: The sensor data fields to include.
+            **kwargs: Any of the filters accepted by async_get_sensors.
+
+        Yields:
+            Dicts of raw (unvalidated) sensor data, keyed by field name.
+        """
+        async for response_fields, row in self._async_iter_sensor_data(
+            fields, **kwargs
+        ):
+            yield dict(zip(response_fields, row))  # noqa: B905
+
+    async def _async_iter_sensor_data(
+        self, fields: list[str], **kwargs: Any
+    ) -> AsyncIterator[tuple[tuple[str, ...], list[Any]]]:
+        """Stream the rows of sensor data from GET /v1/sensors.
+
+        Args:
+            fields: The sensor data fields to include.
+            **kwargs: Any of the filters accepted by async_get_sensors.
+
+        Yields:
+            Tuples of the response's field names and a row of sensor data.
+
+        Raises:
+            RequestError: Raised when the response can't be parsed.
+        """
+        params = self._get_request_params(
+            self._get_sensors_query_param_map(fields, **kwargs), GetSensorsRequest
+        )
+        metadata: dict[str, Any] = {}
+        # Rows are only held onto if the API sends them before the field names:
+        pending_rows: list[list[Any]] = []
+        response_fields: tuple[str, ...] | None = None
+
+        async with self._async_request_stream("get", "/sensors", params=params) as resp:
+            try:
+                async for row in async_iter_json_array_items(
+                    resp.content.iter_chunked(DEFAULT_CHUNK_SIZE), "data", metadata
+                ):
+                    if response_fields is None:
+                        if "fields" not in metadata:
+                            pending_rows.append(row)
+                            continue
+                        response_fields = self._get_response_fields(metadata)
+                    yield response_fields, row
+            except JSONStreamError as err:
+                raise RequestError(
+                    f"Error while parsing response from /sensors: {err}"
+                ) from err
+
+        if pending_rows:
+            response_fields = self._get_response_fields(metadata)
+            for row in pending_rows:
+                yield response_fields, row
+
+    @staticmethod
+    def _get_response_fields(metadata: dict[str, Any]) -> tuple[str, ...]:
+        """Get the validated field names from a streamed GET /v1/sensors response.
+
+        Args:
+            metadata: The response's values (other than its data).
+
+        Returns:
+            The field names of each row.
+
+        Raises:
+            RequestError: Raised when the field names are missing or unknown.
+        """
+        if "fields" not in metadata:
+            raise RequestError("Error while parsing response from /sensors: no fields")
+
+        for field in metadata["fields"]:
+            if field not in SENSOR_FIELDS:
+                raise RequestError(
+                    f"Error while parsing response from /sensors: {field} is an "
+                    "unknown field"
+                )
+
+        return tuple(metadata["fields"])
+
+    async def _async_get_sensors(
+        self,
+        response_model: type[GetSensorsResponseT],
+        fields: list[str],
+        **kwargs: Any,
+    ) -> GetSensorsResponseT:
+        """Get all sensors and parse them with a particular response model.
+
+        Args:
+            response_model: The Pydantic model to parse the response with.
+            fields: The sensor data fields to include.
+            **kwargs: Any of the filters accepted by async_get_sensors.
+
+        Returns:
+            An API response payload in the form of a Pydantic model.
+        """
+        response: GetSensorsResponseT = await self._async_endpoint_request_with_models(
+            "/sensors",
+            self._get_sensors_query_param_map(fields, **kwargs),
             GetSensorsRequest,
-            GetSensorsResponse,
+            response_model,
         )
         return response
 
+    @staticmethod
+    def _get_sensors_query_param_map(  # pylint: disable=too-many-arguments
+        fields: list[str],
+        *,
+        location_type: LocationType | None = None,
+        max_age: int | None = None,
+        modified_since_utc: datetime | None = None,
+        nw_latitude: float | None = None,
+        nw_longitude: float | None = None,
+        read_keys: list[str] | None = None,
+        se_latitude: float | None = None,
+        se_longitude: float | None = None,
+        sensor_indices: list[int] | None = None,
+    ) -> tuple[tuple[str, Any], ...]:
+        """Get the API query parameters for a GET /v1/sensors request.
+
+        Args:
+            fields: The sensor data fields to include.
+            location_type: An optional LocationType to filter by.
+            max_age: Filter results modified within these seconds.
+            modified_since_utc: Filter results modified since a datetime.
+            nw_latitude: The latitude of the NE corner of an optional bounding box.
+            nw_longitude: The longitude of the NE corner of an optional bounding box.
+            read_keys: Optional read keys for private sensors.
+            se_latitude: The latitude of the SE corner of an optional bounding box.
+            se_longitude: The longitude of the SE corner of an optional bounding box.
+            sensor_indices: Filter results by sensor index.
+
+        Returns:
+            A tuple of API query parameters.
+        """
+        return (
+            ("fields", fields),
+            ("location_type", location_type),
+            ("max_age", max_age),
+            ("modified_since_utc", modified_since_utc),
+            ("nwlat", nw_latitude),
+            ("nwlng", nw_longitude),
+            ("read_keys", read_keys),
+            ("selat", se_latitude),
+            ("selng", se_longitude),
+            ("show_only", sensor_indices),
+        )
+
     async def async_get_nearby_sensors(  # pylint: disable=too-many-arguments
         self,
         fields: list[str],
@@ -114,11 +508,13 @@ class SensorsEndpoints(APIEndpointsBase):
         distance_km: float,
         *,
         limit_results: int | None = None,
+        within_radius: bool = False,
     ) -> list[NearbySensorResult]:
         """Get sensors near a coordinate pair within a distance (in kilometers).
 
         The resulting list of sensors is ordered from nearest to furthest within the
-        bounding box defined by the distance.
+        bounding box defined by the distance. Near the antimeridian, the bounding box is
+        split into one box on each side of it (which are requested concurrently).
 
         Args:
             fields: The sensor data fields to include.
@@ -126,55 +522,301 @@ class SensorsEndpoints(APIEndpointsBase):
             longitude: The longitude of the "search center."
             distance_km: The radius of the "search center."
             limit_results: The number of results to limit.
+            within_radius: If True, only sensors within distance_km are returned
+                (rather than every sensor in the bounding box, whose corners are up to
+                √2 × distance_km away).
 
         Returns:
             A sorted list of NearbySensorResult objects (containing both the sensor and
                 the distance).
         """
         center = GeoLocation.from_degrees(latitude, longitude)
-        nw_coordinate_pair, se_coordinate_pair = center.bounding_box(distance_km)
 
         # Ensure that latitude and longitude are included in the fields no matter what:
         fields.extend(
             field for field in ("latitude", "longitude") if field not in fields
         )
 
+        # A box that crosses the antimeridian is split in two, so its parts are
+        # requested concurrently (and a sensor on the boundary is only kept once):
+        sensors_responses = await asyncio.gather(
+            *(
+                self.async_get_sensors(
+                    fields,
+                    nw_latitude=nw_coordinate_pair.latitude_degrees,
+                    nw_longitude=nw_coordinate_pair.longitude_degrees,
+                    se_latitude=se_coordinate_pair.latitude_degrees,
+                    se_longitude=se_coordinate_pair.longitude_degrees,
+                )
+                for nw_coordinate_pair, se_coordinate_pair in center.bounding_boxes(
+                    distance_km
+                )
+            )
+        )
+        sensors = {
+            sensor_index: sensor
+            for sensors_response in sensors_responses
+            for sensor_index, sensor in sensors_response.data.items()
+        }
+
+        return await self._async_get_sorted_results(
+            sensors.values(),
+            center,
+            limit_results=limit_results,
+            distance_km=distance_km if within_radius else None,
+        )
+
+    async def async_get_nearby_sensors_many(  # pylint: disable=too-many-arguments
+        self,
+        fields: list[str],
+        centers: Sequence[tuple[float, float]],
+        distance_km: float,
+        *,
+        group_size_km: float = DEFAULT_NEARBY_GROUP_SIZE_KM,
+        limit_results: int | None = None,
+        within_radius: bool = False,
+    ) -> list[list[NearbySensorResult]]:
+        """Get sensors near each of many coordinate pairs within a distance.
+
+        Rather than making a request per coordinate pair, the bounding boxes of nearby
+        coordinate pairs are grouped into shared bounding boxes (see
+        group_bounding_boxes), which are requested concurrently; sensors are then
+        assigned to each coordinate pair exactly like async_get_nearby_sensors would.
+
+        Args:
+            fields: The sensor data fields to include.
+            centers: The latitude/longitude pairs of the "search centers."
+            distance_km: The radius of each "search center."
+            group_size_km: The minimum size of the areas whose "search centers" share a
+                request (larger areas mean fewer, but larger, responses).
+            limit_results: The number of results to limit (for each "search center").
+            within_radius: If True, only sensors within distance_km are returned.
+
+        Returns:
+            For each "search center" (in order), a sorted list of NearbySensorResult
+            objects.
+        """
+        locations = [
+            GeoLocation.from_degrees(latitude, longitude)
+            for latitude, longitude in centers
+        ]
+        fields = fields + [
+            field for field in ("latitude", "longitude") if field not in fields
+        ]
+        groups = group_bounding_boxes(locations, distance_km, group_size_km)
+
+        sensors_responses = await asyncio.gather(
+            *(
+                self.async_get_sensors(
+                    fields,
+                    nw_latitude=group.nw_coordinate.latitude_degrees,
+                    nw_longitude=group.nw_coordinate.longitude_degrees,
+                    se_latitude=group.se_coordinate.latitude_degrees,
+                    se_longitude=group.se_coordinate.longitude_degrees,
+                )
+                for group in groups
+            )
+        )
+
+        # A "search center" whose bounding box is split at the antimeridian belongs to
+        # two groups, so its results are keyed by sensor index:
+        results: list[dict[int, NearbySensorResult]] = [{} for _ in locations]
+        for group, sensors_response in zip(groups, sensors_responses):  # noqa: B905
+            withgeo_results = [
+                sensor
+                for sensor in sensors_response.data.values()
+                if sensor.latitude is not None and sensor.longitude is not None
+            ]
+            members = list(group.members)
+            nearby_positions = get_nearby_positions(
+                [locations[member] for member in members],
+                [group.members[member] for member in members],
+                [cast(float, sensor.latitude) for sensor in withgeo_results],
+                [cast(float, sensor.longitude) for sensor in withgeo_results],
+                distance_km=distance_km if within_radius else None,
+                limit=limit_results or None,
+            )
+            for member, positions in zip(members, nearby_positions):  # noqa: B905
+                for position, distance in positions:
+                    sensor = withgeo_results[position]
+                    results[member].setdefault(
+                        sensor.sensor_index,
+                        NearbySensorResult(sensor=sensor, distance=distance),
+                    )
+
+        return [
+            sorted(result.values(), key=lambda nearby: nearby.distance)[
+                : limit_results or None
+            ]
+            for result in results
+        ]
+
+    async def async_get_k_nearest_sensors(  # pylint: disable=too-many-arguments
+        self,
+        fields: list[str],
+        latitude: float,
+        longitude: float,
+        k: int,
+        *,
+        initial_distance_km: float = DEFAULT_K_NEAREST_INITIAL_DISTANCE_KM,
+        maximum_distance_km: float = DEFAULT_K_NEAREST_MAXIMUM_DISTANCE_KM,
+    ) -> list[NearbySensorResult]:
+        """Get the k sensors nearest to a coordinate pair.
+
+        The search starts within initial_distance_km and grows until at least k sensors
+        are within the radius (which guarantees that the nearest k sensors have been
+        found): when some sensors have been found, the radius grows to where the
+        density of sensors predicts there to be k of them; otherwise, it grows
+        geometrically. Each round only requests the sensors' locations; the requested
+        fields are only requested for the nearest k sensors.
+
+        Args:
+            fields: The sensor data fields to include.
+            latitude: The latitude of the "search center."
+            longitude: The longitude of the "search center."
+            k: The number of sensors to get.
+            initial_distance_km: The radius of the first round of the search.
+            maximum_distance_km: The radius beyond which the search stops (in which
+                case fewer than k sensors may be returned).
+
+        Returns:
+            A sorted list of (up to k) NearbySensorResult objects.
+        """
+        if k <= 0:
+            return []
+
+        center = GeoLocation.from_degrees(latitude, longitude)
+        distance_km = min(initial_distance_km, maximum_distance_km)
+
+        while True:
+            sensor_indices, distances = await self._async_get_sensor_distances(
+                center, distance_km
+            )
+            if len(sensor_indices) >= k or distance_km >= maximum_distance_km:
+                break
+
+            if sensor_indices:
+                # The number of sensors grows with the area (i.e., the radius squared):
+                growth = min(
+                    K_NEAREST_DENSITY_MARGIN * math.sqrt(k / len(sensor_indices)),
+                    K_NEAREST_GROWTH_FACTOR,
+                )
+            else:
+                growth = K_NEAREST_GROWTH_FACTOR
+            distance_km = min(distance_km * growth, maximum_distance_km)
+
+        nearest = [
+            (sensor_indices[position], float(distances[position]))
+            for position in get_nearest_positions(distances, k)
+        ]
+        if not nearest:
+            return []
+
         sensors_response = await self.async_get_sensors(
-            fields,
-            nw_latitude=nw_coordinate_pair.latitude_degrees,
-            nw_longitude=nw_coordinate_pair.longitude_degrees,
-            se_latitude=se_coordinate_pair.latitude_degrees,
-            se_longitude=se_coordinate_pair.longitude_degrees,
+            fields
+            + [field for field in ("latitude", "longitude") if field not in fields],
+            sensor_indices=[sensor_index for sensor_index, _ in nearest],
         )
+        return [
+            NearbySensorResult(
+                sensor=sensors_response.data[sensor_index], distance=distance
+            )
+            for sensor_index, distance in nearest
+            # A sensor may have disappeared since the search:
+            if sensor_index in sensors_response.data
+        ]
 
-        sorted_results = await self._async_get_sorted_results(sensors_response, center)
-        if limit_results:
-            return sorted_results[:limit_results]
-        return sorted_results
+    async def _async_get_sensor_distances(
+        self, center: GeoLocation, distance_km: float
+    ) -> tuple[list[int], Sequence[float]]:
+        """Get the sensors within a distance of a point (only requesting locations).
+
+        Args:
+            center: The "search center."
+            distance_km: The radius of the "search center."
+
+        Returns:
+            The indices of the sensors within the radius and their distances.
+        """
+        sensors_responses = await asyncio.gather(
+            *(
+                self.async_get_sensors_raw(
+                    ["latitude", "longitude"],
+                    nw_latitude=nw_coordinate_pair.latitude_degrees,
+                    nw_longitude=nw_coordinate_pair.longitude_degrees,
+                    se_latitude=se_coordinate_pair.latitude_degrees,
+                    se_longitude=se_coordinate_pair.longitude_degrees,
+                )
+                for nw_coordinate_pair, se_coordinate_pair in center.bounding_boxes(
+                    distance_km
+                )
+            )
+        )
+
+        locations: dict[int, tuple[float, float]] = {}
+        for sensors_response in sensors_responses:
+            sensor_index_column, latitude_column, longitude_column = (
+                sensors_response.column_index[field]
+                for field in ("sensor_index", "latitude", "longitude")
+            )
+            for row in sensors_response.data:
+                if (
+                    row[latitude_column] is not None
+                    and row[longitude_column] is not None
+                ):
+                    locations[row[sensor_index_column]] = (
+                        row[latitude_column],
+                        row[longitude_column],
+                    )
+
+        sensor_indices = list(locations)
+        positions, distances = center.distances_within(
+            [latitude for latitude, _ in locations.values()],
+            [longitude for _, longitude in locations.values()],
+            distance_km,
+        )
+        return [sensor_indices[position] for position in positions], distances
 
     async def _async_get_sorted_results(
-        self, sensors_response: GetSensorsResponse, center: GeoLocation
+        self,
+        sensors: Iterable[SensorModel],
+        center: GeoLocation,
+        *,
+        limit_results: int | None = None,
+        distance_km: float | None = None,
     ) -> list[NearbySensorResult]:
-        """Sort the results by distance."""
+        """Sort the results by distance (keeping only the nearest ones if limited).
+
+        Args:
+            sensors: The sensors to sort.
+            center: The "search center."
+            limit_results: The number of results to limit.
+            distance_km: If provided, sensors further away than this are dropped
+                (before their exact distances are calculated).
+
+        Returns:
+            A sorted list of NearbySensorResult objects.
+        """
         withgeo_results = [
             sensor
-            for sensor in sensors_response.data.values()
+            for sensor in sensors
             if sensor.latitude is not None and sensor.longitude is not None
         ]
 
-        nearby_results = [
+        latitudes = [cast(float, sensor.latitude) for sensor in withgeo_results]
+        longitudes = [cast(float, sensor.longitude) for sensor in withgeo_results]
+
+        if distance_km is None:
+            distances = center.distances_to(latitudes, longitudes)
+        else:
+            positions, distances = center.distances_within(
+                latitudes, longitudes, distance_km
+            )
+            withgeo_results = [withgeo_results[position] for position in positions]
+
+        return [
             NearbySensorResult(
-                sensor=sensor,
-                distance=center.distance_to(
-                    GeoLocation.from_degrees(
-                        float(sensor.latitude) if sensor.latitude is not None else 0.0,
-                        float(sensor.longitude)
-                        if sensor.longitude is not None
-                        else 0.0,
-                    )
-                ),
+                sensor=withgeo_results[position], distance=float(distances[position])
             )
-            for sensor in withgeo_results
+            for position in get_nearest_positions(distances, limit_results or None)
         ]
-
-        return sorted(nearby_results, key=lambda result: result.distance)
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from aiohttp import ClientResponse
-from aiohttp.client_exceptions import ClientError
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+    from aiohttp.client_exceptions import ClientError
 
 
 class PurpleAirError(Exception):
@@ -38,6 +39,27 @@ class InvalidApiKeyError(RequestError):
     pass
 
 
+class CircuitOpenError(RequestError):
+    """Define a request that was rejected because the API is unhealthy."""
+
+    pass
+
+
+class ServiceUnavailableError(RequestError):
+    """Define an error from an unhealthy (or overloaded) API."""
+
+    def __init__(self, message: str, *, retry_after: float | None = None) -> None:
+        """Initialize.
+
+        Args:
+            message: The error message.
+            retry_after: The number of seconds the API asked to wait before retrying
+                (if any).
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 ERROR_CODE_MAP = {
     "ApiKeyMissingError": InvalidApiKeyError,
     "ApiKeyInvalidError": InvalidApiKeyError,
@@ -0,0 +1,124 @@
+"""Define a helper that merges concurrent requests into batches."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_WINDOW = 0.005
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ResultT = TypeVar("ResultT")
+
+
+@dataclass(frozen=True)
+class BatchSettings:
+    """Define the tunable settings of request batching."""
+
+    # How long (in seconds) to wait for more requests before sending a batch:
+    window: float = DEFAULT_WINDOW
+    # The maximum number of requests in a batch (a full batch is sent immediately):
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+
+
+@dataclass
+class BatchStats:
+    """Define counters for batched requests."""
+
+    batches: int = 0
+    requests: int = 0
+
+
+class RequestBatcher(Generic[KeyT, ResultT]):
+    """Define a batcher that loads many keys with a single call.
+
+    Every key requested within a short window (or until the batch is full) is
+    loaded with one call to the batch loader; each caller then receives the result
+    (or error) for its own key.
+    """
+
+    def __init__(
+        self,
+        async_load_batch: Callable[
+            [list[KeyT]], Awaitable[Mapping[KeyT, ResultT | Exception]]
+        ],
+        settings: BatchSettings,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            async_load_batch: A coroutine function that loads a list of unique keys
+                and returns a result or an exception for each one.
+            settings: The batch settings.
+        """
+        self._async_load_batch = async_load_batch
+        self._pending: list[tuple[KeyT, asyncio.Future[ResultT]]] = []
+        self._settings = settings
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._timer: asyncio.TimerHandle | None = None
+
+        self.stats = BatchStats()
+
+    async def async_load(self, key: KeyT) -> ResultT:
+        """Load a key as part of the next batch.
+
+        Args:
+            key: The key to load.
+
+        Returns:
+            The result for the key.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ResultT] = loop.create_future()
+        self._pending.append((key, future))
+
+        if len(self._pending) >= self._settings.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._settings.window, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        """Send every pending key as a batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._async_run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_run(
+        self, batch: list[tuple[KeyT, asyncio.Future[ResultT]]]
+    ) -> None:
+        """Load a batch and hand each caller its result.
+
+        Args:
+            batch: The pending keys (and the futures of their callers).
+        """
+        self.stats.batches += 1
+        self.stats.requests += len(batch)
+
+        try:
+            results = await self._async_load_batch(
+                list(dict.fromkeys(key for key, _ in batch))
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for key, future in batch:
+            if future.done():
+                # The caller was cancelled:
+                continue
+            if isinstance(result := results[key], Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
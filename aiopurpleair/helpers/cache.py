@@ -0,0 +1,147 @@
+"""Define an in-memory cache of API responses."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MINIMUM_TTL = 5.0
+DEFAULT_REFRESH_INTERVAL = 120.0
+DEFAULT_STALE_WHILE_REVALIDATE = 600.0
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    """Define the tunable settings of the response cache."""
+
+    # The maximum number of responses to keep:
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    # The maximum total size (in bytes, as received over the network) of responses:
+    max_bytes: int = DEFAULT_MAX_BYTES
+    # How often (in seconds) PurpleAir refreshes its data; a response is fresh until
+    # this long after its data timestamp:
+    refresh_interval: float = DEFAULT_REFRESH_INTERVAL
+    # The minimum time (in seconds) a response stays fresh after it's received (in
+    # case its data timestamp is already older than the refresh interval):
+    minimum_ttl: float = DEFAULT_MINIMUM_TTL
+    # How long (in seconds) after becoming stale a response may still be returned
+    # while it's refreshed in the background:
+    stale_while_revalidate: float = DEFAULT_STALE_WHILE_REVALIDATE
+
+
+@dataclass
+class CacheStats:
+    """Define counters for the response cache."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class CacheEntry:
+    """Define a cached response."""
+
+    value: Any
+    size: int
+    fresh_until: float
+    stale_until: float
+
+
+class ResponseCache:
+    """Define an LRU cache of responses, bounded by entry count and total size."""
+
+    def __init__(self, settings: CacheSettings) -> None:
+        """Initialize.
+
+        Args:
+            settings: The cache settings.
+        """
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._settings = settings
+
+        self.stats = CacheStats()
+
+    def get(self, key: Hashable, now: float) -> CacheEntry | None:
+        """Get a cached response that is fresh (or stale, but still usable).
+
+        Args:
+            key: The key of the response.
+            now: The current time (as a UTC timestamp).
+
+        Returns:
+            A CacheEntry (or None if there's no usable response).
+        """
+        if (entry := self._entries.get(key)) is None or now >= entry.stale_until:
+            if entry is not None:
+                self._remove(key)
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if now < entry.fresh_until:
+            self.stats.hits += 1
+        else:
+            self.stats.stale_hits += 1
+        return entry
+
+    def set(
+        self, key: Hashable, value: Any, size: int, data_timestamp: float, now: float
+    ) -> None:
+        """Cache a response (evicting the least recently used ones if needed).
+
+        Args:
+            key: The key of the response.
+            value: The response.
+            size: The size of the response (in bytes).
+            data_timestamp: The UTC timestamp of the response's data.
+            now: The current time (as a UTC timestamp).
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        if size > self._settings.max_bytes:
+            return
+
+        fresh_until = max(
+            data_timestamp + self._settings.refresh_interval,
+            now + self._settings.minimum_ttl,
+        )
+        self._entries[key] = CacheEntry(
+            value,
+            size,
+            fresh_until,
+            fresh_until + self._settings.stale_while_revalidate,
+        )
+        self.stats.entries += 1
+        self.stats.bytes += size
+
+        while (
+            self.stats.entries > self._settings.max_entries
+            or self.stats.bytes > self._settings.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self._entries.clear()
+        self.stats.entries = 0
+        self.stats.bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove a cached response.
+
+        Args:
+            key: The key of the response.
+        """
+        entry = self._entries.pop(key)
+        self.stats.entries -= 1
+        self.stats.bytes -= entry.size
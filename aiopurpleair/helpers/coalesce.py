@@ -0,0 +1,82 @@
+"""Define a helper that coalesces identical in-flight requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalescingStats:
+    """Define counters for coalesced requests."""
+
+    calls: int = 0
+    coalesced: int = 0
+
+
+def get_params_key(params: Mapping[str, Any]) -> tuple[tuple[str, str], ...]:
+    """Get a hashable, order-independent key for a set of query parameters.
+
+    Args:
+        params: The query parameters of a request.
+
+    Returns:
+        A sorted tuple of parameter names and (string) values.
+    """
+    return tuple(sorted((str(key), str(value)) for key, value in params.items()))
+
+
+class SingleFlight(Generic[T]):
+    """Define a group of calls in which only one call per key is in flight at once.
+
+    While a call for a key is in flight, every other call for the same key waits for
+    (and shares) its result instead of starting a call of its own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._in_flight: dict[Hashable, asyncio.Future[T]] = {}
+
+        self.stats = CoalescingStats()
+
+    async def async_call(
+        self, key: Hashable, async_call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Make a call (or join an identical one that is already in flight).
+
+        Args:
+            key: A key that identifies identical calls.
+            async_call: A coroutine function that makes the call.
+
+        Returns:
+            The result of the call.
+        """
+        self.stats.calls += 1
+
+        if (future := self._in_flight.get(key)) is not None:
+            self.stats.coalesced += 1
+        else:
+            future = asyncio.ensure_future(async_call())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._on_done(key, done))
+
+        # A caller that is cancelled mustn't cancel the call for everyone else:
+        return await asyncio.shield(future)
+
+    def _on_done(self, key: Hashable, future: asyncio.Future[T]) -> None:
+        """Forget a call once it has finished.
+
+        Args:
+            key: The key of the call.
+            future: The future of the call.
+        """
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+        # Mark any error as retrieved (in case every caller has been cancelled):
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,96 @@
+"""Define helpers for the connection pool owned by an API object."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from aiohttp import (
+    ClientSession,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+)
+
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_LIMIT = 100
+DEFAULT_TTL_DNS_CACHE = 300
+
+
+@dataclass(frozen=True)
+class ConnectorSettings:
+    """Define the tunable settings of the pooled connector."""
+
+    limit: int = DEFAULT_LIMIT
+    limit_per_host: int = 0
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+    ttl_dns_cache: int | None = DEFAULT_TTL_DNS_CACHE
+    use_dns_cache: bool = True
+    enable_cleanup_closed: bool = False
+
+    def build_connector(self) -> TCPConnector:
+        """Build an aiohttp TCPConnector from these settings.
+
+        Returns:
+            An aiohttp TCPConnector.
+        """
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.use_dns_cache,
+            enable_cleanup_closed=self.enable_cleanup_closed,
+        )
+
+
+@dataclass
+class ConnectionStats:
+    """Define counters for connections opened and reused by the pool."""
+
+    created: int = 0
+    reused: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Return the share of requests that reused a pooled connection.
+
+        Returns:
+            A ratio between 0.0 and 1.0.
+        """
+        if (total := self.created + self.reused) == 0:
+            return 0.0
+        return self.reused / total
+
+
+def build_connection_trace_config(stats: ConnectionStats) -> TraceConfig:
+    """Build an aiohttp TraceConfig that records connection usage into stats.
+
+    Args:
+        stats: The ConnectionStats object to update.
+
+    Returns:
+        An aiohttp TraceConfig.
+    """
+
+    async def on_connection_create_end(
+        _session: ClientSession,
+        _context: SimpleNamespace,
+        _params: TraceConnectionCreateEndParams,
+    ) -> None:
+        """Record a newly opened connection."""
+        stats.created += 1
+
+    async def on_connection_reuseconn(
+        _session: ClientSession,
+        _context: SimpleNamespace,
+        _params: TraceConnectionReuseconnParams,
+    ) -> None:
+        """Record a reused connection."""
+        stats.reused += 1
+
+    trace_config = TraceConfig()
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    return trace_config
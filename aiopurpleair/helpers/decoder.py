@@ -0,0 +1,370 @@
+"""Define precompiled row decoders for tabular API responses."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from enum import Enum
+from types import UnionType
+from typing import Any, Generic, Union, cast, get_args, get_origin
+
+from aiopurpleair.helpers.model import PurpleAirBaseModelT, get_field_types
+
+Converter = Callable[[Any], Any]
+
+
+class ConversionError(Exception):
+    """Define an error raised when a value can't be handled by the fast path."""
+
+    pass
+
+
+def convert_bool(value: Any) -> bool:
+    """Convert a raw boolean value (which the API may send as 0 or 1).
+
+    Args:
+        value: A raw API value.
+
+    Returns:
+        The value as a boolean.
+
+    Raises:
+        ConversionError: Raised when the value isn't a boolean, 0, or 1.
+    """
+    if type(value) is bool:  # pylint: disable=unidiomatic-typecheck
+        return value
+    if type(value) is int and value in (0, 1):  # pylint: disable=unidiomatic-typecheck
+        return bool(value)
+    raise ConversionError
+
+
+def convert_float(value: Any) -> float:
+    """Convert a raw float value.
+
+    Args:
+        value: A raw API value.
+
+    Returns:
+        The value as a float.
+
+    Raises:
+        ConversionError: Raised when the value isn't a float or an integer.
+    """
+    if type(value) is float:  # pylint: disable=unidiomatic-typecheck
+        return value
+    if type(value) is int:  # pylint: disable=unidiomatic-typecheck
+        return float(value)
+    raise ConversionError
+
+
+def convert_int(value: Any) -> int:
+    """Convert a raw integer value.
+
+    Args:
+        value: A raw API value.
+
+    Returns:
+        The value.
+
+    Raises:
+        ConversionError: Raised when the value isn't an integer.
+    """
+    if type(value) is int:  # pylint: disable=unidiomatic-typecheck
+        return value
+    raise ConversionError
+
+
+def convert_str(value: Any) -> str:
+    """Convert a raw string value.
+
+    Args:
+        value: A raw API value.
+
+    Returns:
+        The value.
+
+    Raises:
+        ConversionError: Raised when the value isn't a string.
+    """
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return value
+    raise ConversionError
+
+
+def unsupported(_value: Any) -> Any:
+    """Reject every value (forcing the generic validation path).
+
+    Args:
+        _value: A raw API value.
+
+    Raises:
+        ConversionError: Always raised.
+    """
+    raise ConversionError
+
+
+def make_enum_converter(enum: type[Enum]) -> Converter:
+    """Make a converter that looks up an integer-valued enum member.
+
+    Args:
+        enum: An Enum class.
+
+    Returns:
+        A converter.
+    """
+
+    def convert(value: Any) -> Enum:
+        """Convert a raw enum value.
+
+        Args:
+            value: A raw API value.
+
+        Returns:
+            The enum member.
+
+        Raises:
+            ConversionError: Raised when the value isn't a known member.
+        """
+        try:
+            return enum(convert_int(value))
+        except ValueError as err:
+            raise ConversionError from err
+
+    return convert
+
+
+def make_validated_converter(converter: Converter, validator: Converter) -> Converter:
+    """Make a converter that runs a validator on a converted value.
+
+    Args:
+        converter: The converter to run first.
+        validator: A validator that raises ValueError upon an invalid value.
+
+    Returns:
+        A converter.
+    """
+
+    def convert(value: Any) -> Any:
+        """Convert and validate a raw value.
+
+        Args:
+            value: A raw API value.
+
+        Returns:
+            The validated value.
+
+        Raises:
+            ConversionError: Raised when the value is invalid.
+        """
+        try:
+            return validator(converter(value))
+        except ValueError as err:
+            raise ConversionError from err
+
+    return convert
+
+
+TYPE_CONVERTERS: dict[Any, Converter] = {
+    bool: convert_bool,
+    float: convert_float,
+    int: convert_int,
+    str: convert_str,
+}
+
+
+def get_type_converter(field_type: Any) -> Converter:
+    """Get the fast-path converter for a field type.
+
+    Args:
+        field_type: A (non-optional) field type.
+
+    Returns:
+        A converter.
+    """
+    if field_type in TYPE_CONVERTERS:
+        return TYPE_CONVERTERS[field_type]
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return make_enum_converter(field_type)
+    return unsupported
+
+
+class RowDecoder(Generic[PurpleAirBaseModelT]):
+    """Define a decoder that turns rows with a fixed set of fields into models.
+
+    When a decoder is created, a function specialized for its exact set of fields is
+    compiled: each column position is mapped straight to a type check or converter,
+    and models are built without running the generic validation machinery. Any row
+    that the fast path can't fully handle is passed through the model's regular
+    validation instead, so results (and errors) are identical.
+    """
+
+    __slots__ = ("_decode", "_fields", "_model")
+
+    def __init__(
+        self,
+        model: type[PurpleAirBaseModelT],
+        fields: Sequence[str],
+        converters: Mapping[str, Converter],
+    ) -> None:
+        """Initialize.
+
+        Args:
+            model: The model to build from each row.
+            fields: The field names (or aliases) of each row.
+            converters: Converters for specific fields that override the converter
+                based on the field's type.
+        """
+        self._fields = tuple(fields)
+        self._model = model
+        self._decode = self._compile(converters)
+
+    def __call__(self, row: Sequence[Any]) -> PurpleAirBaseModelT:
+        """Decode a row into a model.
+
+        Args:
+            row: A row of raw API values.
+
+        Returns:
+            A model.
+        """
+        return cast(PurpleAirBaseModelT, self._decode(row))
+
+    def _compile(self, converters: Mapping[str, Converter]) -> Callable[..., Any]:
+        """Compile the decoding function for this decoder's fields.
+
+        Args:
+            converters: Converters for specific fields.
+
+        Returns:
+            A function that decodes a row into a model.
+        """
+        model_fields = self._model.model_fields
+        field_types = get_field_types(self._model)
+        names = [
+            field_types[field][0] for field in self._fields if field in field_types
+        ]
+
+        # The fast path can only be used if every required field is in each row, no
+        # field appears twice, and no defaults need to be built (or copied) per
+        # instance:
+        if len(set(names)) != len(names) or not all(
+            (
+                name in names
+                if info.is_required()
+                else info.default_factory is None and isinstance(info.default, Hashable)
+            )
+            for name, info in model_fields.items()
+        ):
+            return self._validate
+
+        # A null value can only be kept as-is if the field's type allows it and no
+        # before-validator would run on it (after-validators are expected to pass nulls
+        # through); otherwise, the row gets generic validation:
+        decorators = self._model.__pydantic_decorators__.field_validators
+        validated_fields = {
+            field
+            for decorator in decorators.values()
+            if decorator.info.mode != "after"
+            for field in decorator.info.fields
+        }
+        nullable = {
+            name
+            for name, info in model_fields.items()
+            if get_origin(info.annotation) in (Union, UnionType)
+            and type(None) in get_args(info.annotation)
+            and not validated_fields & {name, "*"}
+        }
+
+        namespace: dict[str, Any] = {
+            "ConversionError": ConversionError,
+            "build_model": build_model,
+            "fields_set": set(names),
+            "model": self._model,
+            "validate": self._validate,
+        }
+        checks: list[str] = []
+        values: dict[str, str] = {}
+
+        for position, field in enumerate(self._fields):
+            if field not in field_types:
+                # Unknown fields are ignored, just like the model itself would:
+                continue
+
+            name, field_type = field_types[field]
+            var = f"v{position}"
+            values[name] = var
+
+            if field in converters:
+                namespace[f"c{position}"] = converters[field]
+                checks.append(f"    if {var} is not None:")
+            else:
+                namespace[f"c{position}"] = get_type_converter(field_type)
+                namespace[f"t{position}"] = field_type
+                checks.append(f"    if type({var}) is t{position}:")
+                checks.append("        pass")
+                checks.append(f"    elif {var} is not None:")
+            checks.append(f"        {var} = c{position}({var})")
+            if name not in nullable:
+                checks.append("    else:")
+                checks.append("        return validate(row)")
+
+        # Required fields get a placeholder in the defaults (so that attributes keep
+        # the same order as in a validated model); they are always overwritten:
+        namespace["defaults"] = {
+            name: None if info.is_required() else info.get_default()
+            for name, info in model_fields.items()
+        }
+        assignments = [f"    values[{name!r}] = {var}" for name, var in values.items()]
+
+        unpack = "".join(f"v{position}, " for position in range(len(self._fields)))
+        source = "\n".join(
+            [
+                "def decode(row):",
+                f"    if len(row) != {len(self._fields)}:",
+                "        return validate(row)",
+                f"    ({unpack}) = row",
+                "    try:",
+                *(f"    {line}" for line in checks),
+                "    except ConversionError:",
+                "        return validate(row)",
+                "    values = defaults.copy()",
+                *assignments,
+                "    return build_model(model, values, fields_set.copy())",
+            ]
+        )
+        code = compile(source, f"<{self._model.__name__} decoder>", "exec")
+        exec(code, namespace)  # noqa: S102 # pylint: disable=exec-used
+        return cast(Callable[..., Any], namespace["decode"])
+
+    def _validate(self, row: Sequence[Any]) -> PurpleAirBaseModelT:
+        """Decode a row using the model's generic validation.
+
+        Args:
+            row: A row of raw API values.
+
+        Returns:
+            A model.
+        """
+        return self._model.model_validate(dict(zip(self._fields, row)))  # noqa: B905
+
+
+def build_model(
+    model: type[PurpleAirBaseModelT], values: dict[str, Any], fields_set: set[str]
+) -> PurpleAirBaseModelT:
+    """Build a model from already-validated values for every one of its fields.
+
+    This mirrors BaseModel.model_construct without its per-field bookkeeping.
+
+    Args:
+        model: The model to build.
+        values: A value for every field (keyed by attribute name).
+        fields_set: The names of the fields that were explicitly set.
+
+    Returns:
+        A model.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
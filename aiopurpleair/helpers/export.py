@@ -0,0 +1,159 @@
+"""Define exporters of raw sensor rows to Apache Arrow tables and pandas DataFrames."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from aiopurpleair.errors import PurpleAirError
+from aiopurpleair.helpers.lazy import lazy_import
+from aiopurpleair.helpers.model import get_field_types
+from aiopurpleair.models.sensors import SensorModel
+
+try:
+    pa = lazy_import("pyarrow")
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    pd = lazy_import("pandas")
+
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+SENSOR_FIELD_TYPES = get_field_types(SensorModel)
+
+
+def _get_field_kind(field: str) -> str:
+    """Get the kind of typed column a field is exported as.
+
+    Args:
+        field: A sensor field name.
+
+    Returns:
+        "bool", "float", "int" (enums are exported as their integer codes),
+        "timestamp", "str", or "object".
+    """
+    if field not in SENSOR_FIELD_TYPES:
+        return "object"
+
+    _, field_type = SENSOR_FIELD_TYPES[field]
+    if field_type is datetime:
+        return "timestamp"
+    if field_type in (bool, float, str):
+        return str(field_type.__name__)
+    if field_type is int or (
+        isinstance(field_type, type) and issubclass(field_type, Enum)
+    ):
+        return "int"
+    return "object"
+
+
+def _transpose(fields: Sequence[str], rows: Sequence[Sequence[Any]]) -> list[Any]:
+    """Transpose rows of sensor data into columns.
+
+    Args:
+        fields: The field names of each row.
+        rows: The rows of sensor data.
+
+    Returns:
+        The values of each field, in the order of the fields.
+    """
+    if not rows:
+        return [() for _ in fields]
+    return list(zip(*rows))  # noqa: B905
+
+
+def build_arrow_table(fields: Sequence[str], rows: Sequence[Sequence[Any]]) -> Any:
+    """Build an Apache Arrow table from rows of sensor data.
+
+    Every column is built in a single pass over its raw values; timestamps become
+    timezone-aware (UTC) timestamp columns and enums become their integer codes.
+
+    Args:
+        fields: The field names of each row.
+        rows: The rows of sensor data.
+
+    Returns:
+        A pyarrow.Table.
+
+    Raises:
+        PurpleAirError: Raised when pyarrow isn't installed.
+        ValueError: Raised when a column's values don't match its type.
+    """
+    if not PYARROW_AVAILABLE:
+        raise PurpleAirError("Exporting to Arrow requires pyarrow to be installed")
+
+    columns = {}
+    for field, values in zip(fields, _transpose(fields, rows)):  # noqa: B905
+        kind = _get_field_kind(field)
+        try:
+            if kind == "timestamp":
+                column = pa.array(values, type=pa.int64()).cast(
+                    pa.timestamp("s", tz="UTC")
+                )
+            elif kind == "bool":
+                # The API sends booleans as 0 or 1:
+                column = pa.array(values, type=pa.int8()).cast(pa.bool_())
+            elif kind == "float":
+                column = pa.array(values, type=pa.float64())
+            elif kind == "int":
+                column = pa.array(values, type=pa.int64())
+            elif kind == "str":
+                column = pa.array(values, type=pa.string())
+            else:
+                column = pa.array(values)
+        except (TypeError, ValueError) as err:
+            raise ValueError(f"{field} contains invalid values") from err
+        columns[field] = column
+
+    return pa.table(columns)
+
+
+def build_data_frame(fields: Sequence[str], rows: Sequence[Sequence[Any]]) -> Any:
+    """Build a pandas DataFrame (indexed by sensor index) from rows of sensor data.
+
+    Every column is built in a single pass over its raw values; timestamps become
+    timezone-aware (UTC) datetime columns, missing floats become NaN, integer and
+    boolean columns use pandas' nullable dtypes, and enums become their integer codes.
+
+    Args:
+        fields: The field names of each row (the first must be the sensor index).
+        rows: The rows of sensor data.
+
+    Returns:
+        A pandas.DataFrame.
+
+    Raises:
+        PurpleAirError: Raised when pandas isn't installed.
+        ValueError: Raised when a column's values don't match its type.
+    """
+    if not PANDAS_AVAILABLE:
+        raise PurpleAirError("Exporting to pandas requires pandas to be installed")
+
+    columns = {}
+    for field, values in zip(fields, _transpose(fields, rows)):  # noqa: B905
+        kind = _get_field_kind(field)
+        try:
+            if kind == "timestamp":
+                column = pd.to_datetime(
+                    pd.array(values, dtype="Int64"), unit="s", utc=True
+                )
+            elif kind == "bool":
+                column = pd.array(values, dtype="boolean")
+            elif kind == "float":
+                column = pd.array(values, dtype="float64")
+            elif kind == "int":
+                column = pd.array(values, dtype="Int64")
+            else:
+                column = pd.array(values, dtype=object)
+        except (TypeError, ValueError) as err:
+            raise ValueError(f"{field} contains invalid values") from err
+        columns[field] = column
+
+    return pd.DataFrame(columns).set_index(fields[0], drop=False)
@@ -0,0 +1,351 @@
+"""Define per-request timing instrumentation."""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import accumulate
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession, TraceConfig
+
+from aiopurpleair.const import LOGGER
+
+# Upper bounds of histogram buckets (a final bucket holds everything larger):
+BYTES_BUCKETS = tuple(float(256 * 4**exponent) for exponent in range(11))
+ROWS_BUCKETS = tuple(float(10**exponent) for exponent in range(7))
+SECONDS_BUCKETS = tuple(0.001 * 2**exponent for exponent in range(17))
+
+# The phases of a request (in the order they happen):
+PHASES = (
+    "connection_queue",
+    "dns",
+    "connect",
+    "ttfb",
+    "download",
+    "decode",
+    "validate",
+    "total",
+)
+
+
+@dataclass
+class RequestMetrics:  # pylint: disable=too-many-instance-attributes
+    """Define the timings (in seconds) and sizes of a single API request.
+
+    Phases that didn't happen (e.g., DNS resolution on a reused connection) or that
+    can't be observed (e.g., network phases on a session passed in by the caller) are
+    None. Retried requests report the phases of their last attempt.
+    """
+
+    method: str
+    endpoint: str
+    attempts: int = 0
+    status: int | None = None
+    error: str | None = None
+
+    # Waiting for a free connection in the pool:
+    connection_queue: float | None = None
+    # Resolving the API's hostname:
+    dns: float | None = None
+    # Opening a new connection (including the TLS handshake):
+    connect: float | None = None
+    # From sending the request to receiving the response headers:
+    ttfb: float | None = None
+    # Receiving the response body:
+    download: float | None = None
+    # Decoding the response body:
+    decode: float | None = None
+    # Validating the response data with Pydantic:
+    validate: float | None = None
+    total: float | None = None
+
+    response_bytes: int | None = None
+    rows: int | None = None
+
+    def start_attempt(self) -> None:
+        """Clear the phases of a previous attempt (if any) at the request."""
+        self.attempts += 1
+        self.status = None
+        for phase in PHASES[:-1]:
+            setattr(self, phase, None)
+
+
+@dataclass
+class HistogramSnapshot:
+    """Define a point-in-time summary of a histogram."""
+
+    count: int
+    total: float
+    minimum: float | None
+    maximum: float | None
+    p50: float | None
+    p90: float | None
+    p99: float | None
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the recorded values.
+
+        Returns:
+            The mean (or None if nothing has been recorded).
+        """
+        return self.total / self.count if self.count else None
+
+
+class Histogram:
+    """Define a histogram with fixed buckets."""
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """Initialize.
+
+        Args:
+            bounds: The (sorted) upper bounds of the buckets.
+        """
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._maximum: float | None = None
+        self._minimum: float | None = None
+        self._total = 0.0
+
+    def record(self, value: float) -> None:
+        """Record a value.
+
+        Args:
+            value: The value to record.
+        """
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._maximum = value if self._maximum is None else max(self._maximum, value)
+        self._minimum = value if self._minimum is None else min(self._minimum, value)
+        self._total += value
+
+    def get_percentile(self, percentile: float) -> float | None:
+        """Estimate a percentile (as the upper bound of the bucket that contains it).
+
+        Args:
+            percentile: The percentile (between 0 and 100).
+
+        Returns:
+            The estimated value (or None if nothing has been recorded).
+        """
+        if self._maximum is None or self._minimum is None:
+            return None
+
+        # The first bucket in which the number of values seen so far reaches the rank:
+        cumulative_counts = list(accumulate(self._counts))
+        bucket = bisect.bisect_left(
+            cumulative_counts, max(percentile / 100 * cumulative_counts[-1], 1)
+        )
+
+        if bucket == len(self._bounds):
+            return self._maximum
+        return min(max(self._bounds[bucket], self._minimum), self._maximum)
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Summarize the histogram.
+
+        Returns:
+            A HistogramSnapshot.
+        """
+        return HistogramSnapshot(
+            count=sum(self._counts),
+            total=self._total,
+            minimum=self._minimum,
+            maximum=self._maximum,
+            p50=self.get_percentile(50),
+            p90=self.get_percentile(90),
+            p99=self.get_percentile(99),
+        )
+
+
+@dataclass
+class InstrumentationStats:
+    """Define counters for instrumented requests."""
+
+    requests: int = 0
+    errors: int = 0
+
+
+def _build_histograms() -> dict[str, Histogram]:
+    """Build the (empty) histograms kept by an Instrumentation object.
+
+    Returns:
+        A Histogram for each phase, for response_bytes, and for rows.
+    """
+    return {
+        **{phase: Histogram(SECONDS_BUCKETS) for phase in PHASES},
+        "response_bytes": Histogram(BYTES_BUCKETS),
+        "rows": Histogram(ROWS_BUCKETS),
+    }
+
+
+class Instrumentation:
+    """Define a collector of request metrics.
+
+    Every request's metrics are sent to the registered listeners and recorded into
+    in-process histograms, which can be read back with snapshot.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._histograms = _build_histograms()
+        self._listeners: list[Callable[[RequestMetrics], None]] = []
+
+        self.stats = InstrumentationStats()
+
+    @contextmanager
+    def measure(self, method: str, endpoint: str) -> Iterator[RequestMetrics]:
+        """Measure a request, recording its metrics once it's done.
+
+        Args:
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+
+        Yields:
+            The RequestMetrics object to fill in.
+        """
+        metrics = RequestMetrics(method=method, endpoint=endpoint)
+        start = time.perf_counter()
+        try:
+            yield metrics
+        except BaseException as err:
+            metrics.error = type(err).__name__
+            raise
+        finally:
+            metrics.total = time.perf_counter() - start
+            self.record(metrics)
+
+    def add_listener(
+        self, listener: Callable[[RequestMetrics], None]
+    ) -> Callable[[], None]:
+        """Add a function that is called with the metrics of every request.
+
+        Args:
+            listener: The function to call.
+
+        Returns:
+            A function that removes the listener.
+        """
+        self._listeners.append(listener)
+
+        def remove() -> None:
+            """Remove the listener."""
+            self._listeners.remove(listener)
+
+        return remove
+
+    def record(self, metrics: RequestMetrics) -> None:
+        """Record the metrics of a request.
+
+        Args:
+            metrics: The metrics of the request.
+        """
+        self.stats.requests += 1
+        if metrics.error is not None:
+            self.stats.errors += 1
+
+        for name, histogram in self._histograms.items():
+            if (value := getattr(metrics, name)) is not None:
+                histogram.record(value)
+
+        for listener in list(self._listeners):
+            try:
+                listener(metrics)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Error in request metrics listener %s", listener)
+
+    def reset(self) -> None:
+        """Clear every histogram and counter."""
+        self._histograms = _build_histograms()
+        self.stats.requests = self.stats.errors = 0
+
+    def snapshot(self) -> dict[str, HistogramSnapshot]:
+        """Summarize the histograms.
+
+        Returns:
+            A HistogramSnapshot for each phase, for response_bytes, and for rows.
+        """
+        return {
+            name: histogram.snapshot() for name, histogram in self._histograms.items()
+        }
+
+
+def get_row_count(data: Any) -> int | None:
+    """Get the number of sensors in a decoded response.
+
+    Args:
+        data: The decoded response data.
+
+    Returns:
+        The number of sensors (or None if the response doesn't contain sensors).
+    """
+    if isinstance(data, dict):
+        if isinstance(rows := data.get("data"), list):
+            return len(rows)
+        if "sensor" in data:
+            return 1
+    return None
+
+
+def build_timing_trace_config() -> TraceConfig:
+    """Build an aiohttp TraceConfig that records network phases into RequestMetrics.
+
+    The RequestMetrics object of a request must be passed to it as trace_request_ctx.
+
+    Returns:
+        An aiohttp TraceConfig.
+    """
+
+    def on_phase_start(phase: str) -> Callable[..., Any]:
+        """Build a callback that marks the start of a phase.
+
+        Args:
+            phase: The name of the phase.
+
+        Returns:
+            A trace callback.
+        """
+
+        async def callback(
+            _session: ClientSession, context: SimpleNamespace, _params: Any
+        ) -> None:
+            """Mark the start of the phase."""
+            setattr(context, f"{phase}_start", time.perf_counter())
+
+        return callback
+
+    def on_phase_end(phase: str) -> Callable[..., Any]:
+        """Build a callback that records the duration of a phase.
+
+        Args:
+            phase: The name of the phase.
+
+        Returns:
+            A trace callback.
+        """
+
+        async def callback(
+            _session: ClientSession, context: SimpleNamespace, _params: Any
+        ) -> None:
+            """Record the duration of the phase."""
+            metrics = getattr(context, "trace_request_ctx", None)
+            start = getattr(context, f"{phase}_start", None)
+            if isinstance(metrics, RequestMetrics) and start is not None:
+                setattr(metrics, phase, time.perf_counter() - start)
+
+        return callback
+
+    trace_config = TraceConfig()
+    trace_config.on_connection_queued_start.append(on_phase_start("connection_queue"))
+    trace_config.on_connection_queued_end.append(on_phase_end("connection_queue"))
+    trace_config.on_dns_resolvehost_start.append(on_phase_start("dns"))
+    trace_config.on_dns_resolvehost_end.append(on_phase_end("dns"))
+    trace_config.on_connection_create_start.append(on_phase_start("connect"))
+    trace_config.on_connection_create_end.append(on_phase_end("connect"))
+    trace_config.on_request_headers_sent.append(on_phase_start("ttfb"))
+    trace_config.on_request_end.append(on_phase_end("ttfb"))
+    return trace_config
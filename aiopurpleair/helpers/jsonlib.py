@@ -0,0 +1,45 @@
+"""Define pluggable JSON decoders."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any, cast
+
+from aiopurpleair.errors import PurpleAirError
+
+JSONDecoder = Callable[[bytes], Any]
+
+# The module and function of each supported decoder, fastest first:
+JSON_DECODERS = {
+    "orjson": ("orjson", "loads"),
+    "msgspec": ("msgspec.json", "decode"),
+    "json": ("json", "loads"),
+}
+
+
+def get_json_decoder(name: str | None = None) -> JSONDecoder:
+    """Get a function that decodes JSON bytes.
+
+    Args:
+        name: The name of a decoder ("orjson", "msgspec", or "json"); if omitted, the
+            fastest installed decoder is used.
+
+    Returns:
+        A function that decodes JSON bytes.
+
+    Raises:
+        PurpleAirError: Raised when the decoder is unknown or isn't installed.
+    """
+    if name is not None and name not in JSON_DECODERS:
+        raise PurpleAirError(f"{name} is an unknown JSON decoder")
+
+    for candidate in [name] if name else JSON_DECODERS:
+        module_name, function_name = JSON_DECODERS[candidate]
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        return cast(JSONDecoder, getattr(module, function_name))
+
+    raise PurpleAirError(f"The {name} JSON decoder isn't installed")
@@ -0,0 +1,45 @@
+"""Define helpers to defer the cost of importing heavy modules."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Get a module that is only actually imported once one of its attributes is used.
+
+    Args:
+        name: The name of the module.
+
+    Returns:
+        The (possibly not yet loaded) module.
+
+    Raises:
+        ImportError: Raised when the module isn't installed.
+    """
+    if (module := sys.modules.get(name)) is not None:
+        return module
+
+    if (spec := importlib.util.find_spec(name)) is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+try:
+    # NumPy is only loaded once it's actually used, since importing it is slow:
+    np = lazy_import("numpy")
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    # An empty stand-in (check NUMPY_AVAILABLE before using it):
+    np = ModuleType("numpy")
+
+    NUMPY_AVAILABLE = False
@@ -1,6 +1,7 @@
 """Define model helpers."""
 
-from typing import TypeVar
+from types import UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
 
 from pydantic import BaseModel, ConfigDict
 
@@ -8,7 +9,30 @@ from pydantic import BaseModel, ConfigDict
 class PurpleAirBaseModel(BaseModel):
     """Define a PurpleAir-specific base model."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(defer_build=True, frozen=True)
 
 
 PurpleAirBaseModelT = TypeVar("PurpleAirBaseModelT", bound=PurpleAirBaseModel)
+
+
+def get_field_types(model: type[BaseModel]) -> dict[str, tuple[str, Any]]:
+    """Get the attribute name and (non-optional) type of every field in a model.
+
+    Args:
+        model: A Pydantic model class.
+
+    Returns:
+        A dictionary that maps each field's alias (or name) to a tuple of its
+        attribute name and type.
+    """
+    field_types = {}
+
+    for name, info in model.model_fields.items():
+        field_type = info.annotation
+        if get_origin(field_type) in (Union, UnionType):
+            field_type = next(
+                arg for arg in get_args(field_type) if arg is not type(None)
+            )
+        field_types[info.alias or name] = (name, field_type)
+
+    return field_types
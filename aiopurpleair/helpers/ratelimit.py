@@ -0,0 +1,280 @@
+"""Define a scheduler that keeps requests within an API points budget."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from itertools import count
+from typing import Any
+
+from aiopurpleair.const import SENSOR_FIELDS
+from aiopurpleair.errors import RequestError
+
+DEFAULT_CAPACITY = 10_000.0
+DEFAULT_EXPECTED_ROWS = 100
+DEFAULT_LOW_PRIORITY_RESERVE = 0.2
+DEFAULT_REFILL_RATE = 10.0
+
+
+class Priority(IntEnum):
+    """Define the priority of a request (lower values are served first)."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+REQUEST_PRIORITY: ContextVar[Priority] = ContextVar(
+    "REQUEST_PRIORITY", default=Priority.NORMAL
+)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Set the priority of the requests made within a context.
+
+    Args:
+        priority: The priority of the requests.
+
+    Yields:
+        Nothing.
+    """
+    token = REQUEST_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        REQUEST_PRIORITY.reset(token)
+
+
+@dataclass(frozen=True)
+class RateLimitSettings:
+    """Define the tunable settings of the API points budget."""
+
+    # The maximum number of points that can be spent at once:
+    capacity: float = DEFAULT_CAPACITY
+    # How many points are added back to the budget every second:
+    refill_rate: float = DEFAULT_REFILL_RATE
+    # The share of the budget that low-priority requests leave for everything else:
+    low_priority_reserve: float = DEFAULT_LOW_PRIORITY_RESERVE
+    # The number of sensors a request is expected to return when it can't be known
+    # up front (e.g., when filtering by a bounding box):
+    expected_rows: int = DEFAULT_EXPECTED_ROWS
+
+
+@dataclass
+class RateLimitStats:
+    """Define counters for the API points budget."""
+
+    requests: int = 0
+    deferred: int = 0
+    points_spent: float = 0.0
+
+
+def _get_field_count(params: Mapping[str, Any]) -> int:
+    """Get the number of fields requested by a set of query parameters.
+
+    Args:
+        params: The query parameters of a request.
+
+    Returns:
+        The number of fields (0 when the request doesn't specify any).
+    """
+    if not (fields := params.get("fields")):
+        return 0
+    return len(str(fields).split(","))
+
+
+def get_response_points(params: Mapping[str, Any], data: Mapping[str, Any]) -> int:
+    """Get the number of points a response actually cost.
+
+    Args:
+        params: The query parameters of the request.
+        data: The (JSON) response data.
+
+    Returns:
+        The number of points.
+    """
+    if isinstance(data.get("data"), list):
+        rows = data["data"]
+        response_fields = data.get("fields", [])
+    elif isinstance(data.get("sensor"), Mapping):
+        rows = [data["sensor"]]
+        response_fields = data["sensor"]
+    else:
+        return 0
+
+    # Without a list of fields, the API returns (and charges for) every field:
+    return (_get_field_count(params) or len(response_fields)) * len(rows)
+
+
+class RateLimiter:
+    """Define a token bucket of API points, shared by every request of an API key.
+
+    PurpleAir charges points for every field of every sensor that a request returns.
+    Each request is charged an estimate of its cost before it's sent (waiting until
+    the budget allows it, with higher-priority requests served first) and settled
+    against its actual cost once its response arrives.
+    """
+
+    def __init__(self, settings: RateLimitSettings) -> None:
+        """Initialize.
+
+        Args:
+            settings: The rate limit settings.
+        """
+        self._order = count()
+        self._points = settings.capacity
+        self._settings = settings
+        self._timer: asyncio.TimerHandle | None = None
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[Priority, int, float, asyncio.Future[None]]] = []
+
+        self.stats = RateLimitStats()
+
+    @property
+    def available_points(self) -> float:
+        """Return the number of points currently available.
+
+        Returns:
+            The number of points (negative when more has been spent than estimated).
+        """
+        self._refill()
+        return self._points
+
+    def estimate_points(self, endpoint: str, params: Mapping[str, Any]) -> int:
+        """Estimate the number of points a request will cost.
+
+        Args:
+            endpoint: A relative API endpoint.
+            params: The query parameters of the request.
+
+        Returns:
+            The number of points (0 for requests that don't return sensor data).
+        """
+        if not endpoint.startswith("/sensors"):
+            return 0
+
+        if endpoint.startswith("/sensors/"):
+            rows = 1
+        elif sensor_indices := params.get("show_only"):
+            rows = len(str(sensor_indices).split(","))
+        else:
+            rows = self._settings.expected_rows
+        # Without a list of fields, the API returns (and charges for) every field:
+        return (_get_field_count(params) or len(SENSOR_FIELDS)) * rows
+
+    async def async_acquire(self, points: float) -> None:
+        """Wait until the budget allows a request and charge its estimated cost.
+
+        The priority of the request comes from the request_priority context.
+
+        Args:
+            points: The estimated cost of the request.
+        """
+        self.stats.requests += 1
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters, (REQUEST_PRIORITY.get(), next(self._order), points, future)
+        )
+        self._release()
+
+        if not future.done():
+            self.stats.deferred += 1
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    # A cancelled request gives up its place (and lets others through):
+                    self._release()
+                else:
+                    # The request was let through just as it was cancelled:
+                    self.settle(points, 0)
+                raise
+
+    def close(self) -> None:
+        """Stop the refill timer and fail the requests that are waiting for points."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        waiters, self._waiters = self._waiters, []
+        for _, _, _, future in waiters:
+            if not future.done():
+                future.set_exception(RequestError("The rate limiter was closed"))
+
+    def settle(self, estimated_points: float, actual_points: float) -> None:
+        """Correct the budget once the actual cost of a request is known.
+
+        Args:
+            estimated_points: The estimated cost that was charged.
+            actual_points: The actual cost.
+        """
+        self._refill()
+        self._points = min(
+            self._points + estimated_points - actual_points, self._settings.capacity
+        )
+        self.stats.points_spent += actual_points - estimated_points
+        self._release()
+
+    def _get_required_points(self, priority: Priority, points: float) -> float:
+        """Get the number of points that must be available to send a request.
+
+        Args:
+            priority: The priority of the request.
+            points: The estimated cost of the request.
+
+        Returns:
+            The number of points.
+        """
+        reserve = (
+            self._settings.capacity * self._settings.low_priority_reserve
+            if priority is Priority.LOW
+            else 0.0
+        )
+        # A request that costs more than the whole budget waits for a full bucket:
+        return min(points + reserve, self._settings.capacity)
+
+    def _refill(self) -> None:
+        """Add the points that have been earned since the last refill."""
+        now = time.monotonic()
+        self._points = min(
+            self._points + (now - self._updated) * self._settings.refill_rate,
+            self._settings.capacity,
+        )
+        self._updated = now
+
+    def _release(self) -> None:
+        """Let waiting requests through (in priority order) while the budget allows."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._refill()
+
+        while self._waiters:
+            priority, _, points, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._points < self._get_required_points(priority, points):
+                break
+            heapq.heappop(self._waiters)
+            self._points -= points
+            self.stats.points_spent += points
+            future.set_result(None)
+
+        # Without a refill rate, waiting requests are only let through by a settlement:
+        if self._waiters and self._settings.refill_rate > 0:
+            priority, _, points, _ = self._waiters[0]
+            self._timer = asyncio.get_running_loop().call_later(
+                (self._get_required_points(priority, points) - self._points)
+                / self._settings.refill_rate,
+                self._release,
+            )
@@ -0,0 +1,229 @@
+"""Define a policy that retries failed requests and stops hammering an unhealthy API."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import TypeVar
+
+from aiohttp.client_exceptions import ClientConnectionError
+
+from aiopurpleair.errors import CircuitOpenError, ServiceUnavailableError
+
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_MAX_DELAY = 30.0
+DEFAULT_RESET_TIMEOUT = 30.0
+
+IDEMPOTENT_METHODS = {"get", "head", "options"}
+
+T = TypeVar("T")
+
+
+class CircuitState(Enum):
+    """Define the state of a circuit breaker."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+@dataclass(frozen=True)
+class RetrySettings:
+    """Define the tunable settings of the retry policy."""
+
+    # The maximum number of attempts at an idempotent request:
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    # The delay (in seconds) before the first retry; each retry doubles the delay, and
+    # a random ("jittered") part of it is used so that clients don't retry in lockstep:
+    base_delay: float = DEFAULT_BASE_DELAY
+    # The maximum delay (in seconds) before a retry (if the API asks to wait longer,
+    # the request isn't retried):
+    max_delay: float = DEFAULT_MAX_DELAY
+    # The number of consecutive failures that opens the circuit breaker:
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD
+    # How long (in seconds) the circuit breaker stays open before a trial request:
+    reset_timeout: float = DEFAULT_RESET_TIMEOUT
+
+
+@dataclass
+class RetryStats:
+    """Define counters for the retry policy."""
+
+    attempts: int = 0
+    retries: int = 0
+    circuit_opened: int = 0
+    circuit_rejected: int = 0
+
+
+def get_retry_after(value: str | None) -> float | None:
+    """Parse the value of a Retry-After header.
+
+    Args:
+        value: The header value (either a number of seconds or an HTTP date).
+
+    Returns:
+        The number of seconds to wait (or None if the value is missing or invalid).
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """Define a policy that retries failed requests behind a circuit breaker.
+
+    Idempotent requests that fail because the API is unhealthy (i.e., server errors,
+    rate limiting, timeouts, and connection errors) are retried with exponential
+    backoff and jitter (or after the delay in a Retry-After header). Once enough
+    requests in a row have failed, the circuit breaker opens and every request fails
+    fast until a single trial request succeeds.
+
+    Subclasses can override is_retryable and get_delay to customize the policy.
+    """
+
+    def __init__(self, settings: RetrySettings | None = None) -> None:
+        """Initialize.
+
+        Args:
+            settings: The retry settings.
+        """
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._settings = settings or RetrySettings()
+
+        self.stats = RetryStats()
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """Return the state of the circuit breaker.
+
+        Returns:
+            A CircuitState.
+        """
+        if self._failures < self._settings.failure_threshold:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at < self._settings.reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def is_retryable(self, err: Exception) -> bool:
+        """Determine whether an error means that the API is unhealthy.
+
+        Args:
+            err: An error raised by a request.
+
+        Returns:
+            Whether the request can be retried.
+        """
+        return isinstance(
+            err, (ServiceUnavailableError, ClientConnectionError, asyncio.TimeoutError)
+        )
+
+    def get_delay(self, attempt: int, err: Exception) -> float | None:
+        """Get how long to wait before retrying a request.
+
+        Args:
+            attempt: The number of attempts made so far.
+            err: The error raised by the last attempt.
+
+        Returns:
+            The delay (in seconds), or None if the request shouldn't be retried.
+        """
+        if isinstance(err, ServiceUnavailableError) and err.retry_after is not None:
+            if err.retry_after > self._settings.max_delay:
+                return None
+            return err.retry_after
+
+        return random.uniform(
+            0,
+            min(
+                self._settings.base_delay * 2 ** (attempt - 1), self._settings.max_delay
+            ),
+        )
+
+    async def async_call(
+        self, method: str, async_call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Make a request, retrying it if it's idempotent and the policy allows.
+
+        Args:
+            method: The HTTP method of the request.
+            async_call: A coroutine function that makes one attempt at the request.
+
+        Returns:
+            The result of the request.
+
+        Raises:
+            CircuitOpenError: Raised when the circuit breaker is open.
+        """
+        attempt = 0
+
+        while True:
+            if (state := self.circuit_state) is CircuitState.OPEN or (
+                state is CircuitState.HALF_OPEN and self._probing
+            ):
+                self.stats.circuit_rejected += 1
+                raise CircuitOpenError(
+                    "The API is unhealthy; not sending requests for now"
+                )
+
+            # While half-open, only a single trial request is sent:
+            probing = self._probing = state is CircuitState.HALF_OPEN
+            attempt += 1
+            self.stats.attempts += 1
+
+            try:
+                result = await async_call()
+            except Exception as err:  # pylint: disable=broad-except
+                if not self.is_retryable(err):
+                    # The API is healthy enough to reject the request:
+                    self._failures = 0
+                    raise
+
+                self._record_failure()
+                if (
+                    method.lower() not in IDEMPOTENT_METHODS
+                    or attempt >= self._settings.max_attempts
+                    or self.circuit_state is not CircuitState.CLOSED
+                    or (delay := self.get_delay(attempt, err)) is None
+                ):
+                    raise
+            else:
+                self._failures = 0
+                return result
+            finally:
+                if probing:
+                    self._probing = False
+
+            self.stats.retries += 1
+            await asyncio.sleep(delay)
+
+    def _record_failure(self) -> None:
+        """Record a failed request (opening the circuit breaker if needed)."""
+        self._failures += 1
+        if self._failures >= self._settings.failure_threshold:
+            if self._failures == self._settings.failure_threshold or self._probing:
+                self.stats.circuit_opened += 1
+            self._opened_at = time.monotonic()
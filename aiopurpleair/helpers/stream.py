@@ -0,0 +1,221 @@
+"""Define an incremental parser for large JSON responses."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+JSON_DECODER = json.JSONDecoder()
+
+WHITESPACE = " \t\n\r"
+
+# The characters that a number can continue with in the next chunk:
+NUMBER_CHARS = "+-.0123456789Ee"
+
+# The literals that a truncated value can be the start of:
+LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+# The start of a \uXXXX escape (possibly part of a surrogate pair):
+UNICODE_ESCAPE_PREFIX = re.compile(r"u[0-9a-fA-F]{0,4}(\\(u[0-9a-fA-F]{0,4})?)?")
+
+
+class JSONStreamError(ValueError):
+    """Define an error raised when a JSON stream can't be parsed."""
+
+    pass
+
+
+def is_truncated(err: json.JSONDecodeError) -> bool:
+    """Determine whether a decoding error could be fixed by more data.
+
+    Args:
+        err: An error raised while decoding the buffer.
+
+    Returns:
+        Whether the error is caused by the buffer ending in the middle of a value.
+    """
+    rest = err.doc[err.pos :]
+    return (
+        not rest
+        or err.msg.startswith("Unterminated string")
+        or not rest.strip(NUMBER_CHARS)
+        or any(literal.startswith(rest) for literal in LITERALS)
+        or UNICODE_ESCAPE_PREFIX.fullmatch(rest) is not None
+    )
+
+
+class JSONStream:
+    """Define a buffer that parses JSON values from a stream of byte chunks.
+
+    Only the unconsumed tail of the stream is kept in memory: chunks are decoded as
+    they arrive and the buffer is trimmed every time it is refilled, so memory usage
+    is bounded by the chunk size plus (twice) the size of the largest single value
+    that is parsed. Malformed data is reported as soon as it is encountered, rather
+    than once the rest of the stream has been read.
+    """
+
+    __slots__ = ("_buffer", "_chunks", "_decoder", "_eof", "_pos")
+
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        """Initialize.
+
+        Args:
+            chunks: An async iterable of raw byte chunks.
+        """
+        self._buffer = ""
+        self._chunks = chunks.__aiter__()
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._eof = False
+        self._pos = 0
+
+    async def _async_fill(self) -> bool:
+        """Read the next chunk from the stream into the buffer.
+
+        Returns:
+            Whether any more data could be read.
+        """
+        if self._eof:
+            return False
+
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._eof = True
+            text = self._decoder.decode(b"", final=True)
+        else:
+            text = self._decoder.decode(chunk)
+
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return True
+
+    async def _async_fill_more(self) -> bool:
+        """Read (at least) as much data again as is currently unconsumed.
+
+        Growing the buffer geometrically means that a value spanning many chunks is
+        only decoded a logarithmic number of times (rather than once per chunk).
+
+        Returns:
+            Whether any more data could be read.
+        """
+        size = len(self._buffer) - self._pos
+        if not await self._async_fill():
+            return False
+        while len(self._buffer) - self._pos < 2 * size and await self._async_fill():
+            pass
+        return True
+
+    async def async_peek(self) -> str:
+        """Get the next non-whitespace character (without consuming it).
+
+        Returns:
+            A single character.
+
+        Raises:
+            JSONStreamError: Raised when the stream ends unexpectedly.
+        """
+        while True:
+            while self._pos < len(self._buffer):
+                if (char := self._buffer[self._pos]) not in WHITESPACE:
+                    return char
+                self._pos += 1
+            if not await self._async_fill():
+                raise JSONStreamError("Unexpected end of JSON stream")
+
+    async def async_expect(self, *chars: str) -> str:
+        """Consume the next non-whitespace character (which must be expected).
+
+        Args:
+            *chars: The characters that are allowed.
+
+        Returns:
+            The consumed character.
+
+        Raises:
+            JSONStreamError: Raised when an unexpected character is found.
+        """
+        if (char := await self.async_peek()) not in chars:
+            raise JSONStreamError(
+                f"Expected one of {', '.join(chars)} but found {char!r}"
+            )
+        self._pos += 1
+        return char
+
+    async def async_value(self) -> Any:
+        """Consume the next complete JSON value.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            JSONStreamError: Raised when the value can't be decoded.
+        """
+        await self.async_peek()
+
+        while True:
+            try:
+                value, end = JSON_DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as err:
+                if not is_truncated(err) or not await self._async_fill_more():
+                    raise JSONStreamError(str(err)) from err
+                continue
+
+            # A value that ends at (or just before) the end of the buffer might be a
+            # number that continues in the next chunk:
+            if not self._buffer[end:].strip(NUMBER_CHARS) and await self._async_fill():
+                continue
+
+            self._pos = end
+            return value
+
+
+async def async_iter_json_array_items(
+    chunks: AsyncIterable[bytes], key: str, metadata: dict[str, Any]
+) -> AsyncIterator[Any]:
+    """Iterate over the items of an array within a streamed JSON object.
+
+    Every other value in the object is decoded whole and stored in the provided
+    metadata dict as soon as it is encountered.
+
+    Args:
+        chunks: An async iterable of raw byte chunks.
+        key: The key of the array to iterate over.
+        metadata: A dict to store the object's other values in.
+
+    Yields:
+        Each item of the array, in order.
+
+    Raises:
+        JSONStreamError: Raised when the stream can't be parsed.
+    """
+    stream = JSONStream(chunks)
+
+    await stream.async_expect("{")
+    if await stream.async_peek() == "}":
+        return
+
+    while True:
+        name = await stream.async_value()
+        if not isinstance(name, str):
+            raise JSONStreamError(f"Expected an object key but found {name!r}")
+        await stream.async_expect(":")
+
+        if name != key:
+            metadata[name] = await stream.async_value()
+        else:
+            await stream.async_expect("[")
+            if await stream.async_peek() == "]":
+                await stream.async_expect("]")
+            else:
+                while True:
+                    yield await stream.async_value()
+                    if await stream.async_expect(",", "]") == "]":
+                        break
+
+        if await stream.async_expect(",", "}") == "}":
+            return
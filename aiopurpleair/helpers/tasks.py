@@ -0,0 +1,42 @@
+"""Define helpers to run groups of tasks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def async_gather_or_cancel(*aws: Awaitable[T]) -> list[T]:
+    """Run awaitables concurrently, cancelling the others as soon as one fails.
+
+    Unlike asyncio.gather, a failure doesn't leave the other awaitables running in the
+    background: they are cancelled (and waited for) before the error is raised. The
+    same happens if the caller is cancelled.
+
+    Args:
+        *aws: The awaitables to run.
+
+    Returns:
+        The result of each awaitable (in order).
+
+    Raises:
+        BaseException: The error of the first awaitable that failed.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return []
+
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task in tasks:
+        if not task.cancelled() and (err := task.exception()) is not None:
+            raise err
+    return [task.result() for task in tasks]
@@ -0,0 +1,116 @@
+"""Define a local mirror of sensor data that is kept up to date incrementally."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from aiopurpleair.endpoints.sensors import SensorsEndpoints
+from aiopurpleair.models.sensors import SensorModel
+
+
+@dataclass
+class SyncStats:
+    """Define statistics about the syncs a SensorMirror has performed."""
+
+    full_syncs: int = 0
+    delta_syncs: int = 0
+    sensors_received: int = 0
+    sensors_removed: int = 0
+
+
+class SensorMirror:
+    """Define a local copy of sensor data that only requests what has changed.
+
+    The first sync pulls every matching sensor; every sync after that only requests
+    the sensors that have been modified since the data timestamp of the previous
+    response and merges them into the existing data.
+    """
+
+    def __init__(
+        self,
+        sensors: SensorsEndpoints,
+        fields: list[str],
+        *,
+        max_age: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            sensors: The sensors endpoints manager from an API object.
+            fields: The sensor data fields to include.
+            max_age: If provided, sensors that haven't been seen within this many
+                seconds are left out of (or removed from) the mirror.
+            **kwargs: Any other filters accepted by async_get_sensors (other than
+                modified_since_utc, which the mirror manages itself).
+        """
+        # The last seen time is needed to expire sensors:
+        self._fields = fields + [
+            field for field in ("last_seen",) if field not in fields
+        ]
+        self._filters = kwargs
+        self._max_age = max_age
+        self._sensors = sensors
+
+        self.data: dict[int, SensorModel] = {}
+        self.data_timestamp_utc: datetime | None = None
+        self.stats = SyncStats()
+
+    async def async_sync(self, *, full: bool = False) -> set[int]:
+        """Bring the mirror up to date.
+
+        Args:
+            full: Whether to pull every sensor (rather than only the modified ones).
+
+        Returns:
+            The indices of the sensors that were added, updated, or removed.
+        """
+        full = full or self.data_timestamp_utc is None
+
+        response = await self._sensors.async_get_sensors(
+            self._fields,
+            max_age=self._max_age,
+            modified_since_utc=None if full else self.data_timestamp_utc,
+            **self._filters,
+        )
+
+        if full:
+            self.stats.full_syncs += 1
+            # Every existing sensor is either updated or removed by a full sync:
+            changed = set(self.data)
+            self.data.clear()
+        else:
+            self.stats.delta_syncs += 1
+            changed = set()
+
+        self.stats.sensors_received += len(response.data)
+        self.data.update(response.data)
+        self.data_timestamp_utc = response.data_timestamp_utc
+        changed.update(response.data)
+        changed.update(self._remove_expired_sensors())
+
+        return changed
+
+    def _remove_expired_sensors(self) -> set[int]:
+        """Remove the sensors that haven't been seen within the maximum age.
+
+        Returns:
+            The indices of the removed sensors.
+        """
+        if not self._max_age or self.data_timestamp_utc is None:
+            return set()
+
+        oldest = self.data_timestamp_utc - timedelta(seconds=self._max_age)
+        expired = {
+            sensor_index
+            for sensor_index, sensor in self.data.items()
+            if sensor.last_seen_utc is not None and sensor.last_seen_utc < oldest
+        }
+
+        for sensor_index in expired:
+            del self.data[sensor_index]
+
+        self.stats.sensors_removed += len(expired)
+        return expired
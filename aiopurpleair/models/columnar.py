@@ -0,0 +1,224 @@
+"""Define a columnar representation of GET /v1/sensors responses."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import ConfigDict
+
+from aiopurpleair.helpers.lazy import NUMPY_AVAILABLE, np
+from aiopurpleair.helpers.model import get_field_types
+from aiopurpleair.models.sensors import GetSensorsResponseBase, SensorModel
+
+SENSOR_FIELD_TYPES = get_field_types(SensorModel)
+
+# Field types whose raw values are integers (enums are stored as their integer codes
+# and datetimes as their epoch timestamps):
+INTEGER_FIELD_TYPES = (bool, int, datetime, Enum)
+
+
+def _get_column_kind(field: str) -> str:
+    """Get the kind of typed column a field should be stored in.
+
+    Args:
+        field: A sensor field name.
+
+    Returns:
+        "float", "int", or "object".
+    """
+    _, field_type = SENSOR_FIELD_TYPES[field]
+    if field_type is float:
+        return "float"
+    if isinstance(field_type, type) and issubclass(field_type, INTEGER_FIELD_TYPES):
+        return "int"
+    return "object"
+
+
+def build_column(kind: str, values: Sequence[Any]) -> Any:
+    """Build a typed column from a sequence of raw values.
+
+    Float columns store missing values as NaN. Integer columns are stored as 64-bit
+    integers, unless they contain missing values, in which case they are stored as
+    floats (with NaN for the missing values). Everything else is stored as a list.
+
+    Args:
+        kind: The kind of column to build.
+        values: The raw values of the column.
+
+    Returns:
+        A NumPy array (if NumPy is installed), an array.array, or a list.
+    """
+    if kind == "object":
+        return list(values)
+
+    if kind == "int" and None not in values:
+        if NUMPY_AVAILABLE:
+            return np.array(values, dtype=np.int64)
+        return array("q", values)
+
+    if NUMPY_AVAILABLE:
+        return np.array(values, dtype=np.float64)
+    return array("d", [math.nan if value is None else value for value in values])
+
+
+def _get_raw_value(kind: str, value: Any) -> Any:
+    """Convert a value stored in a typed column back into its raw API value.
+
+    Args:
+        kind: The kind of column the value was stored in.
+        value: The stored value.
+
+    Returns:
+        The raw API value.
+    """
+    if kind == "object":
+        return value
+    if isinstance(value, float) or (NUMPY_AVAILABLE and isinstance(value, np.floating)):
+        if math.isnan(value):
+            return None
+        if kind == "int":
+            return int(value)
+        return float(value)
+    return int(value)
+
+
+class SensorColumns:
+    """Define a columnar store of sensor data (indexed by sensor index).
+
+    Each field is held in a single typed column; SensorModel objects are only built
+    on demand (and fully validated at that time).
+    """
+
+    __slots__ = ("_columns", "_kinds", "_positions", "fields")
+
+    def __init__(self, fields: list[str], rows: list[list[Any]]) -> None:
+        """Initialize.
+
+        Args:
+            fields: The field names of each row.
+            rows: The rows of sensor data.
+
+        Raises:
+            ValueError: Raised when a column's values don't match its type.
+        """
+        self.fields = fields
+        self._kinds = {field: _get_column_kind(field) for field in fields}
+        self._columns: dict[str, Any] = {}
+
+        if rows:
+            transposed = list(zip(*rows))  # noqa: B905
+        else:
+            transposed = [() for _ in fields]
+
+        for field, values in zip(fields, transposed):  # noqa: B905
+            try:
+                self._columns[field] = build_column(self._kinds[field], values)
+            except (TypeError, ValueError) as err:
+                raise ValueError(f"{field} contains invalid values") from err
+
+        self._positions = {
+            int(sensor_index): position
+            for position, sensor_index in enumerate(self._columns[fields[0]])
+        }
+
+    def __contains__(self, sensor_index: object) -> bool:
+        """Return whether a sensor index is in the store.
+
+        Args:
+            sensor_index: A sensor index.
+
+        Returns:
+            Whether the sensor index is in the store.
+        """
+        return sensor_index in self._positions
+
+    def __getitem__(self, sensor_index: int) -> SensorModel:
+        """Get a SensorModel for a sensor index.
+
+        Args:
+            sensor_index: A sensor index.
+
+        Returns:
+            A SensorModel.
+        """
+        return self.row(sensor_index)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the sensor indices in the store.
+
+        Returns:
+            An iterator of sensor indices.
+        """
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        """Return the number of sensors in the store.
+
+        Returns:
+            The number of sensors.
+        """
+        return len(self._positions)
+
+    def column(self, field: str) -> Any:
+        """Get the typed column for a field.
+
+        Args:
+            field: A sensor field name.
+
+        Returns:
+            A NumPy array (if NumPy is installed), an array.array, or a list.
+        """
+        return self._columns[field]
+
+    def row(self, sensor_index: int) -> SensorModel:
+        """Build a SensorModel for a sensor index.
+
+        Args:
+            sensor_index: A sensor index.
+
+        Returns:
+            A SensorModel.
+        """
+        position = self._positions[sensor_index]
+        raw_values = {
+            field: _get_raw_value(self._kinds[field], self._columns[field][position])
+            for field in self.fields
+        }
+        return SensorModel.model_validate(
+            {field: value for field, value in raw_values.items() if value is not None}
+        )
+
+    def rows(self) -> Iterator[SensorModel]:
+        """Iterate over a SensorModel for every sensor in the store.
+
+        Yields:
+            SensorModel objects.
+        """
+        for sensor_index in self._positions:
+            yield self.row(sensor_index)
+
+
+class GetSensorsColumnarResponse(GetSensorsResponseBase):
+    """Define a response to GET /v1/sensors whose data is stored in columns."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    data: SensorColumns
+
+    @classmethod
+    def parse_data(cls, fields: list[str], data: list[list[Any]]) -> SensorColumns:
+        """Parse the rows of sensor data into typed columns.
+
+        Args:
+            fields: The field names of each row.
+            data: The rows of sensor data.
+
+        Returns:
+            A SensorColumns object.
+        """
+        return SensorColumns(fields, data)
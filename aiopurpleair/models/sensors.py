@@ -3,13 +3,28 @@
 # pylint: disable=too-few-public-methods
 from __future__ import annotations
 
+import inspect
 from datetime import datetime
+from functools import cached_property, lru_cache
 from typing import Any, Optional
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import (
+    Field,
+    SkipValidation,
+    create_model,
+    field_validator,
+    model_validator,
+)
 
 from aiopurpleair.const import SENSOR_FIELDS, ChannelFlag, ChannelState, LocationType
-from aiopurpleair.helpers.model import PurpleAirBaseModel
+from aiopurpleair.helpers.decoder import (
+    Converter,
+    RowDecoder,
+    convert_float,
+    convert_int,
+    make_validated_converter,
+)
+from aiopurpleair.helpers.model import PurpleAirBaseModel, get_field_types
 from aiopurpleair.helpers.validator import validate_timestamp
 from aiopurpleair.helpers.validator.sensors import (
     validate_channel_flag,
@@ -238,6 +253,94 @@ class SensorModel(PurpleAirBaseModel):
     validate_longitude = field_validator("longitude")(validate_longitude)
 
 
+# Fast-path converters for fields that SensorModel runs custom validators on (all other
+# fields are converted based on their type):
+SENSOR_ROW_CONVERTERS: dict[str, Converter] = {
+    "date_created": make_validated_converter(convert_int, validate_timestamp),
+    "last_modified": make_validated_converter(convert_int, validate_timestamp),
+    "last_seen": make_validated_converter(convert_int, validate_timestamp),
+    "latitude": make_validated_converter(convert_float, validate_latitude),
+    "longitude": make_validated_converter(convert_float, validate_longitude),
+}
+
+
+@lru_cache(maxsize=32)
+def get_sensor_row_decoder(fields: tuple[str, ...]) -> RowDecoder[SensorModel]:
+    """Get a (cached) decoder that turns rows with a set of fields into SensorModels.
+
+    Args:
+        fields: The field names of each row.
+
+    Returns:
+        A RowDecoder.
+    """
+    return RowDecoder(SensorModel, fields, SENSOR_ROW_CONVERTERS)
+
+
+@lru_cache(maxsize=32)
+def get_slim_sensor_model(fields: tuple[str, ...]) -> type[PurpleAirBaseModel]:
+    """Get a (cached) model that only holds a set of sensor fields.
+
+    The model validates its fields exactly like SensorModel does, but its instances
+    only store the fields that were requested (plus the sensor index), which takes a
+    fraction of the memory of a SensorModel. Accessing any other attribute raises an
+    AttributeError.
+
+    Args:
+        fields: The sensor field names to include.
+
+    Returns:
+        A Pydantic model class.
+    """
+    field_types = get_field_types(SensorModel)
+    names = {
+        "sensor_index",
+        *(field_types[field][0] for field in fields if field in field_types),
+    }
+
+    validators = {}
+    for name, decorator in SensorModel.__pydantic_decorators__.field_validators.items():
+        validated_fields = [field for field in decorator.info.fields if field in names]
+        if not validated_fields:
+            continue
+        # Validators defined as classmethods are bound to SensorModel, so they need to
+        # be rebound to the new model:
+        func: Any = decorator.func
+        if inspect.ismethod(func):
+            func = classmethod(func.__func__)
+        validators[name] = field_validator(*validated_fields, mode=decorator.info.mode)(
+            func
+        )
+
+    model: type[PurpleAirBaseModel] = create_model(  # type: ignore[call-overload]
+        "SlimSensorModel",
+        __base__=PurpleAirBaseModel,
+        __module__=__name__,
+        __validators__=validators,
+        **{
+            name: (info.annotation, info)
+            for name, info in SensorModel.model_fields.items()
+            if name in names
+        },
+    )
+    return model
+
+
+@lru_cache(maxsize=32)
+def get_slim_sensor_row_decoder(
+    fields: tuple[str, ...],
+) -> RowDecoder[PurpleAirBaseModel]:
+    """Get a (cached) decoder that turns rows with a set of fields into slim models.
+
+    Args:
+        fields: The field names of each row.
+
+    Returns:
+        A RowDecoder.
+    """
+    return RowDecoder(get_slim_sensor_model(fields), fields, SENSOR_ROW_CONVERTERS)
+
+
 class GetSensorRequest(PurpleAirBaseModel):
     """Define a request to GET /v1/sensors/:sensor_index."""
 
@@ -370,11 +473,13 @@ class GetSensorsRequest(PurpleAirBaseModel):
         return ",".join([str(i) for i in value])
 
 
-class GetSensorsResponse(PurpleAirBaseModel):
-    """Define a response to GET /v1/sensors."""
+class GetSensorsResponseBase(PurpleAirBaseModel):
+    """Define the shared portion of a response to GET /v1/sensors.
+
+    Subclasses define how the rows in the response's ``data`` are parsed.
+    """
 
     fields: list[str]
-    data: dict[int, SensorModel]
 
     api_version: str
     firmware_default_version: str
@@ -400,15 +505,26 @@ class GetSensorsResponse(PurpleAirBaseModel):
             if field not in SENSOR_FIELDS:
                 raise ValueError(f"{field} is an unknown field")
 
-        values["data"] = {
-            sensor_values[0]: SensorModel.model_validate(
-                dict(zip(values["fields"], sensor_values))  # noqa: B905
-            )
-            for sensor_values in values["data"]
-        }
+        values["data"] = cls.parse_data(values["fields"], values["data"])
 
         return values
 
+    @classmethod
+    def parse_data(cls, fields: list[str], data: list[list[Any]]) -> Any:
+        """Parse the rows of sensor data in the response.
+
+        Subclasses override this to turn the rows into their own representation; by
+        default, the rows are left untouched.
+
+        Args:
+            fields: The field names of each row.
+            data: The rows of sensor data.
+
+        Returns:
+            The rows of sensor data.
+        """
+        return data
+
     validate_data_timestamp_utc = field_validator("data_timestamp_utc", mode="before")(
         validate_timestamp
     )
@@ -416,3 +532,89 @@ class GetSensorsResponse(PurpleAirBaseModel):
     validate_timestamp_utc = field_validator("timestamp_utc", mode="before")(
         validate_timestamp
     )
+
+
+class GetSensorsResponse(GetSensorsResponseBase):
+    """Define a response to GET /v1/sensors."""
+
+    data: dict[int, SensorModel]
+
+    @classmethod
+    def parse_data(
+        cls, fields: list[str], data: list[list[Any]]
+    ) -> dict[int, SensorModel]:
+        """Parse each row of sensor data into a SensorModel.
+
+        Args:
+            fields: The field names of each row.
+            data: The rows of sensor data.
+
+        Returns:
+            A dictionary of SensorModel objects (keyed by sensor index).
+        """
+        decoder = get_sensor_row_decoder(tuple(fields))
+        return {sensor_values[0]: decoder(sensor_values) for sensor_values in data}
+
+
+class GetSensorsSlimResponse(GetSensorsResponseBase):
+    """Define a response to GET /v1/sensors whose sensors only hold their fields."""
+
+    data: dict[int, PurpleAirBaseModel]
+
+    @classmethod
+    def parse_data(
+        cls, fields: list[str], data: list[list[Any]]
+    ) -> dict[int, PurpleAirBaseModel]:
+        """Parse each row of sensor data into a slim model (see get_slim_sensor_model).
+
+        Args:
+            fields: The field names of each row.
+            data: The rows of sensor data.
+
+        Returns:
+            A dictionary of slim sensor models (keyed by sensor index).
+        """
+        decoder = get_slim_sensor_row_decoder(tuple(fields))
+        return {sensor_values[0]: decoder(sensor_values) for sensor_values in data}
+
+
+class GetSensorsRawResponse(GetSensorsResponseBase):
+    """Define a response to GET /v1/sensors whose rows are left as-is.
+
+    The rows are neither validated nor copied, so this is the cheapest way to handle a
+    response (e.g., to ingest it somewhere else in bulk).
+    """
+
+    data: SkipValidation[list[list[Any]]]
+
+    @cached_property
+    def column_index(self) -> dict[str, int]:
+        """Return the position of each field in a row.
+
+        Returns:
+            A dictionary that maps each field name to its position.
+        """
+        return {field: position for position, field in enumerate(self.fields)}
+
+    def to_arrow(self) -> Any:
+        """Export the sensors as an Apache Arrow table (requires pyarrow).
+
+        Returns:
+            A pyarrow.Table with a typed column for each field.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from aiopurpleair.helpers.export import build_arrow_table
+
+        return build_arrow_table(self.fields, self.data)
+
+    def to_pandas(self) -> Any:
+        """Export the sensors as a pandas DataFrame (requires pandas).
+
+        Returns:
+            A pandas.DataFrame (indexed by sensor index) with a typed column for each
+            field.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from aiopurpleair.helpers.export import build_data_frame
+
+        return build_data_frame(self.fields, self.data)
@@ -0,0 +1,290 @@
+"""Define a sweeper that gets every sensor in a large region as a quadtree of tiles."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from aiopurpleair.endpoints.sensors import SensorsEndpoints
+from aiopurpleair.helpers.tasks import async_gather_or_cancel
+from aiopurpleair.models.sensors import GetSensorsResponse, SensorModel
+
+DEFAULT_INITIAL_DEPTH = 1
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_DEPTH = 8
+DEFAULT_MAX_ROWS_PER_TILE = 1000
+
+
+@dataclass(frozen=True)
+class SweepSettings:
+    """Define the tunable settings of a region sweep."""
+
+    # The depth of the quadtree of the first sweep (i.e., it has 4 ** depth tiles):
+    initial_depth: int = DEFAULT_INITIAL_DEPTH
+    # The maximum number of tiles that are requested at once:
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    # The depth beyond which tiles are never split:
+    max_depth: int = DEFAULT_MAX_DEPTH
+    # The number of rows beyond which a tile is split (and below half of which four
+    # sibling tiles are merged):
+    max_rows_per_tile: int = DEFAULT_MAX_ROWS_PER_TILE
+
+
+@dataclass
+class SweepStats:
+    """Define counters for region sweeps."""
+
+    sweeps: int = 0
+    requests: int = 0
+    sensors_received: int = 0
+    duplicates: int = 0
+    tiles_split: int = 0
+    tiles_merged: int = 0
+
+
+@dataclass(frozen=True)
+class Tile:
+    """Define a tile of a region (one of the 4 ** depth cells of its quadtree)."""
+
+    depth: int
+    column: int
+    row: int
+
+    @property
+    def children(self) -> list[Tile]:
+        """Get the four tiles that this tile splits into.
+
+        Returns:
+            The NW, NE, SW, and SE child tiles.
+        """
+        return [
+            Tile(self.depth + 1, 2 * self.column + column, 2 * self.row + row)
+            for row in (0, 1)
+            for column in (0, 1)
+        ]
+
+    @property
+    def parent(self) -> Tile:
+        """Get the tile that this tile is one of the children of.
+
+        Returns:
+            The parent tile.
+        """
+        return Tile(self.depth - 1, self.column // 2, self.row // 2)
+
+
+class RegionSweeper:
+    """Define a sweeper that gets every sensor in a region, a tile at a time.
+
+    The region is split into a quadtree of tiles, which are requested concurrently
+    (rather than as one huge response that is slow to transfer, parse, and retry).
+    After each sweep, tiles that returned too many rows are split (based on the
+    locations of their sensors) and sparse sibling tiles are merged; the next sweep
+    starts from that layout.
+
+    Oversized tiles are not split and requested again within the same sweep: their
+    responses already hold every sensor in them, and requesting their children would
+    pay for those rows twice. This means that the first sweep of a dense region still
+    makes large requests (as large as its initial tiles); a deeper initial_depth
+    bounds them.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        sensors: SensorsEndpoints,
+        fields: list[str],
+        *,
+        nw_latitude: float = 90.0,
+        nw_longitude: float = -180.0,
+        se_latitude: float = -90.0,
+        se_longitude: float = 180.0,
+        settings: SweepSettings | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            sensors: The sensors endpoints manager from an API object.
+            fields: The sensor data fields to include.
+            nw_latitude: The latitude of the NW corner of the region.
+            nw_longitude: The longitude of the NW corner of the region.
+            se_latitude: The latitude of the SE corner of the region.
+            se_longitude: The longitude of the SE corner of the region.
+            settings: The sweep settings.
+            **kwargs: Any other filters accepted by async_get_sensors (other than the
+                bounding box, which the sweeper manages itself).
+
+        Raises:
+            ValueError: Raised when the region's NW corner isn't NW of its SE corner.
+        """
+        if nw_latitude <= se_latitude or nw_longitude >= se_longitude:
+            raise ValueError("The NW corner of the region must be NW of its SE corner")
+
+        # The location of each sensor is needed to split tiles:
+        self._fields = fields + [
+            field for field in ("latitude", "longitude") if field not in fields
+        ]
+        self._filters = kwargs
+        self._region = (nw_latitude, nw_longitude, se_latitude, se_longitude)
+        self._sensors = sensors
+        self._settings = settings or SweepSettings()
+
+        # The tiles of the next sweep (and the rows each one returned last time):
+        self.layout: dict[Tile, int] = {
+            Tile(self._settings.initial_depth, column, row): 0
+            for row in range(2**self._settings.initial_depth)
+            for column in range(2**self._settings.initial_depth)
+        }
+        self.stats = SweepStats()
+
+    async def async_sweep(self) -> dict[int, SensorModel]:
+        """Get every sensor in the region.
+
+        Returns:
+            A dictionary of SensorModel objects (keyed by sensor index).
+        """
+        semaphore = asyncio.Semaphore(self._settings.max_concurrency)
+        tiles = list(self.layout)
+
+        async def async_get_tile(tile: Tile) -> GetSensorsResponse:
+            """Get the sensors in a tile.
+
+            Args:
+                tile: The tile to get.
+
+            Returns:
+                An API response payload in the form of a Pydantic model.
+            """
+            nw_latitude, nw_longitude, se_latitude, se_longitude = self.get_tile_box(
+                tile
+            )
+            async with semaphore:
+                self.stats.requests += 1
+                return await self._sensors.async_get_sensors(
+                    self._fields,
+                    nw_latitude=nw_latitude,
+                    nw_longitude=nw_longitude,
+                    se_latitude=se_latitude,
+                    se_longitude=se_longitude,
+                    **self._filters,
+                )
+
+        # If a tile fails, the requests for the other tiles are cancelled:
+        responses = await async_gather_or_cancel(
+            *(async_get_tile(tile) for tile in tiles)
+        )
+
+        sensors: dict[int, SensorModel] = {}
+        layout: dict[Tile, int] = {}
+        for tile, response in zip(tiles, responses):  # noqa: B905
+            self.stats.sensors_received += len(response.data)
+            for sensor_index, sensor in response.data.items():
+                # Sensors on the edge of a tile are returned for every adjacent tile:
+                if sensor_index in sensors:
+                    self.stats.duplicates += 1
+                sensors[sensor_index] = sensor
+            layout.update(
+                self._split_tile(
+                    tile,
+                    [
+                        (sensor.latitude, sensor.longitude)
+                        for sensor in response.data.values()
+                        if sensor.latitude is not None and sensor.longitude is not None
+                    ],
+                )
+            )
+
+        self.layout = self._merge_tiles(layout)
+        self.stats.sweeps += 1
+        return sensors
+
+    def get_tile_box(self, tile: Tile) -> tuple[float, float, float, float]:
+        """Get the bounding box of a tile.
+
+        Args:
+            tile: A tile.
+
+        Returns:
+            The NW latitude, NW longitude, SE latitude, and SE longitude of the tile.
+        """
+        nw_latitude, nw_longitude, se_latitude, se_longitude = self._region
+        latitude_step = (nw_latitude - se_latitude) / 2**tile.depth
+        longitude_step = (se_longitude - nw_longitude) / 2**tile.depth
+        return (
+            nw_latitude - tile.row * latitude_step,
+            nw_longitude + tile.column * longitude_step,
+            nw_latitude - (tile.row + 1) * latitude_step,
+            nw_longitude + (tile.column + 1) * longitude_step,
+        )
+
+    def _split_tile(
+        self, tile: Tile, locations: Sequence[tuple[float, float]]
+    ) -> dict[Tile, int]:
+        """Split a tile (recursively) until none of its tiles have too many rows.
+
+        Args:
+            tile: The tile to split.
+            locations: The latitude/longitude pairs of the sensors in the tile.
+
+        Returns:
+            The resulting tiles (and the number of sensors in each one).
+        """
+        if (
+            len(locations) <= self._settings.max_rows_per_tile
+            or tile.depth >= self._settings.max_depth
+        ):
+            return {tile: len(locations)}
+
+        self.stats.tiles_split += 1
+        nw_latitude, nw_longitude, se_latitude, se_longitude = self.get_tile_box(tile)
+        middle_latitude = (nw_latitude + se_latitude) / 2
+        middle_longitude = (nw_longitude + se_longitude) / 2
+
+        # Children are ordered NW, NE, SW, SE (just like Tile.children):
+        child_locations: list[list[tuple[float, float]]] = [[], [], [], []]
+        for latitude, longitude in locations:
+            child_locations[
+                2 * (latitude < middle_latitude) + (longitude >= middle_longitude)
+            ].append((latitude, longitude))
+
+        layout: dict[Tile, int] = {}
+        for child, locations_in_child in zip(  # noqa: B905
+            tile.children, child_locations
+        ):
+            layout.update(self._split_tile(child, locations_in_child))
+        return layout
+
+    def _merge_tiles(self, layout: dict[Tile, int]) -> dict[Tile, int]:
+        """Merge sibling tiles (recursively) while they have few enough rows together.
+
+        Siblings are only merged below half of the maximum number of rows, so that tiles
+        don't flip between being split and merged from one sweep to the next.
+
+        Args:
+            layout: The tiles (and the number of sensors in each one).
+
+        Returns:
+            The resulting tiles (and the number of sensors in each one).
+        """
+        merged = True
+        while merged:
+            merged = False
+            for tile in list(layout):
+                if tile not in layout or tile.depth == 0:
+                    continue
+                siblings = tile.parent.children
+                if not all(sibling in layout for sibling in siblings):
+                    continue
+                rows = sum(layout[sibling] for sibling in siblings)
+                if rows * 2 > self._settings.max_rows_per_tile:
+                    continue
+
+                for sibling in siblings:
+                    del layout[sibling]
+                layout[tile.parent] = rows
+                self.stats.tiles_merged += 1
+                merged = True
+
+        return layout
@@ -0,0 +1,3 @@
+"""Define tools for testing code that uses aiopurpleair."""
+
+from .server import FakePurpleAirServer, FakeServerSettings, FakeServerStats  # noqa
@@ -0,0 +1,554 @@
+"""Define a local stand-in for the PurpleAir API."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from types import TracebackType
+from typing import Any
+
+from aiohttp import web
+
+from aiopurpleair.const import SENSOR_FIELDS
+from aiopurpleair.helpers.model import get_field_types
+from aiopurpleair.models.sensors import SensorModel, SensorModelStats
+
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        """Encode data as JSON.
+
+        Args:
+            data: The data to encode.
+
+        Returns:
+            The JSON bytes.
+        """
+        return orjson.dumps(data)
+
+except ImportError:
+    import json
+
+    def _dumps(data: Any) -> bytes:
+        """Encode data as JSON.
+
+        Args:
+            data: The data to encode.
+
+        Returns:
+            The JSON bytes.
+        """
+        return json.dumps(data).encode()
+
+
+API_VERSION = "V1.0.11-0.0.41"
+DEFAULT_MAX_AGE = 604800
+FIRMWARE_DEFAULT_VERSION = "7.02"
+
+SENSOR_FIELD_TYPES = get_field_types(SensorModel)
+
+# The first sensor index (sensors are numbered consecutively from here):
+FIRST_SENSOR_INDEX = 100000
+
+# The keys of a sensor's statistics:
+STATS_KEYS = [
+    field.alias or name
+    for name, field in SensorModelStats.model_fields.items()
+    if name != "timestamp_utc"
+]
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@dataclass(frozen=True)
+class FakeServerSettings:  # pylint: disable=too-many-instance-attributes
+    """Define the tunable settings of the fake server."""
+
+    # The number of synthetic sensors to serve:
+    num_sensors: int = 1000
+    # The seed of the synthetic data (and of the injected latency and errors):
+    seed: int = 0
+    # The fixed delay (in seconds) before every response:
+    latency: float = 0.0
+    # The mean of a random, exponentially distributed extra delay (in seconds) before
+    # every response (which gives the latency a long tail):
+    latency_jitter: float = 0.0
+    # The fraction (between 0 and 1) of requests that fail with a server error:
+    error_rate: float = 0.0
+    # The number of requests per second that are served before the rest are throttled
+    # (with a 429 and a Retry-After header); None means that nothing is throttled:
+    max_requests_per_second: float | None = None
+    # The only API key that is accepted; None means that any key (or none) is:
+    api_key: str | None = None
+
+
+@dataclass
+class FakeServerStats:
+    """Define counters for the fake server."""
+
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+
+
+class SensorTable:
+    """Define a table of synthetic sensor data.
+
+    Each field's column is generated (from its own seeded random generator) the first
+    time it's requested, so only the fields that are actually used cost anything.
+    """
+
+    def __init__(self, num_sensors: int, seed: int) -> None:
+        """Initialize.
+
+        Args:
+            num_sensors: The number of sensors in the table.
+            seed: The seed of the synthetic data.
+        """
+        self._columns: dict[str, list[Any]] = {}
+        self._now = int(time.time())
+        self._seed = seed
+
+        self.sensor_indices = list(
+            range(FIRST_SENSOR_INDEX, FIRST_SENSOR_INDEX + num_sensors)
+        )
+        self.positions = {
+            sensor_index: position
+            for position, sensor_index in enumerate(self.sensor_indices)
+        }
+
+    def get_column(self, field: str) -> list[Any]:
+        """Get the (raw API) values of a field for every sensor.
+
+        Args:
+            field: A sensor field name.
+
+        Returns:
+            The values of the field, in sensor order.
+        """
+        if (column := self._columns.get(field)) is None:
+            column = self._columns[field] = self._generate_column(field)
+        return column
+
+    def _generate_column(self, field: str) -> list[Any]:
+        """Generate the values of a field for every sensor.
+
+        Args:
+            field: A sensor field name.
+
+        Returns:
+            The values of the field, in sensor order.
+        """
+        if field == "sensor_index":
+            return self.sensor_indices
+        if field == "name":
+            return [f"Sensor {sensor_index}" for sensor_index in self.sensor_indices]
+
+        rng = random.Random(f"{self._seed}:{field}")
+        generate_value = self._get_value_generator(rng, field)
+        return [generate_value() for _ in self.sensor_indices]
+
+    def _get_value_generator(  # pylint: disable=too-many-return-statements
+        self, rng: random.Random, field: str
+    ) -> Callable[[], Any]:
+        """Get a function that generates a random value of a field.
+
+        Args:
+            rng: The random generator to use.
+            field: A sensor field name.
+
+        Returns:
+            A function that generates a raw API value.
+        """
+        _, field_type = SENSOR_FIELD_TYPES[field]
+
+        if field == "latitude":
+            return lambda: round(rng.uniform(-60, 70), 5)
+        if field == "longitude":
+            return lambda: round(rng.uniform(-180, 180), 5)
+        if field_type is float:
+            return lambda: round(rng.uniform(0, 100), 1)
+        if field_type is bool:
+            return lambda: rng.randint(0, 1)
+        if field_type is int:
+            return lambda: rng.randint(0, 1000)
+        if field_type is datetime:
+            # Spread over the past week, so that max_age filtering means something:
+            return lambda: self._now - rng.randint(0, DEFAULT_MAX_AGE)
+        if isinstance(field_type, type) and issubclass(field_type, Enum):
+            values = [member.value for member in field_type]
+            return lambda: rng.choice(values)
+        if field_type is SensorModelStats:
+            return lambda: {
+                **{key: round(rng.uniform(0, 100), 1) for key in STATS_KEYS},
+                "time_stamp": self._now,
+            }
+        return lambda: f"{field}-{rng.getrandbits(32):08x}"
+
+
+class FakePurpleAirServer:
+    """Define a local stand-in for the PurpleAir API.
+
+    The server answers GET /v1/keys, /v1/sensors, and /v1/sensors/:sensor_index with
+    synthetic (but deterministic) data for any number of sensors, optionally injecting
+    latency, server errors, and throttling so that a client can be measured under
+    realistic conditions without touching the real API:
+
+        settings = FakeServerSettings(num_sensors=100000, latency=0.05)
+        async with FakePurpleAirServer(settings) as server:
+            api = API("<API_KEY>", base_url=server.base_url)
+    """
+
+    def __init__(
+        self,
+        settings: FakeServerSettings | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            settings: The fake server settings.
+            host: The host to listen on.
+            port: The port to listen on (0 picks a free one).
+        """
+        self._host = host
+        self._port = port
+        self._runner: web.AppRunner | None = None
+        self._settings = settings or FakeServerSettings()
+        self._rng = random.Random(self._settings.seed)
+        self._table = SensorTable(self._settings.num_sensors, self._settings.seed)
+        self._throttle_tokens = self._settings.max_requests_per_second or 0.0
+        self._throttle_updated = time.monotonic()
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_get("/v1/keys", self._async_get_keys)
+        self.app.router.add_get("/v1/sensors", self._async_get_sensors)
+        self.app.router.add_get("/v1/sensors/{sensor_index}", self._async_get_sensor)
+        self.stats = FakeServerStats()
+
+    async def __aenter__(self) -> FakePurpleAirServer:
+        """Start the server.
+
+        Returns:
+            This server.
+        """
+        await self.async_start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop the server.
+
+        Args:
+            exc_type: The type of a raised exception (if any).
+            exc_val: A raised exception (if any).
+            exc_tb: The traceback of a raised exception (if any).
+        """
+        await self.async_stop()
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL of the (running) server's API.
+
+        Returns:
+            A base URL to pass to the API object.
+        """
+        return f"http://{self._host}:{self._port}/v1"
+
+    async def async_start(self) -> None:
+        """Start listening for requests."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+    async def async_stop(self) -> None:
+        """Stop listening for requests."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @staticmethod
+    def _error_response(status: int, error: str, description: str) -> web.Response:
+        """Build an API error response.
+
+        Args:
+            status: The HTTP status code.
+            error: The API error code.
+            description: A description of the error.
+
+        Returns:
+            An aiohttp Response.
+        """
+        return web.Response(
+            body=_dumps(
+                {
+                    "api_version": API_VERSION,
+                    "time_stamp": int(time.time()),
+                    "error": error,
+                    "description": description,
+                }
+            ),
+            status=status,
+            content_type="application/json",
+        )
+
+    @staticmethod
+    def _json_response(data: dict[str, Any]) -> web.Response:
+        """Build a successful API response.
+
+        Args:
+            data: The response data.
+
+        Returns:
+            An aiohttp Response.
+        """
+        return web.Response(
+            body=_dumps(
+                {"api_version": API_VERSION, "time_stamp": int(time.time()), **data}
+            ),
+            content_type="application/json",
+        )
+
+    def _get_throttle_delay(self) -> float:
+        """Take a request from the throttling budget.
+
+        Returns:
+            How long (in seconds) to wait until the next request is served (0 if this
+            request can be served now).
+        """
+        if (rate := self._settings.max_requests_per_second) is None:
+            return 0.0
+
+        now = time.monotonic()
+        self._throttle_tokens = min(
+            self._throttle_tokens + (now - self._throttle_updated) * rate, rate
+        )
+        self._throttle_updated = now
+
+        if self._throttle_tokens >= 1:
+            self._throttle_tokens -= 1
+            return 0.0
+        return (1 - self._throttle_tokens) / rate
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Handler
+    ) -> web.StreamResponse:
+        """Inject latency, errors, throttling, and API key checks into every request.
+
+        Args:
+            request: An aiohttp Request.
+            handler: The handler of the request.
+
+        Returns:
+            An aiohttp Response.
+        """
+        self.stats.requests += 1
+
+        delay = self._settings.latency
+        if self._settings.latency_jitter:
+            delay += self._rng.expovariate(1 / self._settings.latency_jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if (throttle_delay := self._get_throttle_delay()) > 0:
+            self.stats.throttled += 1
+            resp = self._error_response(
+                429, "RateLimitExceededError", "Too many requests; slow down."
+            )
+            resp.headers["Retry-After"] = str(math.ceil(throttle_delay))
+            return resp
+
+        if self._rng.random() < self._settings.error_rate:
+            self.stats.errors += 1
+            return self._error_response(
+                500, "InternalServerError", "An injected server error occurred."
+            )
+
+        if self._settings.api_key is not None:
+            if (api_key := request.headers.get("X-API-Key")) is None:
+                return self._error_response(
+                    403, "ApiKeyMissingError", "No API key was found in the request."
+                )
+            if api_key != self._settings.api_key:
+                return self._error_response(
+                    403, "ApiKeyInvalidError", "The provided api_key was not valid."
+                )
+
+        return await handler(request)
+
+    async def _async_get_keys(self, _: web.Request) -> web.Response:
+        """Handle GET /v1/keys.
+
+        Returns:
+            An aiohttp Response.
+        """
+        return self._json_response({"api_key_type": "READ"})
+
+    async def _async_get_sensor(self, request: web.Request) -> web.Response:
+        """Handle GET /v1/sensors/:sensor_index.
+
+        Args:
+            request: An aiohttp Request.
+
+        Returns:
+            An aiohttp Response.
+        """
+        try:
+            position = self._table.positions[int(request.match_info["sensor_index"])]
+        except (KeyError, ValueError):
+            return self._error_response(
+                404,
+                "NotFoundError",
+                "Cannot find a sensor with the provided parameters.",
+            )
+
+        if fields_param := request.query.get("fields"):
+            fields = self._get_fields(fields_param)
+            if isinstance(fields, web.Response):
+                return fields
+        else:
+            fields = sorted(SENSOR_FIELD_TYPES)
+
+        return self._json_response(
+            {
+                "data_time_stamp": int(time.time()),
+                "sensor": {
+                    "sensor_index": self._table.sensor_indices[position],
+                    **{
+                        field: self._table.get_column(field)[position]
+                        for field in fields
+                    },
+                },
+            }
+        )
+
+    async def _async_get_sensors(self, request: web.Request) -> web.Response:
+        """Handle GET /v1/sensors.
+
+        Args:
+            request: An aiohttp Request.
+
+        Returns:
+            An aiohttp Response.
+        """
+        if not (fields_param := request.query.get("fields")):
+            return self._error_response(
+                400, "MissingFieldsError", "The fields parameter is required."
+            )
+        fields = self._get_fields(fields_param)
+        if isinstance(fields, web.Response):
+            return fields
+
+        # The sensor index is always the first column:
+        fields = [
+            "sensor_index",
+            *(field for field in fields if field != "sensor_index"),
+        ]
+        try:
+            positions = self._filter_positions(request.query)
+        except (KeyError, ValueError):
+            return self._error_response(
+                400, "InvalidParameterError", "A query parameter has an invalid value."
+            )
+
+        columns = [self._table.get_column(field) for field in fields]
+        max_age = int(request.query.get("max_age", DEFAULT_MAX_AGE))
+        data = {
+            "data_time_stamp": int(time.time()),
+            "firmware_default_version": FIRMWARE_DEFAULT_VERSION,
+            "max_age": max_age,
+            "fields": fields,
+            "data": [
+                [column[position] for column in columns] for position in positions
+            ],
+        }
+        if "location_type" in request.query:
+            data["location_type"] = int(request.query["location_type"])
+        return self._json_response(data)
+
+    def _filter_positions(self, query: Any) -> list[int]:
+        """Get the positions (in the table) of the sensors that match a query.
+
+        Args:
+            query: The query parameters of a GET /v1/sensors request.
+
+        Returns:
+            The matching positions, in sensor order.
+        """
+        positions: list[int] | range = range(len(self._table.sensor_indices))
+
+        if show_only := query.get("show_only"):
+            positions = sorted(
+                self._table.positions[sensor_index]
+                for sensor_index in map(int, show_only.split(","))
+                if sensor_index in self._table.positions
+            )
+
+        if "location_type" in query:
+            location_type = int(query["location_type"])
+            column = self._table.get_column("location_type")
+            positions = [
+                position for position in positions if column[position] == location_type
+            ]
+
+        if max_age := int(query.get("max_age", DEFAULT_MAX_AGE)):
+            oldest = int(time.time()) - max_age
+            column = self._table.get_column("last_seen")
+            positions = [
+                position for position in positions if column[position] >= oldest
+            ]
+
+        if "modified_since" in query:
+            modified_since = int(query["modified_since"])
+            column = self._table.get_column("last_modified")
+            positions = [
+                position for position in positions if column[position] >= modified_since
+            ]
+
+        if "nwlat" in query:
+            nwlat, nwlng, selat, selng = (
+                float(query[key]) for key in ("nwlat", "nwlng", "selat", "selng")
+            )
+            latitudes = self._table.get_column("latitude")
+            longitudes = self._table.get_column("longitude")
+            positions = [
+                position
+                for position in positions
+                if selat <= latitudes[position] <= nwlat
+                and nwlng <= longitudes[position] <= selng
+            ]
+
+        return list(positions)
+
+    def _get_fields(self, fields_param: str) -> list[str] | web.Response:
+        """Parse the fields parameter of a request.
+
+        Args:
+            fields_param: A comma-separated list of field names.
+
+        Returns:
+            The field names (or an error response if any of them is unknown).
+        """
+        fields = fields_param.split(",")
+        for field in fields:
+            if field not in SENSOR_FIELDS:
+                return self._error_response(
+                    400, "InvalidFieldValueError", f"{field} is an unknown field."
+                )
+        return fields
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import heapq
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any, cast
+
+from aiopurpleair.helpers.lazy import NUMPY_AVAILABLE, np
 
 EARTH_RAIDUS_KM = 6378.1
+KILOMETERS_PER_DEGREE = EARTH_RAIDUS_KM * math.pi / 180
+
+# The maximum number of distances in a distance matrix (which limits its memory usage):
+DISTANCE_MATRIX_MAXIMUM_SIZE = 1000000
 
 MINIMUM_LATITUDE = math.radians(-90)
 MAXIMUM_LATITUDE = math.radians(90)
@@ -79,12 +88,97 @@ class GeoLocation:
     def bounding_box(self, distance_km: float) -> tuple[GeoLocation, GeoLocation]:
         """Calculate a bounding box a certain distance from this GeoLocation.
 
+        Note that a box that crosses the antimeridian has a NW longitude that is
+        greater than its SE longitude; bounding_boxes splits such a box instead.
+
         Args:
             distance_km: A distance (in kilometers).
 
         Returns:
             Two GeoLocation objects (representing the NW and SE corners of the box).
 
+        Raises:
+            ValueError: Raised on a negative distance_km parameter.
+        """
+        (
+            box_minimum_latitude,
+            box_maximum_latitude,
+            box_minimum_longitude,
+            box_maximum_longitude,
+        ) = self._get_bounding_box_extent(distance_km)
+
+        if box_minimum_longitude < MINIMUM_LONGITUDE:
+            box_minimum_longitude += 2 * math.pi
+        if box_maximum_longitude > MAXIMUM_LONGITUDE:
+            box_maximum_longitude -= 2 * math.pi
+
+        return (
+            GeoLocation.from_radians(box_maximum_latitude, box_minimum_longitude),
+            GeoLocation.from_radians(box_minimum_latitude, box_maximum_longitude),
+        )
+
+    def bounding_boxes(
+        self, distance_km: float
+    ) -> list[tuple[GeoLocation, GeoLocation]]:
+        """Calculate valid bounding boxes a certain distance from this GeoLocation.
+
+        Every box has a NW longitude that is less than (or equal to) its SE longitude:
+        a box that crosses the antimeridian is split into one box on each side of it,
+        and a box that contains a pole spans every longitude (but only the latitudes
+        within the distance).
+
+        Args:
+            distance_km: A distance (in kilometers).
+
+        Returns:
+            A list of (NW corner, SE corner) GeoLocation pairs.
+
+        Raises:
+            ValueError: Raised on a negative distance_km parameter.
+        """
+        (
+            box_minimum_latitude,
+            box_maximum_latitude,
+            box_minimum_longitude,
+            box_maximum_longitude,
+        ) = self._get_bounding_box_extent(distance_km)
+
+        if box_minimum_longitude < MINIMUM_LONGITUDE:
+            longitude_ranges = [
+                (box_minimum_longitude + 2 * math.pi, MAXIMUM_LONGITUDE),
+                (MINIMUM_LONGITUDE, box_maximum_longitude),
+            ]
+        elif box_maximum_longitude > MAXIMUM_LONGITUDE:
+            longitude_ranges = [
+                (box_minimum_longitude, MAXIMUM_LONGITUDE),
+                (MINIMUM_LONGITUDE, box_maximum_longitude - 2 * math.pi),
+            ]
+        else:
+            longitude_ranges = [(box_minimum_longitude, box_maximum_longitude)]
+
+        return [
+            (
+                GeoLocation.from_radians(box_maximum_latitude, minimum_longitude),
+                GeoLocation.from_radians(box_minimum_latitude, maximum_longitude),
+            )
+            for minimum_longitude, maximum_longitude in longitude_ranges
+        ]
+
+    def _get_bounding_box_extent(
+        self, distance_km: float
+    ) -> tuple[float, float, float, float]:
+        """Calculate the extent of a bounding box a certain distance from this point.
+
+        Longitudes aren't wrapped, so they fall outside of [-π, π] when the box crosses
+        the antimeridian.
+
+        Args:
+            distance_km: A distance (in kilometers).
+
+        Returns:
+            The minimum latitude, maximum latitude, minimum longitude, and maximum
+            longitude of the box (in radians).
+
         Raises:
             ValueError: Raised on a negative distance_km parameter.
         """
@@ -95,28 +189,26 @@ class GeoLocation:
         box_minimum_latitude = self.latitude_radians - distance_radians
         box_maximum_latitude = self.latitude_radians + distance_radians
 
-        if MINIMUM_LATITUDE < box_maximum_latitude < MAXIMUM_LATITUDE:
+        if (
+            box_minimum_latitude > MINIMUM_LATITUDE
+            and box_maximum_latitude < MAXIMUM_LATITUDE
+        ):
             delta_longitude = math.asin(
                 math.sin(distance_radians) / math.cos(self.latitude_radians)
             )
+            return (
+                box_minimum_latitude,
+                box_maximum_latitude,
+                self.longitude_radians - delta_longitude,
+                self.longitude_radians + delta_longitude,
+            )
 
-            box_minimum_longitude = self.longitude_radians - delta_longitude
-            if box_minimum_longitude < MINIMUM_LONGITUDE:
-                box_minimum_longitude += 2 * math.pi
-
-            box_maximum_longitude = self.longitude_radians + delta_longitude
-            if box_maximum_longitude > MAXIMUM_LONGITUDE:
-                box_maximum_longitude -= 2 * math.pi
-        else:
-            # One of the poles is within the bounding box:
-            box_minimum_latitude = max(box_minimum_latitude, MINIMUM_LATITUDE)
-            box_maximum_latitude = min(box_maximum_latitude, MAXIMUM_LATITUDE)
-            box_minimum_longitude = MINIMUM_LONGITUDE
-            box_maximum_longitude = MAXIMUM_LONGITUDE
-
+        # One of the poles is within the bounding box:
         return (
-            GeoLocation.from_radians(box_maximum_latitude, box_minimum_longitude),
-            GeoLocation.from_radians(box_minimum_latitude, box_maximum_longitude),
+            max(box_minimum_latitude, MINIMUM_LATITUDE),
+            min(box_maximum_latitude, MAXIMUM_LATITUDE),
+            MINIMUM_LONGITUDE,
+            MAXIMUM_LONGITUDE,
         )
 
     def distance_to(self, endpoint: GeoLocation) -> float:
@@ -128,9 +220,394 @@ class GeoLocation:
         Returns:
             The distance between this GeoLocation and the endpoint GeoLocation.
         """
-        return EARTH_RAIDUS_KM * math.acos(
-            math.sin(self.latitude_radians) * math.sin(endpoint.latitude_radians)
-            + math.cos(self.latitude_radians)
-            * math.cos(endpoint.latitude_radians)
-            * math.cos(self.longitude_radians - endpoint.longitude_radians)
+        return haversine_distance(
+            self.latitude_radians,
+            self.longitude_radians,
+            endpoint.latitude_radians,
+            endpoint.longitude_radians,
+        )
+
+    def distances_to(
+        self, latitudes_degrees: Sequence[float], longitudes_degrees: Sequence[float]
+    ) -> Sequence[float]:
+        """Calculate the great circle distances between this GeoLocation and others.
+
+        Coordinates aren't range-checked (unlike when creating GeoLocation objects),
+        which makes this far faster than calling distance_to in a loop.
+
+        Args:
+            latitudes_degrees: The latitudes (in degrees) of the endpoints.
+            longitudes_degrees: The longitudes (in degrees) of the endpoints.
+
+        Returns:
+            The distances (in kilometers) to each endpoint (a NumPy array if NumPy is
+            installed, otherwise a list).
+        """
+        half_chords = self._get_half_chords(latitudes_degrees, longitudes_degrees)
+
+        if NUMPY_AVAILABLE:
+            return cast(
+                Sequence[float],
+                2 * EARTH_RAIDUS_KM * np.arcsin(np.sqrt(np.minimum(half_chords, 1))),
+            )
+
+        return [
+            2 * EARTH_RAIDUS_KM * math.asin(math.sqrt(min(half_chord, 1.0)))
+            for half_chord in half_chords
+        ]
+
+    def distances_within(
+        self,
+        latitudes_degrees: Sequence[float],
+        longitudes_degrees: Sequence[float],
+        distance_km: float,
+    ) -> tuple[list[int], Sequence[float]]:
+        """Find the endpoints within a distance of this GeoLocation.
+
+        Endpoints are filtered in two stages: first, the haversine term of every
+        endpoint (the square of half the chord between the two points) is compared
+        with that of the distance, which rejects far away endpoints without any inverse
+        trigonometry; then, exact distances are only calculated for the rest.
+
+        Args:
+            latitudes_degrees: The latitudes (in degrees) of the endpoints.
+            longitudes_degrees: The longitudes (in degrees) of the endpoints.
+            distance_km: A distance (in kilometers).
+
+        Returns:
+            The positions of the endpoints within the distance (in their original order)
+            and the distances (in kilometers) to each of them (a NumPy array if NumPy is
+            installed, otherwise a list).
+        """
+        half_chords = self._get_half_chords(latitudes_degrees, longitudes_degrees)
+        # The haversine term grows with distance, so a single comparison suffices:
+        maximum_half_chord = (
+            math.sin(min(distance_km / EARTH_RAIDUS_KM, math.pi) / 2) ** 2
         )
+
+        if NUMPY_AVAILABLE:
+            positions = np.flatnonzero(half_chords <= maximum_half_chord)
+            return (
+                cast(list[int], positions.tolist()),
+                cast(
+                    Sequence[float],
+                    2
+                    * EARTH_RAIDUS_KM
+                    * np.arcsin(np.sqrt(np.minimum(half_chords[positions], 1))),
+                ),
+            )
+
+        positions = [
+            position
+            for position, half_chord in enumerate(half_chords)
+            if half_chord <= maximum_half_chord
+        ]
+        return positions, [
+            2 * EARTH_RAIDUS_KM * math.asin(math.sqrt(min(half_chords[position], 1.0)))
+            for position in positions
+        ]
+
+    def _get_half_chords(
+        self, latitudes_degrees: Sequence[float], longitudes_degrees: Sequence[float]
+    ) -> Any:
+        """Calculate the haversine term between this GeoLocation and others.
+
+        Args:
+            latitudes_degrees: The latitudes (in degrees) of the endpoints.
+            longitudes_degrees: The longitudes (in degrees) of the endpoints.
+
+        Returns:
+            The haversine term for each endpoint (a NumPy array if NumPy is installed,
+            otherwise a list).
+        """
+        if NUMPY_AVAILABLE:
+            latitudes = np.radians(np.asarray(latitudes_degrees, dtype=np.float64))
+            longitudes = np.radians(np.asarray(longitudes_degrees, dtype=np.float64))
+            return (
+                np.sin((latitudes - self.latitude_radians) / 2) ** 2
+                + math.cos(self.latitude_radians)
+                * np.cos(latitudes)
+                * np.sin((longitudes - self.longitude_radians) / 2) ** 2
+            )
+
+        return [
+            get_half_chord(
+                self.latitude_radians,
+                self.longitude_radians,
+                math.radians(latitude),
+                math.radians(longitude),
+            )
+            for latitude, longitude in zip(  # noqa: B905
+                latitudes_degrees, longitudes_degrees
+            )
+        ]
+
+
+def get_half_chord(
+    latitude_radians_1: float,
+    longitude_radians_1: float,
+    latitude_radians_2: float,
+    longitude_radians_2: float,
+) -> float:
+    """Calculate the haversine term between two points.
+
+    This is the square of half the straight-line chord between the points (on a unit
+    sphere), which grows with their great circle distance.
+
+    Args:
+        latitude_radians_1: The latitude (in radians) of the first point.
+        longitude_radians_1: The longitude (in radians) of the first point.
+        latitude_radians_2: The latitude (in radians) of the second point.
+        longitude_radians_2: The longitude (in radians) of the second point.
+
+    Returns:
+        The haversine term.
+    """
+    return (
+        math.sin((latitude_radians_2 - latitude_radians_1) / 2) ** 2
+        + math.cos(latitude_radians_1)
+        * math.cos(latitude_radians_2)
+        * math.sin((longitude_radians_2 - longitude_radians_1) / 2) ** 2
+    )
+
+
+def haversine_distance(
+    latitude_radians_1: float,
+    longitude_radians_1: float,
+    latitude_radians_2: float,
+    longitude_radians_2: float,
+) -> float:
+    """Calculate the great circle distance between two points.
+
+    The haversine formula is used (rather than the spherical law of cosines), since it
+    stays accurate for nearby points.
+
+    Args:
+        latitude_radians_1: The latitude (in radians) of the first point.
+        longitude_radians_1: The longitude (in radians) of the first point.
+        latitude_radians_2: The latitude (in radians) of the second point.
+        longitude_radians_2: The longitude (in radians) of the second point.
+
+    Returns:
+        The distance (in kilometers).
+    """
+    half_chord = get_half_chord(
+        latitude_radians_1, longitude_radians_1, latitude_radians_2, longitude_radians_2
+    )
+    return 2 * EARTH_RAIDUS_KM * math.asin(math.sqrt(min(half_chord, 1.0)))
+
+
+def get_nearest_positions(distances: Sequence[float], limit: int | None) -> list[int]:
+    """Get the positions of the smallest distances, from nearest to furthest.
+
+    Ties keep their original order (just like a stable sort). When a limit is given,
+    only that many positions are selected (without sorting every distance).
+
+    Args:
+        distances: A sequence of distances.
+        limit: The number of positions to return (all of them if None).
+
+    Returns:
+        A list of positions within the sequence.
+    """
+    if limit is not None and limit <= 0:
+        return []
+
+    if NUMPY_AVAILABLE:
+        values: Any = np.asarray(distances, dtype=np.float64)
+        positions = np.arange(len(values))
+        if limit is not None and limit < len(values):
+            # Partition around the limit-th smallest distance, keeping every tie so
+            # that the final selection matches a stable sort:
+            threshold = np.partition(values, limit - 1)[limit - 1]
+            positions = np.flatnonzero(values <= threshold)
+        ordered = positions[np.argsort(values[positions], kind="stable")]
+        return cast(list[int], ordered[:limit].tolist())
+
+    if limit is None:
+        return sorted(range(len(distances)), key=distances.__getitem__)
+    return heapq.nsmallest(limit, range(len(distances)), key=distances.__getitem__)
+
+
+@dataclass
+class BoundingBoxGroup:
+    """Define a bounding box that covers the bounding boxes of several points."""
+
+    nw_coordinate: GeoLocation
+    se_coordinate: GeoLocation
+
+    # The (position of) each point in the group, along with its bounding boxes that
+    # belong to the group:
+    members: dict[int, list[tuple[GeoLocation, GeoLocation]]]
+
+
+def group_bounding_boxes(
+    origins: Sequence[GeoLocation], distance_km: float, group_size_km: float
+) -> list[BoundingBoxGroup]:
+    """Group the bounding boxes of nearby points into shared bounding boxes.
+
+    Each bounding box (see GeoLocation.bounding_boxes) is assigned to the cell of a
+    grid (whose cells are group_size_km, or twice the distance, whichever is larger, in
+    each direction) that contains its middle; each group covers every box in a cell.
+
+    Args:
+        origins: The points.
+        distance_km: The distance (in kilometers) of each point's bounding boxes.
+        group_size_km: The minimum size (in kilometers) of the grid's cells.
+
+    Returns:
+        A list of BoundingBoxGroup objects.
+    """
+    cell_size_degrees = max(group_size_km, 2 * distance_km) / KILOMETERS_PER_DEGREE
+    cells: dict[tuple[int, int], BoundingBoxGroup] = {}
+
+    for position, origin in enumerate(origins):
+        for nw_coordinate, se_coordinate in origin.bounding_boxes(distance_km):
+            key = (
+                math.floor(
+                    (nw_coordinate.latitude_degrees + se_coordinate.latitude_degrees)
+                    / 2
+                    / cell_size_degrees
+                ),
+                math.floor(
+                    (nw_coordinate.longitude_degrees + se_coordinate.longitude_degrees)
+                    / 2
+                    / cell_size_degrees
+                ),
+            )
+
+            if (group := cells.get(key)) is None:
+                cells[key] = BoundingBoxGroup(
+                    nw_coordinate, se_coordinate, {position: []}
+                )
+                group = cells[key]
+            else:
+                group.nw_coordinate = GeoLocation.from_degrees(
+                    max(
+                        group.nw_coordinate.latitude_degrees,
+                        nw_coordinate.latitude_degrees,
+                    ),
+                    min(
+                        group.nw_coordinate.longitude_degrees,
+                        nw_coordinate.longitude_degrees,
+                    ),
+                )
+                group.se_coordinate = GeoLocation.from_degrees(
+                    min(
+                        group.se_coordinate.latitude_degrees,
+                        se_coordinate.latitude_degrees,
+                    ),
+                    max(
+                        group.se_coordinate.longitude_degrees,
+                        se_coordinate.longitude_degrees,
+                    ),
+                )
+
+            group.members.setdefault(position, []).append(
+                (nw_coordinate, se_coordinate)
+            )
+
+    return list(cells.values())
+
+
+def get_nearby_positions(  # pylint: disable=too-many-arguments,too-many-locals
+    origins: Sequence[GeoLocation],
+    boxes: Sequence[Sequence[tuple[GeoLocation, GeoLocation]]],
+    latitudes_degrees: Sequence[float],
+    longitudes_degrees: Sequence[float],
+    *,
+    distance_km: float | None = None,
+    limit: int | None = None,
+) -> list[list[tuple[int, float]]]:
+    """Get the points within the bounding boxes of each of several origins.
+
+    The distances between every origin and every point are calculated as a matrix (with
+    NumPy, if it is installed, a chunk of origins at a time).
+
+    Args:
+        origins: The origins.
+        boxes: The bounding boxes (NW and SE corners) of each origin.
+        latitudes_degrees: The latitudes (in degrees) of the points.
+        longitudes_degrees: The longitudes (in degrees) of the points.
+        distance_km: If provided, points further away (in kilometers) are dropped.
+        limit: The number of points to get for each origin (all of them if None).
+
+    Returns:
+        For each origin, the positions of the points (and their distances) within its
+        bounding boxes, from nearest to furthest.
+    """
+    results: list[list[tuple[int, float]]] = []
+
+    if not NUMPY_AVAILABLE:
+        for origin, origin_boxes in zip(origins, boxes):  # noqa: B905
+            distances = origin.distances_to(latitudes_degrees, longitudes_degrees)
+            positions = [
+                position
+                for position, (latitude, longitude) in enumerate(
+                    zip(latitudes_degrees, longitudes_degrees)  # noqa: B905
+                )
+                if any(
+                    se_coordinate.latitude_degrees
+                    <= latitude
+                    <= nw_coordinate.latitude_degrees
+                    and nw_coordinate.longitude_degrees
+                    <= longitude
+                    <= se_coordinate.longitude_degrees
+                    for nw_coordinate, se_coordinate in origin_boxes
+                )
+                and (distance_km is None or distances[position] <= distance_km)
+            ]
+            results.append(
+                [
+                    (positions[nearest], distances[positions[nearest]])
+                    for nearest in get_nearest_positions(
+                        [distances[position] for position in positions], limit
+                    )
+                ]
+            )
+        return results
+
+    latitudes = np.asarray(latitudes_degrees, dtype=np.float64)
+    longitudes = np.asarray(longitudes_degrees, dtype=np.float64)
+    latitudes_radians = np.radians(latitudes)
+    longitudes_radians = np.radians(longitudes)
+    chunk_size = max(1, DISTANCE_MATRIX_MAXIMUM_SIZE // max(len(latitudes), 1))
+
+    for start in range(0, len(origins), chunk_size):
+        chunk = origins[start : start + chunk_size]
+        origin_latitudes = np.array([origin.latitude_radians for origin in chunk])
+        origin_longitudes = np.array([origin.longitude_radians for origin in chunk])
+        half_chords = (
+            np.sin((latitudes_radians - origin_latitudes[:, np.newaxis]) / 2) ** 2
+            + np.cos(origin_latitudes)[:, np.newaxis]
+            * np.cos(latitudes_radians)
+            * np.sin((longitudes_radians - origin_longitudes[:, np.newaxis]) / 2) ** 2
+        )
+        matrix = 2 * EARTH_RAIDUS_KM * np.arcsin(np.sqrt(np.minimum(half_chords, 1)))
+
+        for distances, origin_boxes in zip(  # noqa: B905
+            matrix, boxes[start : start + chunk_size]
+        ):
+            mask = np.zeros(len(latitudes), dtype=bool)
+            for nw_coordinate, se_coordinate in origin_boxes:
+                mask |= (
+                    (latitudes >= se_coordinate.latitude_degrees)
+                    & (latitudes <= nw_coordinate.latitude_degrees)
+                    & (longitudes >= nw_coordinate.longitude_degrees)
+                    & (longitudes <= se_coordinate.longitude_degrees)
+                )
+            if distance_km is not None:
+                mask &= distances <= distance_km
+
+            positions = np.flatnonzero(mask)
+            nearest = positions[get_nearest_positions(distances[positions], limit)]
+            results.append(
+                list(
+                    zip(  # noqa: B905
+                        cast(list[int], nearest.tolist()),
+                        cast(list[float], distances[nearest].tolist()),
+                    )
+                )
+            )
+
+    return results
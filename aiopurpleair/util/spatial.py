@@ -0,0 +1,202 @@
+"""Define a spatial index for fast local radius and nearest-neighbor queries."""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Sequence
+
+from aiopurpleair.util.geo import EARTH_RAIDUS_KM, GeoLocation, get_nearest_positions
+
+DEFAULT_CELL_SIZE_DEGREES = 0.25
+
+# Half of the Earth's circumference (no two points are further apart than this):
+MAXIMUM_DISTANCE_KM = math.pi * EARTH_RAIDUS_KM
+
+
+class GridIndex:
+    """Define an index of coordinates bucketed into a latitude/longitude grid.
+
+    Queries only measure distances to the coordinates in the grid cells that overlap
+    the search radius, so their cost depends on how many coordinates are nearby rather
+    than on the size of the index.
+    """
+
+    __slots__ = (
+        "_cell_size",
+        "_cells",
+        "_columns",
+        "_latitudes",
+        "_longitude_cell_size",
+        "_longitudes",
+    )
+
+    def __init__(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        *,
+        cell_size_degrees: float = DEFAULT_CELL_SIZE_DEGREES,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            latitudes: The latitudes (in degrees) of the coordinates to index.
+            longitudes: The longitudes (in degrees) of the coordinates to index.
+            cell_size_degrees: The width and height of each grid cell (in degrees).
+
+        Raises:
+            ValueError: Raised on an invalid cell size.
+        """
+        if not 0 < cell_size_degrees <= 180:
+            raise ValueError("The cell size must be between 0 and 180 degrees")
+
+        self._cell_size = cell_size_degrees
+        self._columns = math.ceil(360 / cell_size_degrees)
+        # Columns are stretched slightly (if needed) so that they wrap around evenly:
+        self._longitude_cell_size = 360 / self._columns
+        self._latitudes = list(latitudes)
+        self._longitudes = list(longitudes)
+        self._cells: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+
+        for position, (latitude, longitude) in enumerate(
+            zip(self._latitudes, self._longitudes)  # noqa: B905
+        ):
+            self._cells[self._get_cell(latitude, longitude)].append(position)
+
+    def __len__(self) -> int:
+        """Return the number of indexed coordinates.
+
+        Returns:
+            The number of coordinates.
+        """
+        return len(self._latitudes)
+
+    def _get_cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        """Get the grid cell that contains a coordinate.
+
+        Args:
+            latitude: A latitude (in degrees).
+            longitude: A longitude (in degrees).
+
+        Returns:
+            The row and column of the cell.
+        """
+        return (
+            math.floor((latitude + 90) / self._cell_size),
+            math.floor((longitude + 180) / self._longitude_cell_size) % self._columns,
+        )
+
+    def _get_candidates(self, center: GeoLocation, distance_km: float) -> list[int]:
+        """Get the positions of every coordinate in the cells that a circle overlaps.
+
+        Args:
+            center: The center of the circle.
+            distance_km: The radius of the circle (in kilometers).
+
+        Returns:
+            A list of positions.
+        """
+        # The radius is padded ever so slightly to guard against rounding errors:
+        distance_degrees = math.degrees(distance_km / EARTH_RAIDUS_KM) * (1 + 1e-9)
+        minimum_latitude = center.latitude_degrees - distance_degrees
+        maximum_latitude = center.latitude_degrees + distance_degrees
+        first_row, _ = self._get_cell(max(minimum_latitude, -90), 0)
+        last_row, _ = self._get_cell(min(maximum_latitude, 90), 0)
+        rows = range(first_row, last_row + 1)
+
+        spread = math.sin(math.radians(distance_degrees)) / math.cos(
+            center.latitude_radians
+        )
+        if minimum_latitude <= -90 or maximum_latitude >= 90 or spread >= 1:
+            # The circle contains a pole, so it spans every longitude:
+            columns: Sequence[int] = range(self._columns)
+        else:
+            delta_longitude = math.degrees(math.asin(spread))
+            _, first_column = self._get_cell(
+                0, center.longitude_degrees - delta_longitude
+            )
+            _, last_column = self._get_cell(
+                0, center.longitude_degrees + delta_longitude
+            )
+            columns = [
+                (first_column + offset) % self._columns
+                for offset in range((last_column - first_column) % self._columns + 1)
+            ]
+
+        if len(rows) * len(columns) > len(self._cells):
+            # Large circles overlap more cells than actually contain coordinates, so
+            # it's faster to check every occupied cell:
+            column_set = set(columns)
+            return [
+                position
+                for (row, column), positions in self._cells.items()
+                if row in rows and column in column_set
+                for position in positions
+            ]
+
+        return [
+            position
+            for row in rows
+            for column in columns
+            for position in self._cells.get((row, column), ())
+        ]
+
+    def within(
+        self,
+        latitude: float,
+        longitude: float,
+        distance_km: float,
+        *,
+        limit: int | None = None,
+    ) -> list[tuple[int, float]]:
+        """Find the coordinates within a distance of a point.
+
+        Args:
+            latitude: The latitude (in degrees) of the point.
+            longitude: The longitude (in degrees) of the point.
+            distance_km: The search radius (in kilometers).
+            limit: The maximum number of coordinates to return.
+
+        Returns:
+            The positions of (and distances to) the matching coordinates, sorted from
+            nearest to furthest.
+        """
+        center = GeoLocation.from_degrees(latitude, longitude)
+        # Candidates are sorted so that ties are always broken by position:
+        candidates = sorted(self._get_candidates(center, distance_km))
+        distances = center.distances_to(
+            [self._latitudes[position] for position in candidates],
+            [self._longitudes[position] for position in candidates],
+        )
+
+        results = []
+        for index in get_nearest_positions(distances, limit):
+            if (distance := float(distances[index])) > distance_km:
+                break
+            results.append((candidates[index], distance))
+        return results
+
+    def nearest(
+        self, latitude: float, longitude: float, count: int
+    ) -> list[tuple[int, float]]:
+        """Find the coordinates nearest to a point.
+
+        Args:
+            latitude: The latitude (in degrees) of the point.
+            longitude: The longitude (in degrees) of the point.
+            count: The number of coordinates to return.
+
+        Returns:
+            The positions of (and distances to) the nearest coordinates, sorted from
+            nearest to furthest.
+        """
+        # Grow the search radius until it contains enough coordinates; since every
+        # coordinate outside of the radius is further away than every one inside of
+        # it, the nearest coordinates within the radius are the nearest overall:
+        distance_km = math.radians(self._cell_size) * EARTH_RAIDUS_KM
+        while True:
+            results = self.within(latitude, longitude, distance_km, limit=count)
+            if len(results) >= count or distance_km >= MAXIMUM_DISTANCE_KM:
+                return results
+            distance_km *= 2
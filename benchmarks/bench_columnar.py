@@ -0,0 +1,60 @@
+"""Compare the columnar and dict-of-models parse modes of GET /v1/sensors.
+
+Run with: python -m benchmarks.bench_columnar
+"""
+
+from __future__ import annotations
+
+import copy
+import gc
+import time
+import tracemalloc
+from typing import Any
+
+from aiopurpleair.models.columnar import GetSensorsColumnarResponse
+from aiopurpleair.models.sensors import GetSensorsResponse
+from benchmarks.payloads import NARROW_FIELDS, generate_sensors_payload
+
+SIZES = (1000, 10000, 50000)
+
+
+def measure(response_model: Any, payload: dict[str, Any]) -> tuple[float, int]:
+    """Measure the time and retained memory needed to parse a payload.
+
+    Args:
+        response_model: The response model to parse with.
+        payload: An API response payload.
+
+    Returns:
+        The parse time (in seconds) and the retained memory (in bytes).
+    """
+    payload = copy.deepcopy(payload)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = response_model.model_validate(payload)
+    elapsed = time.perf_counter() - start
+    # Drop the raw rows so that only what the response retains is counted:
+    payload.clear()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del response
+    return elapsed, retained
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'rows':>8} {'mode':>8} {'parse (s)':>10} {'memory (MiB)':>13}")
+    for size in SIZES:
+        payload = generate_sensors_payload(size, NARROW_FIELDS)
+        for name, response_model in (
+            ("models", GetSensorsResponse),
+            ("columnar", GetSensorsColumnarResponse),
+        ):
+            elapsed, retained = measure(response_model, payload)
+            print(f"{size:>8} {name:>8} {elapsed:>10.4f} {retained / 2**20:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare precompiled row decoders with generic SensorModel validation.
+
+Run with: python -m benchmarks.bench_decoder
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from aiopurpleair.const import SENSOR_FIELDS
+from aiopurpleair.models.sensors import SensorModel, get_sensor_row_decoder
+from benchmarks.payloads import NARROW_FIELDS, generate_sensors_payload
+
+NUM_SENSORS = 20000
+
+
+def measure(decode: Callable[[list[Any]], SensorModel], rows: list[list[Any]]) -> float:
+    """Measure the time needed to decode every row.
+
+    Args:
+        decode: The function that decodes a row.
+        rows: The rows to decode.
+
+    Returns:
+        The decode time (in seconds).
+    """
+    start = time.perf_counter()
+    for row in rows:
+        decode(row)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'fields':>8} {'generic (s)':>12} {'decoder (s)':>12} {'speedup':>8}")
+    for fields in (NARROW_FIELDS, sorted(SENSOR_FIELDS)):
+        payload = generate_sensors_payload(NUM_SENSORS, fields)
+        all_fields = payload["fields"]
+        decoder = get_sensor_row_decoder(tuple(all_fields))
+
+        generic = measure(
+            lambda row: SensorModel.model_validate(
+                dict(zip(all_fields, row))  # noqa: B023, B905
+            ),
+            payload["data"],
+        )
+        compiled = measure(decoder, payload["data"])
+        print(
+            f"{len(all_fields):>8} {generic:>12.4f} {compiled:>12.4f} "
+            f"{generic / compiled:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
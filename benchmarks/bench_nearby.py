@@ -0,0 +1,47 @@
+"""Measure how long it takes to rank sensors by their distance from a point.
+
+Run with: python -m benchmarks.bench_nearby
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aiopurpleair.endpoints.sensors import SensorsEndpoints
+from aiopurpleair.models.sensors import GetSensorsResponse
+from aiopurpleair.util.geo import GeoLocation
+from benchmarks.payloads import NARROW_FIELDS, generate_sensors_payload
+
+SIZES = (1000, 10000, 50000)
+
+LIMITS = (None, 5)
+
+
+async def async_main() -> None:
+    """Run the benchmark."""
+    # The endpoint manager isn't used to make any requests:
+    endpoints = SensorsEndpoints(None, None, None)  # type: ignore[arg-type]
+    center = GeoLocation.from_degrees(37.92122, -122.01889)
+
+    print(f"{'rows':>8} {'limit':>6} {'rank (s)':>10}")
+    for size in SIZES:
+        response = GetSensorsResponse.model_validate(
+            generate_sensors_payload(size, NARROW_FIELDS)
+        )
+        for limit in LIMITS:
+            start = time.perf_counter()
+            _ = await endpoints._async_get_sorted_results(  # pylint: disable=protected-access
+                response.data.values(), center, limit_results=limit
+            )
+            elapsed = time.perf_counter() - start
+            print(f"{size:>8} {str(limit):>6} {elapsed:>10.4f}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    asyncio.run(async_main())
+
+
+if __name__ == "__main__":
+    main()
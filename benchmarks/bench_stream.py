@@ -0,0 +1,88 @@
+"""Compare the peak memory of streamed and whole-response parsing of GET /v1/sensors.
+
+Run with: python -m benchmarks.bench_stream
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+
+from aiopurpleair.helpers.stream import DEFAULT_CHUNK_SIZE, async_iter_json_array_items
+from aiopurpleair.models.sensors import GetSensorsResponse, get_sensor_row_decoder
+from benchmarks.payloads import NARROW_FIELDS, generate_sensors_payload
+
+SIZES = (1000, 10000, 50000)
+
+
+async def async_iter_chunks(raw: bytes) -> AsyncIterator[bytes]:
+    """Iterate over a raw payload in chunks (like aiohttp's iter_chunked).
+
+    Args:
+        raw: The raw payload.
+
+    Yields:
+        Chunks of the payload.
+    """
+    for start in range(0, len(raw), DEFAULT_CHUNK_SIZE):
+        yield raw[start : start + DEFAULT_CHUNK_SIZE]
+
+
+async def async_parse_whole(raw: bytes) -> int:
+    """Parse a payload the way API.async_request does.
+
+    Args:
+        raw: The raw payload.
+
+    Returns:
+        The number of sensors.
+    """
+    response = GetSensorsResponse.model_validate(json.loads(raw))
+    return len(response.data)
+
+
+async def async_parse_streamed(raw: bytes) -> int:
+    """Parse a payload incrementally, handling one sensor at a time.
+
+    Args:
+        raw: The raw payload.
+
+    Returns:
+        The number of sensors.
+    """
+    metadata: dict[str, object] = {}
+    count = 0
+    async for row in async_iter_json_array_items(
+        async_iter_chunks(raw), "data", metadata
+    ):
+        _ = get_sensor_row_decoder(tuple(metadata["fields"]))(row)  # type: ignore
+        count += 1
+    return count
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'rows':>8} {'mode':>8} {'parse (s)':>10} {'peak (MiB)':>11}")
+    for size in SIZES:
+        raw = json.dumps(generate_sensors_payload(size, NARROW_FIELDS)).encode()
+        for name, parse in (
+            ("whole", async_parse_whole),
+            ("streamed", async_parse_streamed),
+        ):
+            gc.collect()
+            tracemalloc.start()
+            start = time.perf_counter()
+            count = asyncio.run(parse(raw))
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert count == size
+            print(f"{size:>8} {name:>8} {elapsed:>10.4f} {peak / 2**20:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Define synthetic PurpleAir payloads for benchmarks."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from aiopurpleair.helpers.model import get_field_types
+from aiopurpleair.models.sensors import SensorModel
+
+NARROW_FIELDS = ["name", "latitude", "longitude", "pm2.5"]
+
+SENSOR_FIELD_TYPES = get_field_types(SensorModel)
+
+TIMESTAMP = 1667503531
+
+
+def _generate_value(rng: random.Random, field: str) -> Any:
+    """Generate a plausible value for a sensor field.
+
+    Args:
+        rng: A random number generator.
+        field: A sensor field name.
+
+    Returns:
+        A raw API value.
+    """
+    _, field_type = SENSOR_FIELD_TYPES[field]
+
+    if field == "latitude":
+        return round(rng.uniform(-60, 70), 5)
+    if field == "longitude":
+        return round(rng.uniform(-180, 180), 5)
+    if field_type is datetime:
+        return TIMESTAMP - rng.randrange(86400 * 365)
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return rng.choice(list(field_type)).value
+    if field_type is bool:
+        return rng.random() < 0.1
+    if field_type is int:
+        return rng.randrange(1000)
+    if field_type is str:
+        return f"Sensor {rng.randrange(100000)}"
+    return round(rng.uniform(0, 100), 1)
+
+
+def generate_sensors_payload(
+    num_sensors: int, fields: list[str], *, seed: int = 0
+) -> dict[str, Any]:
+    """Generate a synthetic response payload for GET /v1/sensors.
+
+    Args:
+        num_sensors: The number of sensors (rows) to generate.
+        fields: The sensor data fields to include (sensor_index is always first).
+        seed: The random seed to use.
+
+    Returns:
+        An API response payload.
+    """
+    rng = random.Random(seed)
+    all_fields = [
+        "sensor_index",
+        *(field for field in fields if field != "sensor_index"),
+    ]
+
+    return {
+        "api_version": "V1.0.11-0.0.41",
+        "time_stamp": TIMESTAMP + 60,
+        "data_time_stamp": TIMESTAMP,
+        "max_age": 604800,
+        "firmware_default_version": "7.02",
+        "fields": all_fields,
+        "data": [
+            [sensor_index, *(_generate_value(rng, field) for field in all_fields[1:])]
+            for sensor_index in range(1, num_sensors + 1)
+        ],
+    }
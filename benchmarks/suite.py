@@ -0,0 +1,369 @@
+"""Run the benchmark suite, optionally comparing it against a stored baseline.
+
+Run with: python -m benchmarks.suite [--filter TEXT] [--save PATH] [--compare PATH]
+(or script/benchmark, which compares against benchmarks/baseline.json)
+
+Results are written as JSON with --save; a saved file can later be passed to --compare
+(which exits with a non-zero status if any benchmark got slower than the threshold).
+Baselines are only comparable on the same machine, so store one before making changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import cache, partial
+from pathlib import Path
+from typing import Any
+
+from aiopurpleair import API
+from aiopurpleair.const import SENSOR_FIELDS
+from aiopurpleair.endpoints.sensors import SensorsEndpoints
+from aiopurpleair.models.sensors import GetSensorsResponse, SensorModel
+from aiopurpleair.testing import FakePurpleAirServer, FakeServerSettings
+from aiopurpleair.util.geo import GeoLocation
+from benchmarks.payloads import NARROW_FIELDS, generate_sensors_payload
+
+BenchmarkFactory = Callable[
+    [], AbstractAsyncContextManager[Callable[[], Awaitable[Any]]]
+]
+
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.2
+
+FIELD_SETS = {"narrow": NARROW_FIELDS, "wide": sorted(SENSOR_FIELDS)}
+
+SIZES = (1000, 10000, 50000)
+
+# The number of calls per round of the benchmarks of cheap operations:
+CALLS_PER_ROUND = 10000
+
+CENTER = GeoLocation.from_degrees(37.92122, -122.01889)
+
+BENCHMARKS: dict[str, BenchmarkFactory] = {}
+
+
+@cache
+def get_payload(num_sensors: int, field_set: str) -> dict[str, Any]:
+    """Get a synthetic GET /v1/sensors payload.
+
+    Payloads are generated once at the largest size and sliced (rows are generated in
+    order from the same seed, so a slice is identical to a smaller payload).
+
+    Args:
+        num_sensors: The number of sensors (rows).
+        field_set: The name of a field set.
+
+    Returns:
+        An API response payload.
+    """
+    if num_sensors == SIZES[-1]:
+        return generate_sensors_payload(num_sensors, FIELD_SETS[field_set])
+    payload = get_payload(SIZES[-1], field_set)
+    return {**payload, "data": payload["data"][:num_sensors]}
+
+
+@asynccontextmanager
+async def parse_sensors(
+    num_sensors: int, field_set: str
+) -> AsyncIterator[Callable[[], Awaitable[Any]]]:
+    """Benchmark parsing a GET /v1/sensors response.
+
+    Args:
+        num_sensors: The number of sensors in the response.
+        field_set: The name of the field set of the response.
+
+    Yields:
+        A function that runs one round.
+    """
+    payload = get_payload(num_sensors, field_set)
+
+    async def run() -> None:
+        """Run one round."""
+        # Validation replaces the payload's data, so each round gets its own copy:
+        GetSensorsResponse.model_validate({**payload})
+
+    yield run
+
+
+@asynccontextmanager
+async def build_sensor_models() -> AsyncIterator[Callable[[], Awaitable[Any]]]:
+    """Benchmark building SensorModel objects from every field.
+
+    Yields:
+        A function that runs one round.
+    """
+    payload = get_payload(SIZES[0], "wide")
+    fields = payload["fields"]
+    sensors = [dict(zip(fields, row)) for row in payload["data"]]  # noqa: B905
+
+    async def run() -> None:
+        """Run one round."""
+        for sensor in sensors:
+            SensorModel.model_validate(sensor)
+
+    yield run
+
+
+@asynccontextmanager
+async def get_bounding_boxes() -> AsyncIterator[Callable[[], Awaitable[Any]]]:
+    """Benchmark GeoLocation.bounding_box.
+
+    Yields:
+        A function that runs one round.
+    """
+
+    async def run() -> None:
+        """Run one round."""
+        for _ in range(CALLS_PER_ROUND):
+            CENTER.bounding_box(10)
+
+    yield run
+
+
+@asynccontextmanager
+async def get_distances() -> AsyncIterator[Callable[[], Awaitable[Any]]]:
+    """Benchmark GeoLocation.distance_to.
+
+    Yields:
+        A function that runs one round.
+    """
+    endpoint = GeoLocation.from_degrees(37.7749, -122.4194)
+
+    async def run() -> None:
+        """Run one round."""
+        for _ in range(CALLS_PER_ROUND):
+            CENTER.distance_to(endpoint)
+
+    yield run
+
+
+@asynccontextmanager
+async def sort_nearby_sensors(
+    num_sensors: int, distance_km: float | None = None
+) -> AsyncIterator[Callable[[], Awaitable[Any]]]:
+    """Benchmark ranking sensors by their distance from a point.
+
+    Args:
+        num_sensors: The number of sensors to rank.
+        distance_km: If provided, only the sensors within this distance are kept.
+
+    Yields:
+        A function that runs one round.
+    """
+    # The endpoint manager isn't used to make any requests:
+    endpoints = SensorsEndpoints(None, None, None)  # type: ignore[arg-type]
+    response = GetSensorsResponse.model_validate({**get_payload(num_sensors, "narrow")})
+
+    async def run() -> None:
+        """Run one round."""
+        await endpoints._async_get_sorted_results(  # pylint: disable=protected-access
+            response.data.values(),
+            CENTER,
+            limit_results=None,
+            distance_km=distance_km,
+        )
+
+    yield run
+
+
+@asynccontextmanager
+async def get_nearby_sensors(
+    num_sensors: int,
+) -> AsyncIterator[Callable[[], Awaitable[Any]]]:
+    """Benchmark async_get_nearby_sensors against a local fake server.
+
+    Args:
+        num_sensors: The number of sensors the server has.
+
+    Yields:
+        A function that runs one round.
+    """
+    settings = FakeServerSettings(num_sensors=num_sensors)
+    async with FakePurpleAirServer(settings) as server:
+        async with API("benchmark", base_url=server.base_url) as api:
+
+            async def run() -> None:
+                """Run one round."""
+                await api.sensors.async_get_nearby_sensors(
+                    NARROW_FIELDS,
+                    CENTER.latitude_degrees,
+                    CENTER.longitude_degrees,
+                    500,
+                )
+
+            yield run
+
+
+@asynccontextmanager
+async def get_nearby_sensors_many(
+    num_centers: int,
+) -> AsyncIterator[Callable[[], Awaitable[Any]]]:
+    """Benchmark async_get_nearby_sensors_many against a local fake server.
+
+    Args:
+        num_centers: The number of "search centers" (spread across the US).
+
+    Yields:
+        A function that runs one round.
+    """
+    rng = random.Random(0)
+    centers = [
+        (rng.uniform(30, 45), rng.uniform(-120, -80)) for _ in range(num_centers)
+    ]
+
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=10000)) as server:
+        async with API("benchmark", base_url=server.base_url) as api:
+
+            async def run() -> None:
+                """Run one round."""
+                await api.sensors.async_get_nearby_sensors_many(
+                    NARROW_FIELDS, centers, 100, limit_results=3
+                )
+
+            yield run
+
+
+for _size in SIZES:
+    for _field_set in FIELD_SETS:
+        BENCHMARKS[f"parse.{_field_set}.{_size}"] = partial(
+            parse_sensors, _size, _field_set
+        )
+BENCHMARKS["model.sensor.1000"] = build_sensor_models
+BENCHMARKS["geo.bounding_box"] = get_bounding_boxes
+BENCHMARKS["geo.distance_to"] = get_distances
+for _size in SIZES:
+    BENCHMARKS[f"nearby.sort.{_size}"] = partial(sort_nearby_sensors, _size)
+    BENCHMARKS[f"nearby.within.{_size}"] = partial(sort_nearby_sensors, _size, 2000)
+BENCHMARKS["nearby.end_to_end.10000"] = partial(get_nearby_sensors, 10000)
+BENCHMARKS["nearby.many.1000"] = partial(get_nearby_sensors_many, 1000)
+
+
+async def async_measure(factory: BenchmarkFactory, rounds: int) -> dict[str, Any]:
+    """Measure a benchmark.
+
+    Args:
+        factory: The benchmark to measure.
+        rounds: The number of measured rounds (after an unmeasured warm-up round).
+
+    Returns:
+        Timing statistics (in seconds).
+    """
+    async with factory() as run:
+        await run()
+
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await run()
+            timings.append(time.perf_counter() - start)
+
+    return {
+        "rounds": rounds,
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "max": max(timings),
+    }
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Compare results with a baseline.
+
+    Args:
+        results: The results of this run.
+        baseline: The results of the baseline run.
+        threshold: The fraction by which a benchmark's fastest round may slow down
+            before it's a regression.
+
+    Returns:
+        The names of the benchmarks that regressed.
+    """
+    regressions = []
+
+    # The fastest round is compared, since it's the least affected by noise:
+    print(f"{'benchmark':<28} {'baseline (s)':>13} {'min (s)':>11} {'change':>8}")
+    for name, result in results.items():
+        if (previous := baseline.get(name)) is None:
+            print(f"{name:<28} {'-':>13} {result['min']:>11.5f}")
+            continue
+
+        change = result["min"] / previous["min"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<28} {previous['min']:>13.5f} {result['min']:>11.5f} "
+            f"{change:>+8.1%}{flag}"
+        )
+
+    return regressions
+
+
+async def async_main() -> int:
+    """Run the benchmark suite.
+
+    Returns:
+        The exit status.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run matching benchmarks")
+    parser.add_argument("--rounds", default=DEFAULT_ROUNDS, type=int)
+    parser.add_argument("--save", type=Path, help="write the results to a JSON file")
+    parser.add_argument("--compare", type=Path, help="compare with a saved JSON file")
+    parser.add_argument(
+        "--threshold",
+        default=DEFAULT_THRESHOLD,
+        type=float,
+        help="the slowdown (as a fraction) that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        results[name] = await async_measure(factory, args.rounds)
+        print(f"{name:<28} {results[name]['median']:>11.5f}s", file=sys.stderr)
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare(results, baseline["results"], args.threshold):
+            return 1
+
+    return 0
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    sys.exit(asyncio.run(async_main()))
+
+
+if __name__ == "__main__":
+    main()
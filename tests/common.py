@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import importlib.util
 import os
+import sys
+from types import ModuleType
+
+import pytest
 
 TEST_API_KEY = "abcde12345"
 
@@ -19,3 +24,29 @@ def load_fixture(filename: str) -> str:
     path = os.path.join(os.path.dirname(__file__), "fixtures", filename)
     with open(path, encoding="utf-8") as fptr:
         return fptr.read()
+
+
+def import_module_without(
+    monkeypatch: pytest.MonkeyPatch, name: str, *missing: str
+) -> ModuleType:
+    """Import a fresh copy of a module as if some of its dependencies weren't installed.
+
+    The copy isn't registered in sys.modules, so the module everything else uses is
+    left untouched.
+
+    Args:
+        monkeypatch: A pytest MonkeyPatch object.
+        name: The name of the module to import.
+        *missing: The names of the modules that should appear to be missing.
+
+    Returns:
+        The fresh copy of the module.
+    """
+    for missing_name in missing:
+        monkeypatch.setitem(sys.modules, missing_name, None)
+
+    spec = importlib.util.find_spec(name)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
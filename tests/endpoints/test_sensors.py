@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import random
 from datetime import datetime
+from typing import Any, cast
 
 import aiohttp
 import pytest
@@ -12,8 +15,11 @@ from aresponses import ResponsesMockServer
 from aiopurpleair import API
 from aiopurpleair.const import ChannelFlag, ChannelState, LocationType
 from aiopurpleair.endpoints.sensors import NearbySensorResult
-from aiopurpleair.errors import InvalidRequestError
+from aiopurpleair.errors import InvalidRequestError, NotFoundError, RequestError
+from aiopurpleair.helpers.batcher import BatchSettings, BatchStats
 from aiopurpleair.models.sensors import SensorModel
+from aiopurpleair.testing import FakePurpleAirServer, FakeServerSettings
+from aiopurpleair.util.geo import GeoLocation
 from tests.common import TEST_API_KEY, load_fixture
 
 
@@ -100,15 +106,283 @@ async def test_get_nearby_sensors(
     )
 
     async with aiohttp.ClientSession() as session:
-        api = API(TEST_API_KEY, session=session)
-        sensors = await api.sensors.async_get_nearby_sensors(
-            ["name", "latitude", "longitude"],
-            37.92122,
-            -122.01889,
-            10,
-            limit_results=limit_results,
+        async with API(TEST_API_KEY, session=session) as api:
+            sensors = await api.sensors.async_get_nearby_sensors(
+                ["name", "latitude", "longitude"],
+                37.92122,
+                -122.01889,
+                10,
+                limit_results=limit_results,
+            )
+            assert [result.sensor for result in sensors] == [
+                result.sensor for result in output
+            ]
+            assert [result.distance for result in sensors] == pytest.approx(
+                [result.distance for result in output]
+            )
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "within_radius,limit_results,sensor_indices",
+    [
+        (False, None, [131077, 131079, 131083, 131075]),
+        (True, None, [131077, 131079]),
+        (True, 1, [131077]),
+        (True, 5, [131077, 131079]),
+    ],
+)
+async def test_get_nearby_sensors_within_radius(
+    aresponses: ResponsesMockServer,
+    within_radius: bool,
+    limit_results: int | None,
+    sensor_indices: list[int],
+) -> None:
+    """Test only getting the sensors within the radius around a latitude/longitude.
+
+    Args:
+        aresponses: An aresponses server.
+        within_radius: Whether to only get sensors within the radius.
+        limit_results: An optional limit.
+        sensor_indices: The expected sensor indices.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_sensors_response.json")), status=200
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            sensors = await api.sensors.async_get_nearby_sensors(
+                ["name", "latitude", "longitude"],
+                37.92122,
+                -122.01889,
+                50,
+                limit_results=limit_results,
+                within_radius=within_radius,
+            )
+            assert [result.sensor.sensor_index for result in sensors] == sensor_indices
+            assert all(result.distance <= 50 for result in sensors) is within_radius
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("longitude", [179.5, -179.5])
+async def test_get_nearby_sensors_antimeridian(longitude: float) -> None:
+    """Test getting nearby sensors around a point near the antimeridian.
+
+    Args:
+        longitude: The longitude of the "search center."
+    """
+    center = GeoLocation.from_degrees(-17.7, longitude)
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=5000)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            sensors = await api.sensors.async_get_nearby_sensors(
+                ["name"], center.latitude_degrees, center.longitude_degrees, 2000
+            )
+            everything = await api.sensors.async_get_sensors(["latitude", "longitude"])
+        # One request is made for each side of the antimeridian (plus the last one):
+        assert server.stats.requests == 3
+
+    expected = set()
+    for sensor in everything.data.values():
+        assert sensor.latitude is not None
+        assert sensor.longitude is not None
+        if any(
+            se_coordinate.latitude_degrees
+            <= sensor.latitude
+            <= nw_coordinate.latitude_degrees
+            and nw_coordinate.longitude_degrees
+            <= sensor.longitude
+            <= se_coordinate.longitude_degrees
+            for nw_coordinate, se_coordinate in center.bounding_boxes(2000)
+        ):
+            expected.add(sensor.sensor_index)
+    assert {result.sensor.sensor_index for result in sensors} == expected
+    # Sensors on both sides of the antimeridian are found:
+    assert {cast(float, result.sensor.longitude) > 0 for result in sensors} == {
+        True,
+        False,
+    }
+    assert [result.distance for result in sensors] == sorted(
+        result.distance for result in sensors
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "limit_results,within_radius",
+    [(None, False), (3, False), (None, True), (3, True)],
+)
+async def test_get_nearby_sensors_many(
+    limit_results: int | None, within_radius: bool
+) -> None:
+    """Test getting sensors near many coordinate pairs at once.
+
+    Args:
+        limit_results: An optional limit.
+        within_radius: Whether to only get sensors within the radius.
+    """
+    rng = random.Random(0)
+    centers = [(rng.uniform(30, 45), rng.uniform(-120, -80)) for _ in range(50)] + [
+        (-17.7, 179.5),
+        (-17.7, -179.5),
+    ]
+
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=20000)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            results = await api.sensors.async_get_nearby_sensors_many(
+                ["name"],
+                centers,
+                300,
+                group_size_km=1000,
+                limit_results=limit_results,
+                within_radius=within_radius,
+            )
+            # The centers share a handful of requests:
+            assert server.stats.requests < 20
+
+            for (latitude, longitude), center_results in zip(  # noqa: B905
+                centers, results
+            ):
+                expected = await api.sensors.async_get_nearby_sensors(
+                    ["name"],
+                    latitude,
+                    longitude,
+                    300,
+                    limit_results=limit_results,
+                    within_radius=within_radius,
+                )
+                assert [result.sensor for result in center_results] == [
+                    result.sensor for result in expected
+                ]
+                assert [result.distance for result in center_results] == (
+                    pytest.approx([result.distance for result in expected])
+                )
+
+    assert sum(len(center_results) for center_results in results) > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "latitude,longitude,k,maximum_distance_km,num_results",
+    [
+        (37.92122, -122.01889, 3, 2000, 3),
+        (-17.7, 179.99, 10, 2000, 10),
+        (-45.0, -140.0, 5, 2000, 5),
+        (-45.0, -140.0, 5, 50, 0),
+        (37.92122, -122.01889, 50, 1000, 14),
+        (37.92122, -122.01889, 0, 2000, 0),
+    ],
+)
+async def test_get_k_nearest_sensors(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    latitude: float,
+    longitude: float,
+    k: int,
+    maximum_distance_km: float,
+    num_results: int,
+) -> None:
+    """Test getting the k sensors nearest to a latitude/longitude.
+
+    Args:
+        latitude: The latitude of the "search center."
+        longitude: The longitude of the "search center."
+        k: The number of sensors to get.
+        maximum_distance_km: The radius beyond which the search stops.
+        num_results: The expected number of results.
+    """
+    center = GeoLocation.from_degrees(latitude, longitude)
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=2000)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            sensors = await api.sensors.async_get_k_nearest_sensors(
+                ["name"],
+                latitude,
+                longitude,
+                k,
+                maximum_distance_km=maximum_distance_km,
+            )
+            everything = await api.sensors.async_get_sensors(["latitude", "longitude"])
+
+    all_sensors = list(everything.data.values())
+    distances = center.distances_to(
+        [cast(float, sensor.latitude) for sensor in all_sensors],
+        [cast(float, sensor.longitude) for sensor in all_sensors],
+    )
+    expected = sorted(
+        (
+            (float(distance), sensor.sensor_index)
+            for sensor, distance in zip(all_sensors, distances)  # noqa: B905
+            if distance <= maximum_distance_km
         )
-        assert sensors == output
+    )[:k]
+
+    assert len(sensors) == num_results
+    assert [result.sensor.sensor_index for result in sensors] == [
+        sensor_index for _, sensor_index in expected
+    ]
+    assert [result.distance for result in sensors] == pytest.approx(
+        [distance for distance, _ in expected]
+    )
+    # Only the requested fields are requested for the results:
+    assert all(
+        result.sensor.name is not None and result.sensor.pm2_5 is None
+        for result in sensors
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_k_nearest_sensors_disappeared(
+    aresponses: ResponsesMockServer,
+) -> None:
+    """Test that a sensor that disappears after the search is skipped.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    response = json.loads(load_fixture("get_sensors_response.json"))
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(
+            {
+                **response,
+                "fields": ["sensor_index", "latitude", "longitude"],
+                "data": [
+                    [131077, 37.93273, -122.03972],
+                    [131079, 37.75315, -122.44364],
+                ],
+            },
+            status=200,
+        ),
+    )
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(
+            {
+                **response,
+                "fields": ["sensor_index", "name", "latitude", "longitude"],
+                "data": [[131079, "BRSKBV-outside", 37.75315, -122.44364]],
+            },
+            status=200,
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            sensors = await api.sensors.async_get_k_nearest_sensors(
+                ["name"], 37.92122, -122.01889, 2, initial_distance_km=50
+            )
+            assert [result.sensor.sensor_index for result in sensors] == [131079]
 
     aresponses.assert_plan_strictly_followed()
 
@@ -132,132 +406,140 @@ async def test_get_sensor(  # pylint: disable=too-many-statements
     )
 
     async with aiohttp.ClientSession() as session:
-        api = API(TEST_API_KEY, session=session)
-        response = await api.sensors.async_get_sensor(12345)
-        assert response.api_version == "V1.0.11-0.0.41"
-        assert response.timestamp_utc == datetime(2022, 11, 5, 16, 37, 3)
-        assert response.data_timestamp_utc == datetime(2022, 11, 5, 16, 36, 21)
-        assert response.sensor.sensor_index == 131075
-        assert response.sensor.altitude == 569
-        assert response.sensor.analog_input == 0.03
-        assert response.sensor.channel_flags == ChannelFlag.NORMAL
-        assert response.sensor.channel_flags_auto == ChannelFlag.NORMAL
-        assert response.sensor.channel_flags_manual == ChannelFlag.NORMAL
-        assert response.sensor.channel_state == ChannelState.PM_A_PM_B
-        assert response.sensor.confidence == 100
-        assert response.sensor.confidence_auto == 100
-        assert response.sensor.confidence_manual == 100
-        assert response.sensor.date_created_utc == datetime(2021, 9, 29, 22, 46, 14)
-        assert response.sensor.firmware_version == "7.02"
-        assert response.sensor.hardware == "2.0+BME280+PMSX003-B+PMSX003-A"
-        assert response.sensor.humidity == 33
-        assert response.sensor.humidity_a == 33
-        assert response.sensor.icon == 0
-        assert response.sensor.is_owner is False
-        assert response.sensor.last_modified_utc == datetime(2021, 10, 30, 22, 27, 9)
-        assert response.sensor.last_seen_utc == datetime(2022, 11, 5, 16, 36, 2)
-        assert response.sensor.latitude == 33.51511
-        assert response.sensor.led_brightness == 35
-        assert response.sensor.location_type == LocationType.OUTSIDE
-        assert response.sensor.longitude == -117.67972
-        assert response.sensor.memory == 16008
-        assert response.sensor.model == "PA-II"
-        assert response.sensor.name == "Mariners Bluff"
-        assert response.sensor.pa_latency == 992
-        assert response.sensor.pm0_3_um_count == 75
-        assert response.sensor.pm0_3_um_count_a == 65
-        assert response.sensor.pm0_3_um_count_b == 86
-        assert response.sensor.pm0_5_um_count == 65
-        assert response.sensor.pm0_5_um_count_a == 58
-        assert response.sensor.pm0_5_um_count_b == 73
-        assert response.sensor.pm10_0_cf_1_a == 0.0
-        assert response.sensor.pm10_0_cf_1_b == 0.0
-        assert response.sensor.pm10_0 == 0.0
-        assert response.sensor.pm10_0_a == 0.0
-        assert response.sensor.pm10_0_atm == 0.0
-        assert response.sensor.pm10_0_atm_a == 0.0
-        assert response.sensor.pm10_0_atm_b == 0.0
-        assert response.sensor.pm10_0_b == 0.0
-        assert response.sensor.pm10_0_cf_1 == 0.0
-        assert response.sensor.pm10_0_um_count == 0
-        assert response.sensor.pm10_0_um_count_a == 0
-        assert response.sensor.pm10_0_um_count_b == 0
-        assert response.sensor.pm1_0 == 0.0
-        assert response.sensor.pm1_0_a == 0.0
-        assert response.sensor.pm1_0_atm == 0.0
-        assert response.sensor.pm1_0_atm_a == 0.0
-        assert response.sensor.pm1_0_atm_b == 0.0
-        assert response.sensor.pm1_0_b == 0.0
-        assert response.sensor.pm1_0_cf_1 == 0.0
-        assert response.sensor.pm1_0_cf_1_a == 0.0
-        assert response.sensor.pm1_0_cf_1_b == 0.0
-        assert response.sensor.pm1_0_um_count == 0
-        assert response.sensor.pm1_0_um_count_a == 0
-        assert response.sensor.pm1_0_um_count_b == 0
-        assert response.sensor.pm2_5 == 0.0
-        assert response.sensor.pm2_5_a == 0.0
-        assert response.sensor.pm2_5_alt == 0.4
-        assert response.sensor.pm2_5_alt_a == 0.3
-        assert response.sensor.pm2_5_alt_b == 0.4
-        assert response.sensor.pm2_5_atm == 0.0
-        assert response.sensor.pm2_5_atm_a == 0.0
-        assert response.sensor.pm2_5_atm_b == 0.0
-        assert response.sensor.pm2_5_b == 0.0
-        assert response.sensor.pm2_5_cf_1 == 0.0
-        assert response.sensor.pm2_5_cf_1_a == 0.0
-        assert response.sensor.pm2_5_cf_1_b == 0.0
-        assert response.sensor.pm2_5_um_count == 0
-        assert response.sensor.pm2_5_um_count_a == 0
-        assert response.sensor.pm2_5_um_count_b == 0
-        assert response.sensor.pm5_0_um_count == 0
-        assert response.sensor.pm5_0_um_count_a == 0
-        assert response.sensor.pm5_0_um_count_b == 0
-        assert response.sensor.position_rating == 5
-        assert response.sensor.pressure == 1001.66
-        assert response.sensor.pressure_a == 1001.66
-        assert response.sensor.primary_id_a == 1522282
-        assert response.sensor.primary_id_b == 1522284
-        assert response.sensor.primary_key_a == "FVXH9TQTQGG2CHEY"
-        assert response.sensor.primary_key_b == "31ZHIMYRBK62KPY1"
-        assert response.sensor.private is False
-        assert response.sensor.rssi == -67
-        assert response.sensor.secondary_id_a == 1522283
-        assert response.sensor.secondary_id_b == 1522285
-        assert response.sensor.secondary_key_a == "UVKQCKBKJATTQGCX"
-        assert response.sensor.secondary_key_b == "DT8UOXHFJS1JDONG"
-        assert response.sensor.temperature == 69
-        assert response.sensor.temperature_a == 69
-        assert response.sensor.uptime == 15682
-
-        assert response.sensor.stats
-        assert response.sensor.stats.pm2_5 == 0.0
-        assert response.sensor.stats.pm2_5_10minute == 0.2
-        assert response.sensor.stats.pm2_5_30minute == 1.0
-        assert response.sensor.stats.pm2_5_60minute == 1.2
-        assert response.sensor.stats.pm2_5_6hour == 1.2
-        assert response.sensor.stats.pm2_5_24hour == 1.8
-        assert response.sensor.stats.pm2_5_1week == 5.8
-        assert response.sensor.stats.timestamp_utc == datetime(2022, 11, 5, 16, 36, 2)
-
-        assert response.sensor.stats_a
-        assert response.sensor.stats_a.pm2_5 == 0.0
-        assert response.sensor.stats_a.pm2_5_10minute == 0.1
-        assert response.sensor.stats_a.pm2_5_30minute == 0.9
-        assert response.sensor.stats_a.pm2_5_60minute == 1.0
-        assert response.sensor.stats_a.pm2_5_6hour == 1.0
-        assert response.sensor.stats_a.pm2_5_24hour == 1.4
-        assert response.sensor.stats_a.pm2_5_1week == 4.8
-        assert response.sensor.stats_a.timestamp_utc == datetime(2022, 11, 5, 16, 36, 2)
-
-        assert response.sensor.stats_b
-        assert response.sensor.stats_b.pm2_5 == 0.0
-        assert response.sensor.stats_b.pm2_5_10minute == 0.2
-        assert response.sensor.stats_b.pm2_5_30minute == 1.2
-        assert response.sensor.stats_b.pm2_5_60minute == 1.3
-        assert response.sensor.stats_b.pm2_5_6hour == 1.5
-        assert response.sensor.stats_b.pm2_5_24hour == 2.2
-        assert response.sensor.stats_b.pm2_5_1week == 6.7
-        assert response.sensor.stats_b.timestamp_utc == datetime(2022, 11, 5, 16, 36, 2)
+        async with API(TEST_API_KEY, session=session) as api:
+            response = await api.sensors.async_get_sensor(12345)
+            assert response.api_version == "V1.0.11-0.0.41"
+            assert response.timestamp_utc == datetime(2022, 11, 5, 16, 37, 3)
+            assert response.data_timestamp_utc == datetime(2022, 11, 5, 16, 36, 21)
+            assert response.sensor.sensor_index == 131075
+            assert response.sensor.altitude == 569
+            assert response.sensor.analog_input == 0.03
+            assert response.sensor.channel_flags == ChannelFlag.NORMAL
+            assert response.sensor.channel_flags_auto == ChannelFlag.NORMAL
+            assert response.sensor.channel_flags_manual == ChannelFlag.NORMAL
+            assert response.sensor.channel_state == ChannelState.PM_A_PM_B
+            assert response.sensor.confidence == 100
+            assert response.sensor.confidence_auto == 100
+            assert response.sensor.confidence_manual == 100
+            assert response.sensor.date_created_utc == datetime(2021, 9, 29, 22, 46, 14)
+            assert response.sensor.firmware_version == "7.02"
+            assert response.sensor.hardware == "2.0+BME280+PMSX003-B+PMSX003-A"
+            assert response.sensor.humidity == 33
+            assert response.sensor.humidity_a == 33
+            assert response.sensor.icon == 0
+            assert response.sensor.is_owner is False
+            assert response.sensor.last_modified_utc == datetime(
+                2021, 10, 30, 22, 27, 9
+            )
+            assert response.sensor.last_seen_utc == datetime(2022, 11, 5, 16, 36, 2)
+            assert response.sensor.latitude == 33.51511
+            assert response.sensor.led_brightness == 35
+            assert response.sensor.location_type == LocationType.OUTSIDE
+            assert response.sensor.longitude == -117.67972
+            assert response.sensor.memory == 16008
+            assert response.sensor.model == "PA-II"
+            assert response.sensor.name == "Mariners Bluff"
+            assert response.sensor.pa_latency == 992
+            assert response.sensor.pm0_3_um_count == 75
+            assert response.sensor.pm0_3_um_count_a == 65
+            assert response.sensor.pm0_3_um_count_b == 86
+            assert response.sensor.pm0_5_um_count == 65
+            assert response.sensor.pm0_5_um_count_a == 58
+            assert response.sensor.pm0_5_um_count_b == 73
+            assert response.sensor.pm10_0_cf_1_a == 0.0
+            assert response.sensor.pm10_0_cf_1_b == 0.0
+            assert response.sensor.pm10_0 == 0.0
+            assert response.sensor.pm10_0_a == 0.0
+            assert response.sensor.pm10_0_atm == 0.0
+            assert response.sensor.pm10_0_atm_a == 0.0
+            assert response.sensor.pm10_0_atm_b == 0.0
+            assert response.sensor.pm10_0_b == 0.0
+            assert response.sensor.pm10_0_cf_1 == 0.0
+            assert response.sensor.pm10_0_um_count == 0
+            assert response.sensor.pm10_0_um_count_a == 0
+            assert response.sensor.pm10_0_um_count_b == 0
+            assert response.sensor.pm1_0 == 0.0
+            assert response.sensor.pm1_0_a == 0.0
+            assert response.sensor.pm1_0_atm == 0.0
+            assert response.sensor.pm1_0_atm_a == 0.0
+            assert response.sensor.pm1_0_atm_b == 0.0
+            assert response.sensor.pm1_0_b == 0.0
+            assert response.sensor.pm1_0_cf_1 == 0.0
+            assert response.sensor.pm1_0_cf_1_a == 0.0
+            assert response.sensor.pm1_0_cf_1_b == 0.0
+            assert response.sensor.pm1_0_um_count == 0
+            assert response.sensor.pm1_0_um_count_a == 0
+            assert response.sensor.pm1_0_um_count_b == 0
+            assert response.sensor.pm2_5 == 0.0
+            assert response.sensor.pm2_5_a == 0.0
+            assert response.sensor.pm2_5_alt == 0.4
+            assert response.sensor.pm2_5_alt_a == 0.3
+            assert response.sensor.pm2_5_alt_b == 0.4
+            assert response.sensor.pm2_5_atm == 0.0
+            assert response.sensor.pm2_5_atm_a == 0.0
+            assert response.sensor.pm2_5_atm_b == 0.0
+            assert response.sensor.pm2_5_b == 0.0
+            assert response.sensor.pm2_5_cf_1 == 0.0
+            assert response.sensor.pm2_5_cf_1_a == 0.0
+            assert response.sensor.pm2_5_cf_1_b == 0.0
+            assert response.sensor.pm2_5_um_count == 0
+            assert response.sensor.pm2_5_um_count_a == 0
+            assert response.sensor.pm2_5_um_count_b == 0
+            assert response.sensor.pm5_0_um_count == 0
+            assert response.sensor.pm5_0_um_count_a == 0
+            assert response.sensor.pm5_0_um_count_b == 0
+            assert response.sensor.position_rating == 5
+            assert response.sensor.pressure == 1001.66
+            assert response.sensor.pressure_a == 1001.66
+            assert response.sensor.primary_id_a == 1522282
+            assert response.sensor.primary_id_b == 1522284
+            assert response.sensor.primary_key_a == "FVXH9TQTQGG2CHEY"
+            assert response.sensor.primary_key_b == "31ZHIMYRBK62KPY1"
+            assert response.sensor.private is False
+            assert response.sensor.rssi == -67
+            assert response.sensor.secondary_id_a == 1522283
+            assert response.sensor.secondary_id_b == 1522285
+            assert response.sensor.secondary_key_a == "UVKQCKBKJATTQGCX"
+            assert response.sensor.secondary_key_b == "DT8UOXHFJS1JDONG"
+            assert response.sensor.temperature == 69
+            assert response.sensor.temperature_a == 69
+            assert response.sensor.uptime == 15682
+
+            assert response.sensor.stats
+            assert response.sensor.stats.pm2_5 == 0.0
+            assert response.sensor.stats.pm2_5_10minute == 0.2
+            assert response.sensor.stats.pm2_5_30minute == 1.0
+            assert response.sensor.stats.pm2_5_60minute == 1.2
+            assert response.sensor.stats.pm2_5_6hour == 1.2
+            assert response.sensor.stats.pm2_5_24hour == 1.8
+            assert response.sensor.stats.pm2_5_1week == 5.8
+            assert response.sensor.stats.timestamp_utc == datetime(
+                2022, 11, 5, 16, 36, 2
+            )
+
+            assert response.sensor.stats_a
+            assert response.sensor.stats_a.pm2_5 == 0.0
+            assert response.sensor.stats_a.pm2_5_10minute == 0.1
+            assert response.sensor.stats_a.pm2_5_30minute == 0.9
+            assert response.sensor.stats_a.pm2_5_60minute == 1.0
+            assert response.sensor.stats_a.pm2_5_6hour == 1.0
+            assert response.sensor.stats_a.pm2_5_24hour == 1.4
+            assert response.sensor.stats_a.pm2_5_1week == 4.8
+            assert response.sensor.stats_a.timestamp_utc == datetime(
+                2022, 11, 5, 16, 36, 2
+            )
+
+            assert response.sensor.stats_b
+            assert response.sensor.stats_b.pm2_5 == 0.0
+            assert response.sensor.stats_b.pm2_5_10minute == 0.2
+            assert response.sensor.stats_b.pm2_5_30minute == 1.2
+            assert response.sensor.stats_b.pm2_5_60minute == 1.3
+            assert response.sensor.stats_b.pm2_5_6hour == 1.5
+            assert response.sensor.stats_b.pm2_5_24hour == 2.2
+            assert response.sensor.stats_b.pm2_5_1week == 6.7
+            assert response.sensor.stats_b.timestamp_utc == datetime(
+                2022, 11, 5, 16, 36, 2
+            )
 
     aresponses.assert_plan_strictly_followed()
 
@@ -270,10 +552,10 @@ async def test_get_sensor_validation_error(aresponses: ResponsesMockServer) -> N
         aresponses: An aresponses server.
     """
     async with aiohttp.ClientSession() as session:
-        api = API(TEST_API_KEY, session=session)
-        with pytest.raises(InvalidRequestError) as err:
-            _ = await api.sensors.async_get_sensor(12345, fields=["foobar"])
-        assert "foobar is an unknown field" in str(err.value)
+        async with API(TEST_API_KEY, session=session) as api:
+            with pytest.raises(InvalidRequestError) as err:
+                _ = await api.sensors.async_get_sensor(12345, fields=["foobar"])
+            assert "foobar is an unknown field" in str(err.value)
 
     aresponses.assert_plan_strictly_followed()
 
@@ -295,63 +577,505 @@ async def test_get_sensors(aresponses: ResponsesMockServer) -> None:
     )
 
     async with aiohttp.ClientSession() as session:
-        api = API(TEST_API_KEY, session=session)
-        response = await api.sensors.async_get_sensors(
-            fields=["name"], location_type=LocationType.OUTSIDE
-        )
-        assert response.api_version == "V1.0.11-0.0.41"
-        assert response.timestamp_utc == datetime(2022, 11, 3, 19, 26, 29)
-        assert response.data_timestamp_utc == datetime(2022, 11, 3, 19, 25, 31)
-        assert response.firmware_default_version == "7.02"
-        assert response.max_age == 604800
-        assert response.fields == ["sensor_index", "name", "latitude", "longitude"]
-        assert response.data == {
-            131075: SensorModel(
-                sensor_index=131075,
-                name="Mariners Bluff",
-                latitude=33.51511,
-                longitude=-117.67972,
-            ),
-            131079: SensorModel(
-                sensor_index=131079,
-                name="BRSKBV-outside",
-                latitude=37.75315,
-                longitude=-122.44364,
-            ),
-            131077: SensorModel(
+        async with API(TEST_API_KEY, session=session) as api:
+            response = await api.sensors.async_get_sensors(
+                fields=["name"], location_type=LocationType.OUTSIDE
+            )
+            assert response.api_version == "V1.0.11-0.0.41"
+            assert response.timestamp_utc == datetime(2022, 11, 3, 19, 26, 29)
+            assert response.data_timestamp_utc == datetime(2022, 11, 3, 19, 25, 31)
+            assert response.firmware_default_version == "7.02"
+            assert response.max_age == 604800
+            assert response.fields == ["sensor_index", "name", "latitude", "longitude"]
+            assert response.data == {
+                131075: SensorModel(
+                    sensor_index=131075,
+                    name="Mariners Bluff",
+                    latitude=33.51511,
+                    longitude=-117.67972,
+                ),
+                131079: SensorModel(
+                    sensor_index=131079,
+                    name="BRSKBV-outside",
+                    latitude=37.75315,
+                    longitude=-122.44364,
+                ),
+                131077: SensorModel(
+                    sensor_index=131077,
+                    name="BEE Patio",
+                    latitude=37.93273,
+                    longitude=-122.03972,
+                ),
+                131083: SensorModel(
+                    sensor_index=131083,
+                    name="Test Sensor",
+                    latitude=38.287594,
+                    longitude=-122.46281,
+                ),
+                30303: SensorModel(
+                    sensor_index=30303,
+                    name="\uc544\uac00\ud398_\uc2e4\ub0b4",
+                    latitude=None,
+                    longitude=None,
+                ),
+            }
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_sensors_validation_error(aresponses: ResponsesMockServer) -> None:
+    """Test the GET /sensors endpoint, returning a validation error.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            with pytest.raises(InvalidRequestError) as err:
+                _ = await api.sensors.async_get_sensors(["foobar"])
+            assert "foobar is an unknown field" in str(err.value)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_sensors_columnar(aresponses: ResponsesMockServer) -> None:
+    """Test the GET /sensors endpoint with a columnar response.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_sensors_response.json")), status=200
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            response = await api.sensors.async_get_sensors_columnar(
+                ["name"], location_type=LocationType.OUTSIDE
+            )
+            assert response.max_age == 604800
+            assert len(response.data) == 5
+            assert list(response.data.column("name"))[:2] == [
+                "Mariners Bluff",
+                "BRSKBV-outside",
+            ]
+            assert response.data[131077] == SensorModel(
                 sensor_index=131077,
                 name="BEE Patio",
                 latitude=37.93273,
                 longitude=-122.03972,
+            )
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_sensors_raw(aresponses: ResponsesMockServer) -> None:
+    """Test the GET /sensors endpoint with untouched rows.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_sensors_response.json")), status=200
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            response = await api.sensors.async_get_sensors_raw(
+                ["name", "latitude", "longitude"]
+            )
+            assert response.fields == ["sensor_index", "name", "latitude", "longitude"]
+            assert response.column_index["latitude"] == 2
+            assert response.data[0] == [131075, "Mariners Bluff", 33.51511, -117.67972]
+            assert response.max_age == 604800
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_sensors_slim(aresponses: ResponsesMockServer) -> None:
+    """Test the GET /sensors endpoint with slim sensor models.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_sensors_response.json")), status=200
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            response = await api.sensors.async_get_sensors_slim(
+                ["name", "latitude", "longitude"]
+            )
+            assert len(response.data) == 5
+            sensor = response.data[131077]
+            assert sensor.model_dump() == {
+                "sensor_index": 131077,
+                "name": "BEE Patio",
+                "latitude": 37.93273,
+                "longitude": -122.03972,
+            }
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_sensors_bytes(aresponses: ResponsesMockServer) -> None:
+    """Test the GET /sensors endpoint with an undecoded response.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    fixture = load_fixture("get_sensors_response.json")
+
+    async def handler(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Respond with the fixture as-is (once the query has been checked).
+
+        Args:
+            request: An aiohttp request.
+
+        Returns:
+            An aiohttp response.
+        """
+        assert request.query["fields"] == "name"
+        assert request.query["show_only"] == "131075,131077"
+        return aiohttp.web_response.Response(
+            text=fixture, content_type="application/json"
+        )
+
+    aresponses.add("api.purpleair.com", "/v1/sensors", "get", response=handler)
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            body = await api.sensors.async_get_sensors_bytes(
+                ["name"], sensor_indices=[131075, 131077]
+            )
+            assert body == fixture.encode()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_iter_sensors(aresponses: ResponsesMockServer) -> None:
+    """Test streaming the GET /sensors endpoint.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    for _ in range(3):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/sensors",
+            "get",
+            response=aiohttp.web_response.json_response(
+                json.loads(load_fixture("get_sensors_response.json")), status=200
             ),
-            131083: SensorModel(
-                sensor_index=131083,
-                name="Test Sensor",
-                latitude=38.287594,
-                longitude=-122.46281,
-            ),
-            30303: SensorModel(
-                sensor_index=30303,
-                name="\uc544\uac00\ud398_\uc2e4\ub0b4",
-                latitude=None,
-                longitude=None,
-            ),
-        }
+        )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            expected = await api.sensors.async_get_sensors(["name"])
+            sensors = [
+                sensor
+                async for sensor in api.sensors.async_iter_sensors(
+                    ["name"], location_type=LocationType.OUTSIDE
+                )
+            ]
+            assert sensors == list(expected.data.values())
+
+            rows = [row async for row in api.sensors.async_iter_sensor_rows(["name"])]
+            assert rows[0] == {
+                "sensor_index": 131075,
+                "name": "Mariners Bluff",
+                "latitude": 33.51511,
+                "longitude": -117.67972,
+            }
+            assert len(rows) == 5
 
     aresponses.assert_plan_strictly_followed()
 
 
 @pytest.mark.asyncio
-async def test_get_sensors_validation_error(aresponses: ResponsesMockServer) -> None:
-    """Test the GET /sensors endpoint, returning a validation error.
+async def test_iter_sensors_data_before_fields(aresponses: ResponsesMockServer) -> None:
+    """Test streaming a GET /sensors response whose data precedes its fields.
 
     Args:
         aresponses: An aresponses server.
     """
+    payload = json.loads(load_fixture("get_sensors_response.json"))
+    payload = {"data": payload.pop("data"), **payload}
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(payload, status=200),
+    )
+
     async with aiohttp.ClientSession() as session:
-        api = API(TEST_API_KEY, session=session)
-        with pytest.raises(InvalidRequestError) as err:
-            _ = await api.sensors.async_get_sensors(["foobar"])
-        assert "foobar is an unknown field" in str(err.value)
+        async with API(TEST_API_KEY, session=session) as api:
+            sensors = [
+                sensor async for sensor in api.sensors.async_iter_sensors(["name"])
+            ]
+            assert [sensor.sensor_index for sensor in sensors] == [
+                131075,
+                131079,
+                131077,
+                131083,
+                30303,
+            ]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload,error_string",
+    [
+        ({"data": [[1, "A"]]}, "no fields"),
+        ({"fields": ["sensor_index", "foobar"], "data": [[1, "A"]]}, "foobar"),
+        ({"fields": ["sensor_index", "name"], "data": [[None, "A"]]}, "sensor_index"),
+        ('{"fields": ["sensor_index"], "data": [[1]', "Unexpected end"),
+    ],
+)
+async def test_iter_sensors_parse_error(
+    aresponses: ResponsesMockServer, payload: Any, error_string: str
+) -> None:
+    """Test streaming a GET /sensors response that can't be parsed.
+
+    Args:
+        aresponses: An aresponses server.
+        payload: The response payload.
+        error_string: The error string that gets raised.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.Response(
+            text=payload if isinstance(payload, str) else json.dumps(payload),
+            content_type="application/json",
+            status=200,
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            with pytest.raises(RequestError) as err:
+                _ = [
+                    sensor async for sensor in api.sensors.async_iter_sensors(["name"])
+                ]
+            assert error_string in str(err.value)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload,err_type,error_string",
+    [
+        (
+            json.loads(load_fixture("error_not_found_response.json")),
+            NotFoundError,
+            "Cannot find a sensor with the provided parameters.",
+        ),
+        ({}, RequestError, "404"),
+    ],
+)
+async def test_iter_sensors_http_error(
+    aresponses: ResponsesMockServer,
+    payload: dict[str, Any],
+    err_type: type[Exception],
+    error_string: str,
+) -> None:
+    """Test streaming a GET /sensors response with an HTTP error.
+
+    Args:
+        aresponses: An aresponses server.
+        payload: The response payload.
+        err_type: The expected error type.
+        error_string: The error string that gets raised.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(payload, status=404),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            with pytest.raises(err_type) as err:
+                _ = [
+                    sensor async for sensor in api.sensors.async_iter_sensors(["name"])
+                ]
+            assert error_string in str(err.value)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+async def async_batched_sensors_handler(
+    request: aiohttp.web.Request,
+) -> aiohttp.web.Response:
+    """Respond to a batched GET /v1/sensors request.
+
+    Args:
+        request: An aiohttp Request.
+
+    Returns:
+        An aiohttp Response.
+    """
+    assert request.query["fields"] == "name,latitude"
+    assert request.query["max_age"] == "0"
+    assert request.query["show_only"] == "131075,131077,99999,131079"
+    payload = json.loads(load_fixture("get_sensors_response.json"))
+    payload["fields"] = ["sensor_index", "name", "latitude"]
+    payload["data"] = [
+        [131075, "Mariners Bluff", 33.51511],
+        [131077, "BEE Patio", 37.93273],
+        # An invalid latitude only affects this sensor:
+        [131079, "BRSKBV-outside", 137.75315],
+    ]
+    return aiohttp.web_response.json_response(payload, status=200)
+
+
+@pytest.mark.asyncio
+async def test_get_sensor_batched(aresponses: ResponsesMockServer) -> None:
+    """Test that concurrent GET /sensors/:sensor_index requests are batched.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    aresponses.add(
+        "api.purpleair.com", "/v1/sensors", "get", async_batched_sensors_handler
+    )
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors/12345",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_sensor_response.json")), status=200
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(
+            TEST_API_KEY, session=session, batch_settings=BatchSettings(window=0.01)
+        ) as api:
+            results = await asyncio.gather(
+                api.sensors.async_get_sensor(131075, fields=["name"]),
+                api.sensors.async_get_sensor(131077, fields=["name", "latitude"]),
+                api.sensors.async_get_sensor(99999, fields=["name"]),
+                api.sensors.async_get_sensor(131079, fields=["latitude"]),
+                return_exceptions=True,
+            )
+
+            first, second, missing, invalid = results
+            assert not isinstance(first, BaseException)
+            assert not isinstance(second, BaseException)
+            assert first.api_version == "V1.0.11-0.0.41"
+            assert first.data_timestamp_utc == datetime(2022, 11, 3, 19, 25, 31)
+            assert first.timestamp_utc == datetime(2022, 11, 3, 19, 26, 29)
+            # Each caller only gets the fields it asked for:
+            assert first.sensor == SensorModel(
+                sensor_index=131075, name="Mariners Bluff"
+            )
+            assert first.sensor.model_fields_set == {"sensor_index", "name"}
+            assert second.sensor == SensorModel(
+                sensor_index=131077, name="BEE Patio", latitude=37.93273
+            )
+            assert isinstance(missing, NotFoundError)
+            assert "sensor 99999 not found" in str(missing)
+            assert isinstance(invalid, RequestError)
+            assert "137.75315 is an invalid latitude" in str(invalid)
+            assert api.sensors.batcher is not None
+            assert api.sensors.batcher.stats == BatchStats(batches=1, requests=4)
+
+            # Requests for every field (or with a read key) aren't batched:
+            response = await api.sensors.async_get_sensor(12345)
+            assert response.sensor.sensor_index == 131075
+
+            # Invalid requests are raised to the caller right away:
+            with pytest.raises(InvalidRequestError):
+                _ = await api.sensors.async_get_sensor(12345, fields=["foobar"])
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_sensor_batched_stale(aresponses: ResponsesMockServer) -> None:
+    """Test that batching returns sensors that haven't been seen for a long time.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    # The sensor was last seen (long) before GET /v1/sensors' default maximum age:
+    stale_sensor = {"sensor_index": 131075, "name": "Mariners Bluff", "last_seen": 1}
+
+    async def sensors_handler(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Respond to a batched GET /v1/sensors request (filtering like the API).
+
+        Args:
+            request: An aiohttp Request.
+
+        Returns:
+            An aiohttp Response.
+        """
+        payload = json.loads(load_fixture("get_sensors_response.json"))
+        payload["fields"] = list(stale_sensor)
+        payload["data"] = []
+        max_age = int(request.query.get("max_age", 604800))
+        if not max_age or stale_sensor["last_seen"] >= payload["time_stamp"] - max_age:
+            payload["data"].append(list(stale_sensor.values()))
+        return aiohttp.web_response.json_response(payload, status=200)
+
+    async def sensor_handler(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Respond to a GET /v1/sensors/:sensor_index request.
+
+        Args:
+            request: An aiohttp Request.
+
+        Returns:
+            An aiohttp Response.
+        """
+        payload = json.loads(load_fixture("get_sensor_response.json"))
+        payload["sensor"] = stale_sensor
+        return aiohttp.web_response.json_response(payload, status=200)
+
+    aresponses.add("api.purpleair.com", "/v1/sensors", "get", sensors_handler)
+    aresponses.add("api.purpleair.com", "/v1/sensors/131075", "get", sensor_handler)
+
+    async with aiohttp.ClientSession() as session:
+        async with API(
+            TEST_API_KEY, session=session, batch_settings=BatchSettings(window=0.01)
+        ) as batched_api:
+            batched = await batched_api.sensors.async_get_sensor(
+                131075, fields=["name", "last_seen"]
+            )
+        async with API(TEST_API_KEY, session=session) as api:
+            unbatched = await api.sensors.async_get_sensor(
+                131075, fields=["name", "last_seen"]
+            )
+
+    assert batched.sensor == unbatched.sensor
+    assert batched.sensor.last_seen_utc == datetime(1970, 1, 1, 0, 0, 1)
 
     aresponses.assert_plan_strictly_followed()
@@ -0,0 +1,106 @@
+"""Define tests for the request batcher."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aiopurpleair.helpers.batcher import BatchSettings, BatchStats, RequestBatcher
+
+
+class FakeLoader:  # pylint: disable=too-few-public-methods
+    """Define a batch loader that records the batches it receives."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.batches: list[list[int]] = []
+
+    async def async_load_batch(self, keys: list[int]) -> dict[int, str | Exception]:
+        """Load a batch of keys (odd keys are invalid; key 99 fails the batch).
+
+        Args:
+            keys: The keys to load.
+
+        Returns:
+            A result (or an error) for each key.
+
+        Raises:
+            RuntimeError: Raised when key 99 is in the batch.
+        """
+        self.batches.append(keys)
+        if 99 in keys:
+            raise RuntimeError("Batch failed")
+        return {
+            key: ValueError(f"Invalid key: {key}") if key % 2 else f"Result {key}"
+            for key in keys
+        }
+
+
+@pytest.mark.asyncio
+async def test_batcher_window() -> None:
+    """Test that requests made within the window are merged (and deduplicated)."""
+    loader = FakeLoader()
+    batcher = RequestBatcher(loader.async_load_batch, BatchSettings(window=0.01))
+
+    results = await asyncio.gather(
+        *(batcher.async_load(key) for key in (2, 4, 2, 3)), return_exceptions=True
+    )
+
+    assert results[:3] == ["Result 2", "Result 4", "Result 2"]
+    assert isinstance(results[3], ValueError)
+    assert str(results[3]) == "Invalid key: 3"
+    assert loader.batches == [[2, 4, 3]]
+    assert batcher.stats == BatchStats(batches=1, requests=4)
+
+
+@pytest.mark.asyncio
+async def test_batcher_max_batch_size() -> None:
+    """Test that full batches are sent immediately."""
+    loader = FakeLoader()
+    batcher = RequestBatcher(
+        loader.async_load_batch, BatchSettings(window=10, max_batch_size=2)
+    )
+
+    results = await asyncio.gather(*(batcher.async_load(key) for key in (2, 4, 6, 8)))
+
+    assert results == ["Result 2", "Result 4", "Result 6", "Result 8"]
+    assert loader.batches == [[2, 4], [6, 8]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_batch_error() -> None:
+    """Test that an error loading a batch is raised to every caller in it."""
+    loader = FakeLoader()
+    batcher = RequestBatcher(loader.async_load_batch, BatchSettings())
+
+    results = await asyncio.gather(
+        *(batcher.async_load(key) for key in (2, 99)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("other_key", [4, 99])
+async def test_batcher_cancelled_caller(other_key: int) -> None:
+    """Test that a cancelled caller doesn't affect the rest of its batch.
+
+    Args:
+        other_key: The key requested by the caller that isn't cancelled.
+    """
+    loader = FakeLoader()
+    batcher = RequestBatcher(loader.async_load_batch, BatchSettings(window=0.01))
+
+    cancelled = asyncio.create_task(batcher.async_load(2))
+    other = asyncio.create_task(batcher.async_load(other_key))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    results = await asyncio.gather(cancelled, other, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError)
+    if other_key == 99:
+        assert isinstance(results[1], RuntimeError)
+    else:
+        assert results[1] == "Result 4"
+    assert loader.batches == [[2, other_key]]
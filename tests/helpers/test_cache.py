@@ -0,0 +1,76 @@
+"""Define tests for the response cache."""
+
+from __future__ import annotations
+
+from aiopurpleair.helpers.cache import CacheSettings, CacheStats, ResponseCache
+
+
+def test_eviction_by_bytes() -> None:
+    """Test that the least recently used responses are evicted to stay under size."""
+    cache = ResponseCache(CacheSettings(max_bytes=100))
+    cache.set("a", "A", 40, 0.0, 0.0)
+    cache.set("b", "B", 40, 0.0, 0.0)
+    cache.set("c", "C", 40, 0.0, 0.0)
+    assert cache.get("a", 1.0) is None
+    assert cache.stats == CacheStats(misses=1, evictions=1, entries=2, bytes=80)
+
+    # A response larger than the whole cache is never stored:
+    cache.set("d", "D", 101, 0.0, 0.0)
+    assert cache.get("d", 1.0) is None
+    assert cache.stats.entries == 2
+
+
+def test_eviction_by_count() -> None:
+    """Test that the least recently used responses are evicted to stay under count."""
+    cache = ResponseCache(CacheSettings(max_entries=2))
+    cache.set("a", "A", 1, 0.0, 0.0)
+    cache.set("b", "B", 1, 0.0, 0.0)
+    # Using "a" makes "b" the least recently used response:
+    assert cache.get("a", 1.0) is not None
+    cache.set("c", "C", 1, 0.0, 0.0)
+    assert cache.get("b", 1.0) is None
+    assert cache.get("a", 1.0) is not None
+    assert cache.get("c", 1.0) is not None
+    assert cache.stats == CacheStats(hits=3, misses=1, evictions=1, entries=2, bytes=2)
+
+
+def test_freshness() -> None:
+    """Test that freshness is based on the data timestamp of a response."""
+    cache = ResponseCache(
+        CacheSettings(
+            refresh_interval=120.0, minimum_ttl=5.0, stale_while_revalidate=60.0
+        )
+    )
+
+    # The data is 100 seconds old, so the response is fresh for 20 more seconds:
+    cache.set("a", "A", 1, 1000.0, 1100.0)
+    entry = cache.get("a", 1119.0)
+    assert entry is not None
+    assert entry.value == "A"
+    assert entry.fresh_until == 1120.0
+    assert entry.stale_until == 1180.0
+
+    # The data is already older than the refresh interval, so the minimum TTL applies:
+    cache.set("b", "B", 1, 1000.0, 1200.0)
+    entry = cache.get("b", 1200.0)
+    assert entry is not None
+    assert entry.fresh_until == 1205.0
+
+    # Stale (but usable) responses are counted separately:
+    assert cache.get("a", 1150.0) is not None
+    # Responses past their stale window are removed:
+    assert cache.get("a", 1180.0) is None
+    assert cache.stats == CacheStats(hits=2, stale_hits=1, misses=1, entries=1, bytes=1)
+
+
+def test_clear() -> None:
+    """Test clearing the cache."""
+    cache = ResponseCache(CacheSettings())
+    cache.set("a", "A", 10, 0.0, 0.0)
+    # Replacing a response doesn't count its old size twice:
+    cache.set("a", "A", 20, 0.0, 0.0)
+    assert cache.stats == CacheStats(entries=1, bytes=20)
+
+    cache.clear()
+    assert cache.get("a", 1.0) is None
+    assert cache.stats == CacheStats(misses=1)
@@ -0,0 +1,110 @@
+"""Define tests for request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aiopurpleair.helpers.coalesce import CoalescingStats, SingleFlight, get_params_key
+
+
+class FakeCall:  # pylint: disable=too-few-public-methods
+    """Define a slow call that counts how many times it's been made."""
+
+    def __init__(self, result: str | Exception) -> None:
+        """Initialize.
+
+        Args:
+            result: The result (or error) of the call.
+        """
+        self.calls = 0
+        self.result = result
+
+    async def async_call(self) -> str:
+        """Make the call.
+
+        Returns:
+            The result.
+
+        Raises:
+            Exception: Raised when the result is an error.
+        """
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_get_params_key() -> None:
+    """Test that parameter keys don't depend on order or value types."""
+    assert get_params_key({"fields": "name", "max_age": 10}) == get_params_key(
+        {"max_age": "10", "fields": "name"}
+    )
+    assert get_params_key({"fields": "name"}) != get_params_key({"fields": "icon"})
+
+
+@pytest.mark.asyncio
+async def test_single_flight() -> None:
+    """Test that concurrent calls with the same key share one call."""
+    call = FakeCall("Result")
+    other_call = FakeCall("Other result")
+    single_flight: SingleFlight[str] = SingleFlight()
+
+    results = await asyncio.gather(
+        single_flight.async_call("key", call.async_call),
+        single_flight.async_call("key", call.async_call),
+        single_flight.async_call("other", other_call.async_call),
+    )
+    assert list(results) == ["Result", "Result", "Other result"]
+    assert (call.calls, other_call.calls) == (1, 1)
+
+    # Calls that aren't in flight at the same time aren't coalesced:
+    assert await single_flight.async_call("key", call.async_call) == "Result"
+    assert call.calls == 2
+    assert single_flight.stats == CoalescingStats(calls=4, coalesced=1)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_error() -> None:
+    """Test that an error is raised to every caller of a shared call."""
+    call = FakeCall(ValueError("Failed"))
+    single_flight: SingleFlight[str] = SingleFlight()
+
+    results = await asyncio.gather(
+        *(single_flight.async_call("key", call.async_call) for _ in range(2)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert call.calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("result", ["Result", ValueError("Failed")])
+async def test_single_flight_cancelled_caller(result: str | Exception) -> None:
+    """Test that a cancelled caller doesn't cancel the shared call.
+
+    Args:
+        result: The result (or error) of the call.
+    """
+    call = FakeCall(result)
+    single_flight: SingleFlight[str] = SingleFlight()
+
+    first = asyncio.create_task(single_flight.async_call("key", call.async_call))
+    second = asyncio.create_task(single_flight.async_call("key", call.async_call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    results = await asyncio.gather(first, second, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1] == result
+
+    # Every caller can be cancelled without the call's error going unretrieved:
+    only = asyncio.create_task(single_flight.async_call("key", call.async_call))
+    await asyncio.sleep(0)
+    only.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await only
+    await asyncio.sleep(0.02)
+    assert call.calls == 2
@@ -0,0 +1,222 @@
+"""Define tests for row decoders."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+import pytest
+from pydantic import Field, ValidationError
+
+from aiopurpleair.helpers.decoder import (
+    Converter,
+    RowDecoder,
+    convert_bool,
+    convert_float,
+    convert_int,
+    convert_str,
+)
+from aiopurpleair.helpers.model import PurpleAirBaseModel
+from aiopurpleair.models.sensors import (
+    SENSOR_ROW_CONVERTERS,
+    SensorModel,
+    get_sensor_row_decoder,
+)
+from tests.common import load_fixture
+
+
+def assert_identical(fields: list[str], row: list[Any]) -> SensorModel:
+    """Assert that a decoded row is identical to a generically validated one.
+
+    Args:
+        fields: The field names of the row.
+        row: A row of raw API values.
+
+    Returns:
+        The decoded SensorModel.
+    """
+    decoded = get_sensor_row_decoder(tuple(fields))(row)
+    validated = SensorModel.model_validate(dict(zip(fields, row)))  # noqa: B905
+
+    assert decoded == validated
+    assert list(decoded.__dict__) == list(validated.__dict__)
+    for key, value in validated.__dict__.items():
+        assert type(decoded.__dict__[key]) is type(value)
+    assert decoded.model_fields_set == validated.model_fields_set
+    return decoded
+
+
+@pytest.mark.parametrize("include_stats", [False, True])
+def test_decoder_wide_row(include_stats: bool) -> None:
+    """Test decoding a row that includes (nearly) every field.
+
+    Args:
+        include_stats: Whether to include nested stats (which aren't decoded by the
+            fast path).
+    """
+    sensor = json.loads(load_fixture("get_sensor_response.json"))["sensor"]
+    if not include_stats:
+        for key in ("stats", "stats_a", "stats_b"):
+            sensor.pop(key)
+
+    decoded = assert_identical(list(sensor), list(sensor.values()))
+    assert decoded.altitude == 569.0
+    assert (decoded.stats is not None) is include_stats
+
+
+@pytest.mark.parametrize(
+    "fields,row",
+    [
+        (["sensor_index", "name", "latitude", "longitude"], [1, "A", None, None]),
+        (["sensor_index", "humidity"], [1, 33]),
+        (["sensor_index", "icon"], [1, 2.0]),
+        (["sensor_index", "private"], [1, 1]),
+        (["sensor_index", "private"], [1, "yes"]),
+        (["sensor_index", "name"], [1]),
+        (["sensor_index", "name"], [1, "A", "extra"]),
+        (["sensor_index", "name", "foobar"], [1, "A", 7]),
+        (["sensor_index", "name", "name"], [1, "A", "B"]),
+        (["name"], ["A"]),
+    ],
+)
+def test_decoder_fallback_matches(fields: list[str], row: list[Any]) -> None:
+    """Test rows that are (partially) handled by the generic validation path.
+
+    Args:
+        fields: The field names of the row.
+        row: A row of raw API values.
+    """
+    if "sensor_index" not in fields:
+        with pytest.raises(ValidationError):
+            _ = get_sensor_row_decoder(tuple(fields))(row)
+        return
+
+    assert_identical(fields, row)
+
+
+@pytest.mark.parametrize(
+    "fields,row,error_string",
+    [
+        (["sensor_index", "name"], [None, "A"], "sensor_index"),
+        (["sensor_index", "latitude"], [1, 100.0], "100.0 is an invalid latitude"),
+        (["sensor_index", "longitude"], [1, -200], "-200.0 is an invalid longitude"),
+        (["sensor_index", "location_type"], [1, 2], "2 is an unknown location type"),
+        (["sensor_index", "channel_flags"], [1, 7], "7 is an unknown channel flag"),
+        (["sensor_index", "temperature"], [1, "hot"], "temperature"),
+        (["sensor_index", "name"], [1, 5], "name"),
+        (["sensor_index", "private"], [1, 2], "private"),
+        (
+            ["sensor_index", "last_seen"],
+            [1, "yesterday"],
+            "cannot be interpreted as an integer",
+        ),
+    ],
+)
+def test_decoder_errors(fields: list[str], row: list[Any], error_string: str) -> None:
+    """Test that invalid rows raise the same errors as generic validation.
+
+    Args:
+        fields: The field names of the row.
+        row: A row of raw API values.
+        error_string: The error string that gets raised.
+    """
+    with pytest.raises((ValidationError, TypeError)) as err:
+        _ = get_sensor_row_decoder(tuple(fields))(row)
+    assert error_string in str(err.value)
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        "channel_flags",
+        "channel_flags_auto",
+        "channel_flags_manual",
+        "channel_state",
+        "date_created",
+        "last_modified",
+        "last_seen",
+        "latitude",
+        "location_type",
+        "name",
+    ],
+)
+def test_decoder_null_values(field: str) -> None:
+    """Test that null values have the same outcome as generic validation.
+
+    Args:
+        field: The field with the null value.
+    """
+    fields = ["sensor_index", field]
+    row = [1, None]
+    try:
+        validated = SensorModel.model_validate(dict(zip(fields, row)))  # noqa: B905
+    except (TypeError, ValidationError) as err:
+        with pytest.raises(type(err)) as decoder_err:
+            _ = get_sensor_row_decoder(tuple(fields))(row)
+        assert str(decoder_err.value) == str(err)
+    else:
+        assert assert_identical(fields, row) == validated
+
+
+def test_decoder_null_non_optional() -> None:
+    """Test that a null value in a non-optional field uses generic validation."""
+
+    class DefaultModel(PurpleAirBaseModel):
+        """Define a model with a non-optional field that has a default."""
+
+        sensor_index: int
+        name: str = "Unknown"
+
+    decoder = RowDecoder(DefaultModel, ["sensor_index", "name"], SENSOR_ROW_CONVERTERS)
+    assert decoder([1, "A"]) == DefaultModel(sensor_index=1, name="A")
+    with pytest.raises(ValidationError) as err:
+        _ = decoder([1, None])
+    assert "name" in str(err.value)
+
+
+def test_decoder_cache() -> None:
+    """Test that decoders are compiled once per set of fields."""
+    first = get_sensor_row_decoder(("sensor_index", "name"))
+    assert get_sensor_row_decoder(("sensor_index", "name")) is first
+    assert get_sensor_row_decoder(("sensor_index", "icon")) is not first
+
+
+def test_decoder_default_factory() -> None:
+    """Test that models with per-instance defaults use generic validation."""
+
+    class ListModel(PurpleAirBaseModel):
+        """Define a model with a default factory."""
+
+        sensor_index: int
+        tags: list[str] = Field(default_factory=list)
+        name: Optional[str] = None
+
+    decoder = RowDecoder(ListModel, ["sensor_index", "name"], SENSOR_ROW_CONVERTERS)
+    first = decoder([1, "A"])
+    second = decoder([2, "B"])
+    assert first == ListModel(sensor_index=1, name="A")
+    assert first.tags is not second.tags
+
+
+@pytest.mark.parametrize(
+    "converter,value,expected",
+    [
+        (convert_bool, True, True),
+        (convert_bool, 0, False),
+        (convert_float, 1.5, 1.5),
+        (convert_float, 2, 2.0),
+        (convert_int, 3, 3),
+        (convert_str, "A", "A"),
+    ],
+)
+def test_converters(converter: Converter, value: Any, expected: Any) -> None:
+    """Test the fast-path converters directly.
+
+    Args:
+        converter: The converter to test.
+        value: A raw API value.
+        expected: The expected converted value.
+    """
+    converted = converter(value)
+    assert converted == expected
+    assert type(converted) is type(expected)
@@ -0,0 +1,200 @@
+"""Define tests for exporting sensors to Arrow tables and pandas DataFrames."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from aiopurpleair.errors import PurpleAirError
+from aiopurpleair.helpers.export import build_arrow_table, build_data_frame
+from aiopurpleair.models.sensors import GetSensorsRawResponse
+from tests.common import import_module_without
+
+FIELDS = [
+    "sensor_index",
+    "name",
+    "pm2.5",
+    "last_seen",
+    "private",
+    "location_type",
+]
+
+ROWS: list[list[Any]] = [
+    [131075, "Mariners Bluff", 4.2, 1667503531, 1, 0],
+    [131079, None, None, None, None, None],
+]
+
+
+@pytest.fixture(name="response")
+def response_fixture() -> GetSensorsRawResponse:
+    """Define a raw GET /v1/sensors response.
+
+    Returns:
+        A GetSensorsRawResponse.
+    """
+    return GetSensorsRawResponse.model_validate(
+        {
+            "api_version": "V1.0.11-0.0.41",
+            "time_stamp": 1667503589,
+            "data_time_stamp": 1667503531,
+            "max_age": 604800,
+            "firmware_default_version": "7.02",
+            "fields": FIELDS,
+            "data": ROWS,
+        }
+    )
+
+
+def test_to_arrow(response: GetSensorsRawResponse) -> None:
+    """Test exporting a response to an Arrow table.
+
+    Args:
+        response: A raw GET /v1/sensors response.
+    """
+    pa = pytest.importorskip("pyarrow")
+
+    table = response.to_arrow()
+    assert table.schema.types == [
+        pa.int64(),
+        pa.string(),
+        pa.float64(),
+        pa.timestamp("s", tz="UTC"),
+        pa.bool_(),
+        pa.int64(),
+    ]
+    assert table.to_pylist() == [
+        {
+            "sensor_index": 131075,
+            "name": "Mariners Bluff",
+            "pm2.5": 4.2,
+            "last_seen": datetime(2022, 11, 3, 19, 25, 31, tzinfo=timezone.utc),
+            "private": True,
+            "location_type": 0,
+        },
+        {field: value for field, value in zip(FIELDS, ROWS[1])}  # noqa: B905
+        | {"sensor_index": 131079},
+    ]
+
+
+def test_to_pandas(response: GetSensorsRawResponse) -> None:
+    """Test exporting a response to a pandas DataFrame.
+
+    Args:
+        response: A raw GET /v1/sensors response.
+    """
+    pd = pytest.importorskip("pandas")
+
+    data_frame = response.to_pandas()
+    assert list(data_frame.index) == [131075, 131079]
+    assert [str(dtype) for dtype in data_frame.dtypes[2:6]] == [
+        "float64",
+        "datetime64[s, UTC]",
+        "boolean",
+        "Int64",
+    ]
+
+    sensor = data_frame.loc[131075]
+    assert sensor["name"] == "Mariners Bluff"
+    assert sensor["last_seen"] == pd.Timestamp("2022-11-03 19:25:31", tz="UTC")
+
+    sensor = data_frame.loc[131079]
+    assert math.isnan(sensor["pm2.5"])
+    assert sensor["last_seen"] is pd.NaT
+    assert sensor["private"] is pd.NA
+
+
+@pytest.mark.parametrize(
+    "build,module",
+    [(build_arrow_table, "pyarrow"), (build_data_frame, "pandas")],
+)
+def test_untyped_fields(build: Callable[..., Any], module: str) -> None:
+    """Test that fields without a simple type are exported as-is.
+
+    Args:
+        build: The exporter to test.
+        module: The module the exporter requires.
+    """
+    pytest.importorskip(module)
+    exported = build(
+        ["sensor_index", "stats", "unknown"], [[131075, {"pm2.5": 4.2}, "value"]]
+    )
+    if module == "pyarrow":
+        exported = exported.to_pandas()
+    assert exported["stats"].iloc[0] == {"pm2.5": 4.2}
+    assert exported["unknown"].iloc[0] == "value"
+
+
+@pytest.mark.parametrize(
+    "build,module",
+    [(build_arrow_table, "pyarrow"), (build_data_frame, "pandas")],
+)
+def test_empty(build: Callable[..., Any], module: str) -> None:
+    """Test exporting no sensors.
+
+    Args:
+        build: The exporter to test.
+        module: The module the exporter requires.
+    """
+    pytest.importorskip(module)
+    assert len(build(["sensor_index", "name", "last_seen"], [])) == 0
+
+
+@pytest.mark.parametrize(
+    "build,module",
+    [(build_arrow_table, "pyarrow"), (build_data_frame, "pandas")],
+)
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("pm2.5", "high"),
+        ("last_seen", "yesterday"),
+        ("private", "yes"),
+        ("location_type", "inside"),
+    ],
+)
+def test_invalid_values(
+    build: Callable[..., Any], module: str, field: str, value: Any
+) -> None:
+    """Test that a value that doesn't match its column's type raises an error.
+
+    Args:
+        build: The exporter to test.
+        module: The module the exporter requires.
+        field: The field with the invalid value.
+        value: The invalid value.
+    """
+    pytest.importorskip(module)
+    with pytest.raises(ValueError) as err:
+        build(["sensor_index", field], [[131075, value]])
+    assert f"{field} contains invalid values" in str(err.value)
+
+
+@pytest.mark.parametrize(
+    "build,message",
+    [
+        ("build_arrow_table", "Exporting to Arrow requires pyarrow to be installed"),
+        ("build_data_frame", "Exporting to pandas requires pandas to be installed"),
+    ],
+)
+def test_missing_dependencies(
+    monkeypatch: pytest.MonkeyPatch, build: str, message: str
+) -> None:
+    """Test that exporting without the required library raises an error.
+
+    Args:
+        monkeypatch: A pytest MonkeyPatch object.
+        build: The name of the exporter to test.
+        message: The expected error message.
+    """
+    export = import_module_without(
+        monkeypatch, "aiopurpleair.helpers.export", "pandas", "pyarrow"
+    )
+    assert export.PANDAS_AVAILABLE is False
+    assert export.PYARROW_AVAILABLE is False
+    with pytest.raises(PurpleAirError) as err:
+        getattr(export, build)(["sensor_index"], [[131075]])
+    assert message in str(err.value)
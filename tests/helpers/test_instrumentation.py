@@ -0,0 +1,116 @@
+"""Define tests for request instrumentation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from aiopurpleair.helpers.instrumentation import (
+    Histogram,
+    HistogramSnapshot,
+    Instrumentation,
+    InstrumentationStats,
+    RequestMetrics,
+    get_row_count,
+)
+
+
+@pytest.mark.parametrize(
+    "data,rows",
+    [
+        ({"data": [[1], [2]]}, 2),
+        ({"sensor": {"sensor_index": 1}}, 1),
+        ({"api_key_type": "READ"}, None),
+        ([], None),
+    ],
+)
+def test_get_row_count(data: Any, rows: int | None) -> None:
+    """Test getting the number of sensors in a response.
+
+    Args:
+        data: The decoded response data.
+        rows: The expected number of sensors.
+    """
+    assert get_row_count(data) == rows
+
+
+def test_histogram() -> None:
+    """Test recording values into a histogram."""
+    histogram = Histogram([1.0, 2.0, 4.0, 8.0])
+    assert histogram.snapshot() == HistogramSnapshot(
+        count=0,
+        total=0.0,
+        minimum=None,
+        maximum=None,
+        p50=None,
+        p90=None,
+        p99=None,
+    )
+    assert histogram.snapshot().mean is None
+
+    for value in [0.5, 1.5, 1.5, 3.0, 3.0, 3.0, 3.0, 3.0, 6.0, 20.0]:
+        histogram.record(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.count == 10
+    assert snapshot.mean == pytest.approx(4.45)
+    assert (snapshot.minimum, snapshot.maximum) == (0.5, 20.0)
+    # Percentiles are the upper bounds of their buckets (or the largest value, for
+    # values beyond the last bucket):
+    assert (snapshot.p50, snapshot.p90, snapshot.p99) == (4.0, 8.0, 20.0)
+    assert histogram.get_percentile(0) == 1.0
+
+
+def test_listeners(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that listeners receive the metrics of every request.
+
+    Args:
+        caplog: A mocked logging utility.
+    """
+    instrumentation = Instrumentation()
+    received: list[RequestMetrics] = []
+
+    def broken_listener(_: RequestMetrics) -> None:
+        """Raise an error.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError("Broken")
+
+    remove = instrumentation.add_listener(received.append)
+    instrumentation.add_listener(broken_listener)
+
+    with instrumentation.measure("get", "/keys") as metrics:
+        metrics.start_attempt()
+        metrics.ttfb = 0.01
+    assert received == [metrics]
+    assert metrics.attempts == 1
+    assert metrics.total is not None
+    assert "Error in request metrics listener" in caplog.text
+
+    remove()
+    with pytest.raises(ValueError), instrumentation.measure("get", "/keys"):
+        raise ValueError("Failed")
+    assert len(received) == 1
+
+    assert instrumentation.stats == InstrumentationStats(requests=2, errors=1)
+    snapshot = instrumentation.snapshot()
+    assert snapshot["ttfb"].count == 1
+    assert snapshot["total"].count == 2
+    assert snapshot["rows"].count == 0
+
+    instrumentation.reset()
+    assert instrumentation.stats == InstrumentationStats()
+    assert instrumentation.snapshot()["total"].count == 0
+
+
+def test_start_attempt() -> None:
+    """Test that a new attempt clears the phases of the previous one."""
+    metrics = RequestMetrics(method="get", endpoint="/keys")
+    metrics.start_attempt()
+    metrics.status = 503
+    metrics.connect = 0.1
+    metrics.start_attempt()
+    assert metrics == RequestMetrics(method="get", endpoint="/keys", attempts=2)
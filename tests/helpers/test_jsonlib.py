@@ -0,0 +1,48 @@
+"""Define tests for JSON decoders."""
+
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from aiopurpleair.errors import PurpleAirError
+from aiopurpleair.helpers.jsonlib import get_json_decoder
+
+
+def test_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test falling back to the standard library when no other decoder is installed.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec.json", None)
+    assert get_json_decoder() is json.loads
+
+    with pytest.raises(PurpleAirError) as err:
+        get_json_decoder("orjson")
+    assert "The orjson JSON decoder isn't installed" in str(err.value)
+
+
+@pytest.mark.parametrize("name", [None, "json", "orjson"])
+def test_decode(name: str | None) -> None:
+    """Test that every decoder decodes JSON bytes the same way.
+
+    Args:
+        name: The name of a decoder.
+    """
+    pytest.importorskip(name or "json")
+    decoder = get_json_decoder(name)
+    assert decoder(b'{"fields": ["name"], "data": [[1, 1.5, null, true]]}') == {
+        "fields": ["name"],
+        "data": [[1, 1.5, None, True]],
+    }
+
+
+def test_unknown_decoder() -> None:
+    """Test getting an unknown decoder."""
+    with pytest.raises(PurpleAirError) as err:
+        get_json_decoder("yaml")
+    assert "yaml is an unknown JSON decoder" in str(err.value)
@@ -0,0 +1,43 @@
+"""Define tests for lazy imports."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from aiopurpleair.helpers.lazy import lazy_import
+from tests.common import import_module_without
+
+
+def test_lazy_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a lazily imported module works once it's used.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    colorsys = lazy_import("colorsys")
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+
+    # A module that's already imported is returned as-is:
+    assert lazy_import("colorsys") is colorsys
+    assert lazy_import("sys") is sys
+
+
+def test_lazy_import_missing() -> None:
+    """Test that lazily importing a module that isn't installed fails right away."""
+    with pytest.raises(ImportError):
+        lazy_import("aiopurpleair_missing_module")
+
+
+def test_numpy_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a missing NumPy is detected (rather than failing the import).
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    lazy = import_module_without(monkeypatch, "aiopurpleair.helpers.lazy", "numpy")
+    assert lazy.NUMPY_AVAILABLE is False
+    with pytest.raises(AttributeError):
+        _ = lazy.np.array
@@ -0,0 +1,199 @@
+"""Define tests for the API points budget."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from aiopurpleair.const import SENSOR_FIELDS
+from aiopurpleair.errors import RequestError
+from aiopurpleair.helpers.ratelimit import (
+    REQUEST_PRIORITY,
+    Priority,
+    RateLimiter,
+    RateLimitSettings,
+    RateLimitStats,
+    get_response_points,
+    request_priority,
+)
+
+
+@pytest.mark.parametrize(
+    "endpoint,params,points",
+    [
+        ("/keys", {}, 0),
+        ("/sensors/12345", {}, len(SENSOR_FIELDS)),
+        ("/sensors/12345", {"fields": "name,latitude"}, 2),
+        ("/sensors", {"fields": "name,latitude", "show_only": "1,2,3"}, 6),
+        ("/sensors", {"fields": "name,latitude"}, 20),
+    ],
+)
+def test_estimate_points(endpoint: str, params: dict[str, Any], points: int) -> None:
+    """Test estimating the cost of a request.
+
+    Args:
+        endpoint: A relative API endpoint.
+        params: The query parameters of the request.
+        points: The expected estimate.
+    """
+    limiter = RateLimiter(RateLimitSettings(expected_rows=10))
+    assert limiter.estimate_points(endpoint, params) == points
+
+
+@pytest.mark.parametrize(
+    "data,points",
+    [
+        ({"data": [[1], [2], [3]]}, 6),
+        ({"sensor": {"sensor_index": 1}}, 2),
+    ],
+)
+def test_get_response_points(data: dict[str, Any], points: int) -> None:
+    """Test getting the actual cost of a response.
+
+    Args:
+        data: The response data.
+        points: The expected cost.
+    """
+    assert get_response_points({"fields": "name,latitude"}, data) == points
+
+
+@pytest.mark.parametrize(
+    "data,points",
+    [
+        ({"fields": ["sensor_index", "name"], "data": [[1, "A"], [2, "B"]]}, 4),
+        ({"sensor": {"sensor_index": 1, "name": "A", "latitude": 51.5}}, 3),
+        ({"api_key_type": "READ"}, 0),
+    ],
+)
+def test_get_response_points_all_fields(data: dict[str, Any], points: int) -> None:
+    """Test getting the actual cost of a response to a request without fields.
+
+    Args:
+        data: The response data.
+        points: The expected cost.
+    """
+    assert get_response_points({}, data) == points
+
+
+@pytest.mark.asyncio
+async def test_cancellation() -> None:
+    """Test that a cancelled request doesn't spend (or hold up) the budget."""
+    limiter = RateLimiter(RateLimitSettings(capacity=10, refill_rate=0))
+    await limiter.async_acquire(10)
+
+    # A request that is cancelled while it waits gives up its place:
+    task = asyncio.create_task(limiter.async_acquire(5))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # A request that is cancelled just as it's let through gets its points back:
+    task = asyncio.create_task(limiter.async_acquire(5))
+    await asyncio.sleep(0)
+    limiter.settle(10, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.available_points == 5
+    assert limiter.stats == RateLimitStats(requests=3, deferred=2, points_spent=5)
+
+
+@pytest.mark.asyncio
+async def test_low_priority_reserve() -> None:
+    """Test that low-priority requests leave part of the budget for others."""
+    limiter = RateLimiter(
+        RateLimitSettings(capacity=10, refill_rate=0, low_priority_reserve=0.5)
+    )
+    await limiter.async_acquire(6)
+
+    with request_priority(Priority.LOW):
+        low_priority_task = asyncio.create_task(limiter.async_acquire(1))
+    await asyncio.sleep(0)
+    assert not low_priority_task.done()
+
+    # Normal requests can still spend the reserve:
+    await asyncio.wait_for(limiter.async_acquire(1), 1)
+    assert not low_priority_task.done()
+
+    # Once the budget recovers, the low-priority request is let through:
+    limiter.settle(6, 0)
+    await asyncio.wait_for(low_priority_task, 1)
+    assert limiter.available_points == 8
+    assert limiter.stats == RateLimitStats(requests=3, deferred=1, points_spent=2)
+
+
+@pytest.mark.asyncio
+async def test_oversized_request() -> None:
+    """Test that a request costing more than the whole budget waits for a full one."""
+    limiter = RateLimiter(RateLimitSettings(capacity=10, refill_rate=0))
+    await limiter.async_acquire(5)
+
+    task = asyncio.create_task(limiter.async_acquire(20))
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    limiter.settle(5, 0)
+    await asyncio.wait_for(task, 1)
+    assert limiter.available_points == -10
+
+
+@pytest.mark.asyncio
+async def test_close() -> None:
+    """Test that closing the limiter fails waiting requests and stops its timer."""
+    limiter = RateLimiter(RateLimitSettings(capacity=10, refill_rate=1))
+    await limiter.async_acquire(10)
+
+    task = asyncio.create_task(limiter.async_acquire(5))
+    await asyncio.sleep(0)
+    timer = limiter._timer  # pylint: disable=protected-access
+    assert timer is not None
+
+    limiter.close()
+    with pytest.raises(RequestError) as err:
+        await task
+    assert "The rate limiter was closed" in str(err.value)
+    assert timer.cancelled()
+    assert limiter._timer is None  # pylint: disable=protected-access
+
+    # Closing an idle limiter does nothing:
+    limiter.close()
+
+
+@pytest.mark.asyncio
+async def test_priority_order() -> None:
+    """Test that deferred requests are let through in priority order."""
+    limiter = RateLimiter(RateLimitSettings(capacity=10, refill_rate=1000))
+    await limiter.async_acquire(10)
+    order: list[Priority] = []
+
+    async def async_acquire(priority: Priority) -> None:
+        """Acquire points with a priority.
+
+        Args:
+            priority: The priority of the request.
+        """
+        with request_priority(priority):
+            await limiter.async_acquire(5)
+        order.append(priority)
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            async_acquire(Priority.LOW),
+            async_acquire(Priority.NORMAL),
+            async_acquire(Priority.HIGH),
+        ),
+        1,
+    )
+    assert order == [Priority.HIGH, Priority.NORMAL, Priority.LOW]
+    assert limiter.stats == RateLimitStats(requests=4, deferred=3, points_spent=25)
+
+
+def test_request_priority() -> None:
+    """Test that the request priority is restored after its context."""
+    with request_priority(Priority.HIGH):
+        assert REQUEST_PRIORITY.get() is Priority.HIGH
+    assert REQUEST_PRIORITY.get() is Priority.NORMAL
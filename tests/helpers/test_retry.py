@@ -0,0 +1,206 @@
+"""Define tests for the retry policy."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from aiohttp.client_exceptions import ClientConnectionError
+
+from aiopurpleair.errors import (
+    CircuitOpenError,
+    InvalidApiKeyError,
+    RequestError,
+    ServiceUnavailableError,
+)
+from aiopurpleair.helpers.retry import (
+    CircuitState,
+    RetryPolicy,
+    RetrySettings,
+    RetryStats,
+    get_retry_after,
+)
+
+
+class FlakyCall:  # pylint: disable=too-few-public-methods
+    """Define a call that fails a number of times before it succeeds."""
+
+    def __init__(self, *errors: Exception) -> None:
+        """Initialize.
+
+        Args:
+            *errors: The errors to raise (in order) before succeeding.
+        """
+        self.calls = 0
+        self.errors = list(errors)
+
+    async def async_call(self) -> str:
+        """Make the call.
+
+        Returns:
+            The result.
+
+        Raises:
+            Exception: Raised while there are errors left.
+        """
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.errors:
+            raise self.errors.pop(0)
+        return "result"
+
+
+@pytest.fixture(name="policy")
+def policy_fixture() -> RetryPolicy:
+    """Define a retry policy with short delays.
+
+    Returns:
+        A RetryPolicy.
+    """
+    return RetryPolicy(
+        RetrySettings(
+            base_delay=0.001, max_delay=1.0, failure_threshold=3, reset_timeout=0.05
+        )
+    )
+
+
+def test_get_delay(policy: RetryPolicy) -> None:
+    """Test getting the delay before a retry.
+
+    Args:
+        policy: A retry policy.
+    """
+    for attempt in range(1, 5):
+        delay = policy.get_delay(attempt, RequestError())
+        assert delay is not None
+        assert 0 <= delay <= 0.001 * 2 ** (attempt - 1)
+
+    # A Retry-After header is honored (unless it asks for too long a wait):
+    assert policy.get_delay(1, ServiceUnavailableError("", retry_after=0.5)) == 0.5
+    assert policy.get_delay(1, ServiceUnavailableError("", retry_after=5)) is None
+
+
+def test_get_retry_after() -> None:
+    """Test parsing Retry-After headers."""
+    assert get_retry_after(None) is None
+    assert get_retry_after("garbage") is None
+    assert get_retry_after("5") == 5
+    assert get_retry_after("-5") == 0
+    assert get_retry_after("Wed, 21 Oct 2015 07:28:00 -0000") == 0
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert get_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(
+        60, abs=2
+    )
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker(policy: RetryPolicy) -> None:
+    """Test that the circuit breaker opens, fails fast, and recovers.
+
+    Args:
+        policy: A retry policy.
+    """
+    call = FlakyCall(*(ServiceUnavailableError("") for _ in range(4)))
+    # The state of the circuit is recorded after each step (and checked at the end):
+
+    # Three failures in a row open the circuit:
+    with pytest.raises(ServiceUnavailableError):
+        await policy.async_call("get", call.async_call)
+    states = [policy.circuit_state]
+    with pytest.raises(CircuitOpenError):
+        await policy.async_call("get", call.async_call)
+    assert call.calls == 3
+
+    # Once the reset timeout passes, a single failed trial request reopens it:
+    await asyncio.sleep(0.05)
+    states.append(policy.circuit_state)
+    with pytest.raises(ServiceUnavailableError):
+        await policy.async_call("get", call.async_call)
+    states.append(policy.circuit_state)
+
+    # ...and a single successful one closes it (rejecting others while it's sent):
+    await asyncio.sleep(0.05)
+    results = await asyncio.gather(
+        policy.async_call("get", call.async_call),
+        policy.async_call("get", call.async_call),
+        return_exceptions=True,
+    )
+    assert results[0] == "result"
+    assert isinstance(results[1], CircuitOpenError)
+    states.append(policy.circuit_state)
+    assert call.calls == 5
+
+    assert states == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.OPEN,
+        CircuitState.CLOSED,
+    ]
+
+    assert policy.stats == RetryStats(
+        attempts=5, retries=2, circuit_opened=2, circuit_rejected=2
+    )
+
+
+@pytest.mark.asyncio
+async def test_not_retried(policy: RetryPolicy) -> None:
+    """Test the requests that aren't retried.
+
+    Args:
+        policy: A retry policy.
+    """
+    # Errors that don't mean that the API is unhealthy:
+    call = FlakyCall(InvalidApiKeyError(""))
+    with pytest.raises(InvalidApiKeyError):
+        await policy.async_call("get", call.async_call)
+    assert call.calls == 1
+
+    # Requests that aren't idempotent:
+    call = FlakyCall(ServiceUnavailableError(""))
+    with pytest.raises(ServiceUnavailableError):
+        await policy.async_call("post", call.async_call)
+    assert call.calls == 1
+
+    # Requests that the API asks to wait too long for:
+    call = FlakyCall(ServiceUnavailableError("", retry_after=60))
+    with pytest.raises(ServiceUnavailableError):
+        await policy.async_call("get", call.async_call)
+    assert call.calls == 1
+
+    assert policy.stats == RetryStats(attempts=3)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "errors,result,calls",
+    [
+        ((ServiceUnavailableError(""), asyncio.TimeoutError()), "result", 3),
+        ((ClientConnectionError(), ClientConnectionError()), "result", 3),
+        ((ServiceUnavailableError(""),) * 3, None, 3),
+    ],
+)
+async def test_retries(
+    errors: tuple[Exception, ...], result: str | None, calls: int
+) -> None:
+    """Test that idempotent requests are retried.
+
+    Args:
+        errors: The errors to raise before succeeding.
+        result: The expected result (or None if the retries are exhausted).
+        calls: The expected number of calls.
+    """
+    policy = RetryPolicy(RetrySettings(base_delay=0.001))
+    call = FlakyCall(*errors)
+
+    if result is None:
+        with pytest.raises(type(errors[-1])):
+            await policy.async_call("get", call.async_call)
+    else:
+        assert await policy.async_call("get", call.async_call) == result
+
+    assert call.calls == calls
+    assert policy.stats == RetryStats(attempts=calls, retries=2)
+    assert policy.circuit_state is CircuitState.CLOSED
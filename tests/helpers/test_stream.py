@@ -0,0 +1,201 @@
+"""Define tests for the incremental JSON parser."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from aiopurpleair.helpers import stream
+from aiopurpleair.helpers.stream import JSONStreamError, async_iter_json_array_items
+from tests.common import load_fixture
+
+
+async def async_iter_chunks(payload: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    """Iterate over a payload in fixed-size chunks.
+
+    Args:
+        payload: The raw payload.
+        chunk_size: The size of each chunk.
+
+    Yields:
+        Chunks of the payload.
+    """
+    for start in range(0, len(payload), chunk_size):
+        yield payload[start : start + chunk_size]
+
+
+async def async_parse(
+    payload: bytes, chunk_size: int, key: str = "data"
+) -> tuple[list[Any], dict[str, Any]]:
+    """Parse a payload with the incremental parser.
+
+    Args:
+        payload: The raw payload.
+        chunk_size: The size of each chunk.
+        key: The key of the array to iterate over.
+
+    Returns:
+        The items of the array and the object's other values.
+    """
+    metadata: dict[str, Any] = {}
+    items = [
+        item
+        async for item in async_iter_json_array_items(
+            async_iter_chunks(payload, chunk_size), key, metadata
+        )
+    ]
+    return items, metadata
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 100000])
+async def test_stream_sensors_response(chunk_size: int) -> None:
+    """Test that a streamed response matches one that is decoded whole.
+
+    Args:
+        chunk_size: The size of each chunk.
+    """
+    raw = load_fixture("get_sensors_response.json")
+    expected = json.loads(raw)
+
+    items, metadata = await async_parse(raw.encode(), chunk_size)
+
+    assert items == expected.pop("data")
+    assert metadata == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+async def test_stream_tricky_values(chunk_size: int) -> None:
+    """Test values that are split across chunks in awkward places.
+
+    Args:
+        chunk_size: The size of each chunk.
+    """
+    payload = {
+        "before": {"nested": ["]", "}", ","]},
+        "data": [
+            [123456789, -1.5e-7, 'Café ☃ \\"[quoted]\\"', None, True],
+            [0, 12.25, "", False, {"a": []}],
+        ],
+        "after": 1234567890,
+    }
+
+    items, metadata = await async_parse(
+        json.dumps(payload, ensure_ascii=False).encode(), chunk_size
+    )
+
+    assert items == payload["data"]
+    assert metadata == {"before": payload["before"], "after": payload["after"]}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload,items,metadata",
+    [
+        (b"{}", [], {}),
+        (b' { "data" : [ ] } ', [], {}),
+        (b'{"data": [1, 2], "fields": ["a"]}', [1, 2], {"fields": ["a"]}),
+        (b'{"other": [1, 2]}', [], {"other": [1, 2]}),
+    ],
+)
+async def test_stream_shapes(
+    payload: bytes, items: list[Any], metadata: dict[str, Any]
+) -> None:
+    """Test objects of various shapes.
+
+    Args:
+        payload: The raw payload.
+        items: The expected array items.
+        metadata: The expected other values.
+    """
+    assert await async_parse(payload, 3) == (items, metadata)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload,error_string",
+    [
+        (b"", "Unexpected end of JSON stream"),
+        (b"[1, 2]", "Expected one of { but found '['"),
+        (b'{"data": [1, 2', "Unexpected end of JSON stream"),
+        (b'{"data": [1 2]}', "Expected one of ,, ] but found '2'"),
+        (b'{"data": {"a": 1}}', "Expected one of [ but found '{'"),
+        (b'{1: "a"}', "Expected an object key but found 1"),
+        (b'{"data": [tru', "Expecting value"),
+        (b'{"a": 1 "b": 2}', "Expected one of ,, } but found '\"'"),
+    ],
+)
+async def test_stream_errors(payload: bytes, error_string: str) -> None:
+    """Test that malformed payloads raise an error.
+
+    Args:
+        payload: The raw payload.
+        error_string: The error string that gets raised.
+    """
+    with pytest.raises(JSONStreamError) as err:
+        await async_parse(payload, 4)
+    assert error_string in str(err.value)
+
+
+@pytest.mark.asyncio
+async def test_stream_errors_fail_early() -> None:
+    """Test that malformed data is reported without reading the rest of the stream."""
+    chunks_read = 0
+
+    async def async_iter_rows() -> AsyncIterator[bytes]:
+        """Iterate over a large payload whose first row is malformed.
+
+        Yields:
+            Chunks of the payload.
+        """
+        nonlocal chunks_read
+        yield b'{"data": [[1, "A"], [2, x], '
+        for index in range(10000):
+            chunks_read += 1
+            yield f'[{index}, "B"], '.encode()
+        yield b"[0]]}"
+
+    items = []
+    with pytest.raises(JSONStreamError) as err:
+        async for item in async_iter_json_array_items(async_iter_rows(), "data", {}):
+            items.append(item)
+    assert "Expecting value" in str(err.value)
+    assert items == [[1, "A"]]
+    assert chunks_read == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_large_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a value spanning many chunks isn't decoded again for every chunk.
+
+    Args:
+        monkeypatch: A pytest MonkeyPatch object.
+    """
+    decode_calls = 0
+    raw_decode = stream.JSON_DECODER.raw_decode
+
+    def counting_raw_decode(text: str, index: int) -> tuple[Any, int]:
+        """Decode a value (and count the attempt).
+
+        Args:
+            text: The buffer to decode from.
+            index: The position to start decoding at.
+
+        Returns:
+            The decoded value and the position where it ends.
+        """
+        nonlocal decode_calls
+        decode_calls += 1
+        return raw_decode(text, index)
+
+    monkeypatch.setattr(stream.JSON_DECODER, "raw_decode", counting_raw_decode)
+    value = ["x" * 100] * 1000
+    payload = json.dumps({"data": [value]}).encode()
+
+    items, _ = await async_parse(payload, 100)
+    assert items == [value]
+    assert decode_calls < 20
@@ -0,0 +1,65 @@
+"""Define tests for task helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aiopurpleair.helpers.tasks import async_gather_or_cancel
+
+
+async def async_return(value: int, delay: float = 0.0) -> int:
+    """Return a value after a delay.
+
+    Args:
+        value: The value to return.
+        delay: The delay (in seconds).
+
+    Returns:
+        The value.
+    """
+    await asyncio.sleep(delay)
+    return value
+
+
+async def async_fail() -> int:
+    """Fail right away.
+
+    Raises:
+        ValueError: Always raised.
+    """
+    raise ValueError("Failed")
+
+
+@pytest.mark.asyncio
+async def test_gather_or_cancel() -> None:
+    """Test that results are returned in order."""
+    assert await async_gather_or_cancel(
+        async_return(1, 0.02), async_return(2), async_return(3, 0.01)
+    ) == [1, 2, 3]
+    assert await async_gather_or_cancel() == []
+
+
+@pytest.mark.asyncio
+async def test_gather_or_cancel_failure() -> None:
+    """Test that a failure cancels the other awaitables."""
+    slow = asyncio.ensure_future(async_return(1, 10))
+
+    with pytest.raises(ValueError) as err:
+        await async_gather_or_cancel(slow, async_fail(), async_return(3))
+    assert "Failed" in str(err.value)
+    assert slow.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_gather_or_cancel_cancelled() -> None:
+    """Test that cancelling the caller cancels the awaitables."""
+    slow = asyncio.ensure_future(async_return(1, 10))
+    task = asyncio.ensure_future(async_gather_or_cancel(slow))
+    await asyncio.sleep(0)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert slow.cancelled()
@@ -0,0 +1,140 @@
+"""Define tests for columnar sensor models."""
+
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from datetime import datetime
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from aiopurpleair.const import LocationType
+from aiopurpleair.models import columnar
+from aiopurpleair.models.columnar import GetSensorsColumnarResponse, SensorColumns
+from aiopurpleair.models.sensors import GetSensorsResponse, SensorModel
+from tests.common import load_fixture
+
+MIXED_FIELDS = [
+    "sensor_index",
+    "name",
+    "latitude",
+    "longitude",
+    "last_seen",
+    "location_type",
+    "icon",
+]
+
+MIXED_ROWS: list[list[Any]] = [
+    [131075, "Mariners Bluff", 33.51511, -117.67972, 1667503531, 0, 0],
+    [131079, "BRSKBV-outside", 37.75315, -122.44364, 1667503532, 1, None],
+    [30303, "Indoor", None, None, None, None, 0],
+]
+
+
+@pytest.fixture(name="numpy_available", params=[True, False])
+def numpy_available_fixture(
+    monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> bool:
+    """Define a fixture that runs a test with and without NumPy.
+
+    Args:
+        monkeypatch: A pytest MonkeyPatch object.
+        request: A pytest FixtureRequest object.
+
+    Returns:
+        Whether NumPy is available.
+    """
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(columnar, "NUMPY_AVAILABLE", request.param)
+    return bool(request.param)
+
+
+def test_columnar_response_matches_models(numpy_available: bool) -> None:
+    """Test that row views match the models built by GetSensorsResponse.
+
+    Args:
+        numpy_available: Whether NumPy is available.
+    """
+    columnar_response = GetSensorsColumnarResponse.model_validate(
+        json.loads(load_fixture("get_sensors_response.json"))
+    )
+    models_response = GetSensorsResponse.model_validate(
+        json.loads(load_fixture("get_sensors_response.json"))
+    )
+
+    assert columnar_response.fields == models_response.fields
+    assert columnar_response.data_timestamp_utc == datetime(2022, 11, 3, 19, 25, 31)
+    assert len(columnar_response.data) == 5
+    assert list(columnar_response.data) == list(models_response.data)
+    assert 131075 in columnar_response.data
+    assert 99999 not in columnar_response.data
+    assert list(columnar_response.data.rows()) == list(models_response.data.values())
+    assert columnar_response.data[131077] == models_response.data[131077]
+
+
+def test_columnar_column_types(numpy_available: bool) -> None:
+    """Test the types of the columns built for each kind of field.
+
+    Args:
+        numpy_available: Whether NumPy is available.
+    """
+    columns = SensorColumns(MIXED_FIELDS, MIXED_ROWS)
+
+    sensor_index = columns.column("sensor_index")
+    latitude = columns.column("latitude")
+    last_seen = columns.column("last_seen")
+    icon = columns.column("icon")
+
+    if numpy_available:
+        assert str(sensor_index.dtype) == "int64"
+        assert str(latitude.dtype) == "float64"
+        assert str(last_seen.dtype) == "float64"
+        assert str(icon.dtype) == "float64"
+    else:
+        assert isinstance(sensor_index, array) and sensor_index.typecode == "q"
+        assert isinstance(latitude, array) and latitude.typecode == "d"
+        assert isinstance(last_seen, array) and last_seen.typecode == "d"
+        assert isinstance(icon, array) and icon.typecode == "d"
+
+    assert list(sensor_index) == [131075, 131079, 30303]
+    assert math.isnan(latitude[2])
+    assert columns.column("name") == ["Mariners Bluff", "BRSKBV-outside", "Indoor"]
+
+    sensor = columns[131079]
+    assert sensor.last_seen_utc == datetime(2022, 11, 3, 19, 25, 32)
+    assert sensor.location_type == LocationType.INSIDE
+    assert sensor.latitude == 37.75315
+    assert sensor.icon is None
+    assert columns[30303] == SensorModel(sensor_index=30303, name="Indoor", icon=0)
+
+
+def test_columnar_empty() -> None:
+    """Test a columnar store with no rows."""
+    columns = SensorColumns(["sensor_index", "name"], [])
+    assert len(columns) == 0
+    assert not list(columns.column("sensor_index"))
+
+
+def test_columnar_invalid_values(numpy_available: bool) -> None:
+    """Test that values that don't match a column's type raise an error.
+
+    Args:
+        numpy_available: Whether NumPy is available.
+    """
+    with pytest.raises(ValidationError) as err:
+        _ = GetSensorsColumnarResponse.model_validate(
+            {
+                "api_version": "V1.0.11-0.0.41",
+                "time_stamp": 1667533097,
+                "data_time_stamp": 1667533091,
+                "max_age": 604800,
+                "firmware_default_version": "7.02",
+                "fields": ["sensor_index", "latitude"],
+                "data": [[131075, "north"]],
+            }
+        )
+    assert "latitude contains invalid values" in str(err.value)
@@ -9,9 +9,12 @@ import pytest
 from pydantic import ValidationError
 
 from aiopurpleair.models.sensors import (
+    GetSensorsRawResponse,
     GetSensorsRequest,
     GetSensorsResponse,
+    GetSensorsSlimResponse,
     LocationType,
+    get_slim_sensor_model,
 )
 
 
@@ -225,15 +228,69 @@ def test_get_sensors_response(
         ),
     ],
 )
+@pytest.mark.parametrize("response_model", [GetSensorsResponse, GetSensorsSlimResponse])
 def test_get_sensors_response_errors(
-    error_string: str, payload: dict[str, Any]
+    error_string: str,
+    payload: dict[str, Any],
+    response_model: type[GetSensorsResponse | GetSensorsSlimResponse],
 ) -> None:
     """Test that an invalid GetSensorsResponse payload raises an error.
 
     Args:
         error_string: The error string that gets raised.
         payload: The payload to test.
+        response_model: The response model to validate with.
     """
     with pytest.raises(ValidationError) as err:
-        _ = GetSensorsResponse.model_validate(payload)
+        _ = response_model.model_validate(payload)
     assert error_string in str(err.value)
+
+
+def test_get_sensors_raw_response() -> None:
+    """Test that raw responses leave their rows untouched."""
+    rows = [[131075, "Mariners Bluff", 33.51511], [131079, "BRSKBV-outside", None]]
+    response = GetSensorsRawResponse.model_validate(
+        {
+            "api_version": "V1.0.11-0.0.41",
+            "time_stamp": 1667533097,
+            "data_time_stamp": 1667533091,
+            "max_age": 604800,
+            "firmware_default_version": "7.02",
+            "fields": ["sensor_index", "name", "latitude"],
+            "data": rows,
+        }
+    )
+    assert response.data is rows
+    assert response.column_index == {"sensor_index": 0, "name": 1, "latitude": 2}
+    assert response.data_timestamp_utc == datetime(2022, 11, 4, 3, 38, 11)
+
+
+def test_get_sensors_slim_response() -> None:
+    """Test that slim sensor models hold (and validate) only the requested fields."""
+    payload: dict[str, Any] = {
+        "api_version": "V1.0.11-0.0.41",
+        "time_stamp": 1667533097,
+        "data_time_stamp": 1667533091,
+        "max_age": 604800,
+        "firmware_default_version": "7.02",
+        "fields": ["sensor_index", "name", "icon", "last_seen", "latitude"],
+        "data": [
+            [131075, "Mariners Bluff", 0, 1667533091, 33.51511],
+            [131079, "BRSKBV-outside", 0, 1667533091, None],
+        ],
+    }
+    full_response = GetSensorsResponse.model_validate(dict(payload))
+    slim_response = GetSensorsSlimResponse.model_validate(dict(payload))
+
+    for sensor_index, sensor in slim_response.data.items():
+        assert sensor.model_dump() == full_response.data[sensor_index].model_dump(
+            include={"sensor_index", "name", "icon", "last_seen_utc", "latitude"}
+        )
+    sensor = slim_response.data[131075]
+    assert sensor.last_seen_utc == datetime(2022, 11, 4, 3, 38, 11)  # type: ignore
+    with pytest.raises(AttributeError):
+        _ = sensor.longitude  # type: ignore[attr-defined]
+
+    # Models are cached per set of fields:
+    assert type(sensor) is get_slim_sensor_model(tuple(payload["fields"]))
+    assert type(sensor) is not get_slim_sensor_model(("name",))
@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime
+from typing import Any
 
 import aiohttp
 import pytest
 from aresponses import ResponsesMockServer
 
 from aiopurpleair import API
-from aiopurpleair.errors import InvalidApiKeyError, NotFoundError, RequestError
+from aiopurpleair.errors import (
+    InvalidApiKeyError,
+    NotFoundError,
+    RequestError,
+    ServiceUnavailableError,
+)
+from aiopurpleair.helpers.cache import CacheSettings, CacheStats
+from aiopurpleair.helpers.coalesce import CoalescingStats
+from aiopurpleair.helpers.connector import ConnectorSettings
+from aiopurpleair.helpers.instrumentation import RequestMetrics
+from aiopurpleair.helpers.ratelimit import RateLimitSettings, RateLimitStats
+from aiopurpleair.helpers.retry import RetryPolicy, RetrySettings, RetryStats
 from aiopurpleair.models.keys import ApiKeyType, GetKeysResponse
 from tests.common import TEST_API_KEY, load_fixture
 
@@ -49,9 +62,9 @@ async def test_api_error(
     )
 
     async with aiohttp.ClientSession() as session:
-        api = API(TEST_API_KEY, session=session)
-        with pytest.raises(err_type):
-            await api.async_request("get", "/bad_endpoint", GetKeysResponse)
+        async with API(TEST_API_KEY, session=session) as api:
+            with pytest.raises(err_type):
+                await api.async_request("get", "/bad_endpoint", GetKeysResponse)
 
     aresponses.assert_plan_strictly_followed()
 
@@ -88,6 +101,7 @@ async def test_check_api_key(
     assert response.api_version == "V1.0.11-0.0.41"
     assert response.timestamp_utc == datetime(2022, 10, 27, 18, 25, 41)
 
+    await api.async_close()
     aresponses.assert_plan_strictly_followed()
 
 
@@ -110,15 +124,497 @@ async def test_check_api_key_validation_error(aresponses: ResponsesMockServer) -
 
     async with aiohttp.ClientSession() as session:
         with pytest.raises(RequestError) as err:
-            api = API(TEST_API_KEY, session=session)
-            _ = await api.async_check_api_key()
+            async with API(TEST_API_KEY, session=session) as api:
+                _ = await api.async_check_api_key()
         assert "FAKE is an unknown API key type" in str(err.value)
 
     aresponses.assert_plan_strictly_followed()
 
 
-def test_get_map_url() -> None:
+@pytest.mark.asyncio
+async def test_connection_reuse(aresponses: ResponsesMockServer) -> None:
+    """Test that the owned session reuses pooled connections across requests.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    for _ in range(3):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/keys",
+            "get",
+            response=aiohttp.web_response.json_response(
+                json.loads(load_fixture("get_keys_response.json")), status=200
+            ),
+        )
+
+    async with API(TEST_API_KEY) as api:
+        for _ in range(3):
+            await api.async_check_api_key()
+        assert api.connection_stats.created == 1
+        assert api.connection_stats.reused == 2
+        assert api.connection_stats.reuse_ratio == 2 / 3
+
+    # Closing the API object should be safe to repeat:
+    await api.async_close()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_connection_stats_empty() -> None:
+    """Test the reuse ratio before any connections have been made."""
+    async with API(TEST_API_KEY) as api:
+        assert api.connection_stats.reuse_ratio == 0.0
+
+
+@pytest.mark.asyncio
+async def test_connector_settings() -> None:
+    """Test that connector settings are applied to the owned session."""
+    settings = ConnectorSettings(limit=5, limit_per_host=2, keepalive_timeout=60)
+    async with API(TEST_API_KEY, connector_settings=settings) as api:
+        # pylint: disable-next=protected-access
+        session = api._get_session()
+        assert isinstance(session.connector, aiohttp.TCPConnector)
+        assert session.connector.limit == 5
+        assert session.connector.limit_per_host == 2
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_provided_session_not_closed() -> None:
+    """Test that closing the API object leaves a provided session open."""
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            # pylint: disable-next=protected-access
+            assert api._get_session() is session
+        assert not session.closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("coalesce_requests", [True, False])
+async def test_request_coalescing(
+    aresponses: ResponsesMockServer, coalesce_requests: bool
+) -> None:
+    """Test that identical in-flight requests share one network call.
+
+    Args:
+        aresponses: An aresponses server.
+        coalesce_requests: Whether requests should be coalesced.
+    """
+    num_requests = 2 if coalesce_requests else 4
+    for _ in range(num_requests):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/sensors",
+            "get",
+            response=aiohttp.web_response.json_response(
+                json.loads(load_fixture("get_sensors_response.json")), status=200
+            ),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(
+            TEST_API_KEY, session=session, coalesce_requests=coalesce_requests
+        ) as api:
+            responses = await asyncio.gather(
+                api.sensors.async_get_sensors(["name"], max_age=60),
+                api.sensors.async_get_sensors(["name"], max_age=60),
+                api.sensors.async_get_sensors(["name"], max_age=60),
+                # Different parameters mean a different request:
+                api.sensors.async_get_sensors(["name"], max_age=120),
+            )
+            assert (responses[0] is responses[1]) is coalesce_requests
+            assert responses[0] == responses[3]
+
+            if coalesce_requests:
+                assert api.coalescing_stats == CoalescingStats(calls=4, coalesced=2)
+            else:
+                assert api.coalescing_stats == CoalescingStats()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_response_cache(
+    aresponses: ResponsesMockServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that fresh responses are cached and stale ones are revalidated.
+
+    Args:
+        aresponses: An aresponses server.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    # The fixture's data timestamp:
+    now = 1667503531.0
+    monkeypatch.setattr("aiopurpleair.api.time.time", lambda: now)
+
+    sensors_response = json.loads(load_fixture("get_sensors_response.json"))
+    for _ in range(2):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/sensors",
+            "get",
+            response=aiohttp.web_response.json_response(sensors_response, status=200),
+        )
+    for _ in range(2):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/sensors",
+            "get",
+            response=aiohttp.web_response.json_response(
+                json.loads(load_fixture("error_unknown_response.json")), status=500
+            ),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(
+            TEST_API_KEY, session=session, cache_settings=CacheSettings()
+        ) as api:
+            assert api.cache is not None
+
+            response = await api.sensors.async_get_sensors(["name"])
+            assert await api.sensors.async_get_sensors(["name"]) is response
+            assert api.cache.stats.hits == 1
+
+            # Once the response is stale, it's still returned while it's refreshed:
+            now += 121
+            assert await api.sensors.async_get_sensors(["name"]) is response
+            # ...but the refresh only happens once:
+            assert await api.sensors.async_get_sensors(["name"]) is response
+            await asyncio.sleep(0.1)
+            refreshed = await api.sensors.async_get_sensors(["name"])
+            assert refreshed is not response
+            assert refreshed == response
+
+            # A failed refresh keeps the stale response:
+            now += 10
+            assert await api.sensors.async_get_sensors(["name"]) is refreshed
+            await asyncio.sleep(0.1)
+
+            # Once the stale window has passed, the next request blocks on the network:
+            now += 600
+            with pytest.raises(RequestError):
+                await api.sensors.async_get_sensors(["name"])
+
+            assert api.cache.stats == CacheStats(
+                hits=2,
+                stale_hits=3,
+                misses=2,
+                entries=0,
+                bytes=0,
+            )
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_close(aresponses: ResponsesMockServer) -> None:
+    """Test that closing the API cancels any background refresh.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/keys",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_keys_response.json")), status=200
+        ),
+    )
+
+    async with API(
+        TEST_API_KEY,
+        coalesce_requests=False,
+        cache_settings=CacheSettings(minimum_ttl=0.0, refresh_interval=0),
+    ) as api:
+        await api.async_check_api_key()
+        # The response has no data timestamp, so it's immediately stale:
+        await api.async_check_api_key()
+        # pylint: disable-next=protected-access
+        tasks = list(api._revalidation_tasks.values())
+        assert len(tasks) == 1
+
+    # The refresh has been cancelled and awaited by the time the API is closed:
+    assert all(task.cancelled() for task in tasks)
+    assert not api._revalidation_tasks  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_rate_limiting(aresponses: ResponsesMockServer) -> None:
+    """Test that requests are charged their actual cost in API points.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/keys",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_keys_response.json")), status=200
+        ),
+    )
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_sensors_response.json")), status=200
+        ),
+    )
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("error_unknown_response.json")), status=500
+        ),
+    )
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_sensors_response.json")), status=200
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(
+            TEST_API_KEY,
+            session=session,
+            rate_limit_settings=RateLimitSettings(refill_rate=0),
+        ) as api:
+            assert api.rate_limiter is not None
+
+            # Requests that don't return sensor data are free:
+            await api.async_check_api_key()
+            assert api.rate_limiter.stats == RateLimitStats()
+
+            # Requests are charged their estimated cost and then their actual cost:
+            await api.sensors.async_get_sensors(["name", "latitude"])
+            assert api.rate_limiter.stats == RateLimitStats(requests=1, points_spent=10)
+
+            # Failed requests are refunded:
+            with pytest.raises(RequestError):
+                await api.sensors.async_get_sensors(["name", "longitude"])
+            assert api.rate_limiter.stats.points_spent == 10
+
+            # Streamed responses are charged their estimated cost:
+            async for _ in api.sensors.async_iter_sensors(
+                ["name"], sensor_indices=[1, 2, 3]
+            ):
+                pass
+            assert api.rate_limiter.stats == RateLimitStats(requests=3, points_spent=13)
+            assert api.rate_limiter.available_points == 10_000 - 13
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_retries(aresponses: ResponsesMockServer) -> None:
+    """Test that requests are retried while the API is unavailable.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/keys",
+        "get",
+        response=aresponses.Response(
+            text="Service Unavailable", status=503, headers={"Retry-After": "0"}
+        ),
+    )
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/keys",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("error_unknown_response.json")), status=500
+        ),
+    )
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/keys",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_keys_response.json")), status=200
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(
+            TEST_API_KEY,
+            session=session,
+            retry_policy=RetryPolicy(RetrySettings(base_delay=0.001)),
+        ) as api:
+            response = await api.async_check_api_key()
+            assert response.api_key_type == ApiKeyType.READ
+            assert api.retry_policy is not None
+            assert api.retry_policy.stats == RetryStats(attempts=3, retries=2)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_service_unavailable(aresponses: ResponsesMockServer) -> None:
+    """Test that an unavailable API raises the right error.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    for _ in range(2):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/sensors",
+            "get",
+            response=aresponses.Response(
+                text="Too Many Requests", status=429, headers={"Retry-After": "30"}
+            ),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            with pytest.raises(ServiceUnavailableError) as err:
+                await api.sensors.async_get_sensors(["name"])
+            assert err.value.retry_after == 30
+            assert "Too Many Requests" in str(err.value)
+
+            with pytest.raises(ServiceUnavailableError):
+                async for _ in api.sensors.async_iter_sensors(["name"]):
+                    pass
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body,status,error",
+    [
+        ("not JSON", 200, "Error while parsing response from /keys"),
+        ('{"foo": "bar"}', 400, "Error while querying"),
+    ],
+)
+async def test_invalid_responses(
+    aresponses: ResponsesMockServer, body: str, status: int, error: str
+) -> None:
+    """Test responses that can't be decoded or that contain no error details.
+
+    Args:
+        aresponses: An aresponses server.
+        body: The response body.
+        status: The response status.
+        error: The expected error message.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/keys",
+        "get",
+        response=aresponses.Response(
+            text=body, status=status, content_type="application/json"
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            with pytest.raises(RequestError) as err:
+                await api.async_check_api_key()
+            assert error in str(err.value)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_json_decoder(aresponses: ResponsesMockServer) -> None:
+    """Test using a custom JSON decoder.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/keys",
+        "get",
+        response=aiohttp.web_response.json_response(
+            json.loads(load_fixture("get_keys_response.json")), status=200
+        ),
+    )
+
+    decoded: list[bytes] = []
+
+    def decoder(body: bytes) -> Any:
+        """Decode (and record) a response body.
+
+        Args:
+            body: The response body.
+
+        Returns:
+            The decoded data.
+        """
+        decoded.append(body)
+        return json.loads(body)
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session, json_decoder=decoder) as api:
+            response = await api.async_check_api_key()
+            assert response.api_key_type == ApiKeyType.READ
+            assert len(decoded) == 1
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_instrumentation(aresponses: ResponsesMockServer) -> None:
+    """Test that the phases of every request are measured.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    for _ in range(2):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/sensors",
+            "get",
+            response=aiohttp.web_response.json_response(
+                json.loads(load_fixture("get_sensors_response.json")), status=200
+            ),
+        )
+
+    received: list[RequestMetrics] = []
+
+    async with API(TEST_API_KEY, coalesce_requests=False) as api:
+        api.instrumentation.add_listener(received.append)
+        await api.sensors.async_get_sensors(["name"])
+        async for _ in api.sensors.async_iter_sensors(["name"]):
+            pass
+
+    metrics, stream_metrics = received
+    assert metrics.endpoint == "/sensors"
+    assert metrics.status == 200
+    assert metrics.rows == 5
+    assert metrics.response_bytes
+    for phase in ("connect", "ttfb", "download", "decode", "validate", "total"):
+        assert getattr(metrics, phase) is not None
+
+    assert stream_metrics.response_bytes == metrics.response_bytes
+    assert stream_metrics.ttfb is not None
+    assert stream_metrics.rows is None
+
+    snapshot = api.instrumentation.snapshot()
+    assert snapshot["total"].count == 2
+    assert snapshot["rows"].count == 1
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_map_url() -> None:
     """Test getting the map URL for a sensor index."""
-    api = API(TEST_API_KEY)
-    map_url = api.get_map_url(12345)
-    assert map_url == "https://map.purpleair.com/1/mAQI/a10/p604800/cC0?select=12345"
+    async with API(TEST_API_KEY) as api:
+        map_url = api.get_map_url(12345)
+        assert (
+            map_url == "https://map.purpleair.com/1/mAQI/a10/p604800/cC0?select=12345"
+        )
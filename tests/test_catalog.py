@@ -0,0 +1,130 @@
+"""Define tests for the sensor catalog."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any
+
+import aiohttp
+import pytest
+from aresponses import ResponsesMockServer
+
+from aiopurpleair import API
+from aiopurpleair.catalog import SensorCatalog
+from aiopurpleair.errors import PurpleAirError
+from tests.common import TEST_API_KEY, load_fixture
+
+
+def get_sensors_response(
+    fields: list[str], sensor_indices: list[int] | None = None
+) -> aiohttp.web.Response:
+    """Get a GET /v1/sensors response (optionally limited to certain sensors).
+
+    Args:
+        fields: The fields to include in the response.
+        sensor_indices: The sensor indices to include in the response.
+
+    Returns:
+        An aiohttp Response.
+    """
+    payload: dict[str, Any] = json.loads(load_fixture("get_sensors_response.json"))
+    positions = [payload["fields"].index(field) for field in fields]
+    payload["fields"] = fields
+    payload["data"] = [
+        [row[position] for position in positions]
+        for row in payload["data"]
+        if sensor_indices is None or row[0] in sensor_indices
+    ]
+    return aiohttp.web_response.json_response(payload, status=200)
+
+
+async def async_show_only_handler(request: aiohttp.web.Request) -> aiohttp.web.Response:
+    """Respond to a GET /v1/sensors request that filters by sensor index.
+
+    Args:
+        request: An aiohttp Request.
+
+    Returns:
+        An aiohttp Response.
+    """
+    sensor_indices = [int(index) for index in request.query["show_only"].split(",")]
+    # Pretend that sensor 131083 has been removed since the catalog was loaded:
+    return get_sensors_response(
+        ["sensor_index", "name", "latitude", "longitude"],
+        [index for index in sensor_indices if index != 131083],
+    )
+
+
+@pytest.mark.asyncio
+async def test_catalog(aresponses: ResponsesMockServer) -> None:
+    """Test loading and querying a sensor catalog.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    aresponses.add(
+        "api.purpleair.com",
+        "/v1/sensors",
+        "get",
+        response=get_sensors_response(["sensor_index", "latitude", "longitude"]),
+    )
+    for _ in range(2):
+        aresponses.add(
+            "api.purpleair.com", "/v1/sensors", "get", async_show_only_handler
+        )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            catalog = SensorCatalog(api.sensors)
+            await catalog.async_load()
+
+            # The sensor without a location isn't in the catalog:
+            assert len(catalog) == 4
+            assert catalog.data_timestamp_utc == datetime(2022, 11, 3, 19, 25, 31)
+
+            nearby = catalog.get_nearby_sensors(37.92122, -122.01889, 60)
+            assert [result.sensor.sensor_index for result in nearby] == [
+                131077,
+                131079,
+                131083,
+            ]
+            assert nearby[0].distance == pytest.approx(2.2331696896)
+            assert nearby[0].sensor.name is None
+            assert not catalog.get_nearby_sensors(0.0, 0.0, 60)
+            assert [
+                result.sensor.sensor_index
+                for result in catalog.get_nearest_sensors(37.92122, -122.01889, 2)
+            ] == [131077, 131079]
+
+            # Live data is only requested for the matching sensors:
+            live = await catalog.async_get_nearby_sensors(
+                ["name"], 37.92122, -122.01889, 60, limit_results=2
+            )
+            assert [
+                (result.sensor.sensor_index, result.sensor.name) for result in live
+            ] == [
+                (131077, "BEE Patio"),
+                (131079, "BRSKBV-outside"),
+            ]
+            assert live[0].distance == nearby[0].distance
+
+            live = await catalog.async_get_nearest_sensors(
+                ["name"], 37.92122, -122.01889, 3
+            )
+            assert [result.sensor.sensor_index for result in live] == [131077, 131079]
+
+            # No request is made when nothing matches:
+            assert not await catalog.async_get_nearby_sensors(["name"], 0.0, 0.0, 60)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_catalog_not_loaded() -> None:
+    """Test querying a catalog that hasn't been loaded."""
+    async with API(TEST_API_KEY) as api:
+        catalog = SensorCatalog(api.sensors)
+        with pytest.raises(PurpleAirError) as err:
+            _ = catalog.get_nearby_sensors(37.92122, -122.01889, 60)
+    assert "The sensor catalog hasn't been loaded" in str(err.value)
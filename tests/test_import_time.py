@@ -0,0 +1,70 @@
+"""Define tests for the cost of importing the package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import aiopurpleair
+
+# A generous budget (in microseconds) for importing the package itself, which should
+# load nothing heavy:
+PACKAGE_IMPORT_BUDGET = 100000
+
+
+def get_import_times(statement: str) -> dict[str, int]:
+    """Get the cumulative import time of every module imported by a statement.
+
+    Args:
+        statement: The Python statement to run (in a fresh interpreter).
+
+    Returns:
+        The cumulative import time (in microseconds) of each module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+def test_import_api() -> None:
+    """Test that the API object doesn't import the sensor models until they're used."""
+    import_times = get_import_times("from aiopurpleair import API")
+    assert "aiopurpleair.api" in import_times
+    for module in ("aiopurpleair.models.sensors", "numpy"):
+        assert module not in import_times
+
+
+def test_import_package() -> None:
+    """Test that importing the package is cheap."""
+    import_times = get_import_times("import aiopurpleair")
+    assert import_times["aiopurpleair"] < PACKAGE_IMPORT_BUDGET
+    for module in ("aiohttp", "aiopurpleair.api", "numpy", "pydantic"):
+        assert module not in import_times
+
+
+def test_import_sensor_models() -> None:
+    """Test that the sensor models don't build their schemas until they're used."""
+    import_times = get_import_times(
+        "from aiopurpleair.models.sensors import SensorModel; "
+        "assert not SensorModel.__pydantic_complete__"
+    )
+    assert "numpy" not in import_times
+
+
+def test_unknown_attribute() -> None:
+    """Test that an unknown attribute of the package raises the usual error."""
+    with pytest.raises(AttributeError):
+        _ = aiopurpleair.Unknown
@@ -0,0 +1,178 @@
+"""Define tests for the sensor mirror."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import aiohttp
+import pytest
+from aresponses import ResponsesMockServer
+
+from aiopurpleair import API
+from aiopurpleair.const import LocationType
+from aiopurpleair.mirror import SensorMirror, SyncStats
+from tests.common import TEST_API_KEY
+
+DATA_TIMESTAMP = 1667503531
+
+
+def get_sensors_handler(
+    data_timestamp: int, rows: list[list[Any]], expected_query: dict[str, str]
+) -> Any:
+    """Get a handler for a GET /v1/sensors request that checks its query.
+
+    Args:
+        data_timestamp: The data timestamp of the response.
+        rows: The rows of sensor data (sensor_index, name, last_modified, last_seen).
+        expected_query: The query parameters the request should have.
+
+    Returns:
+        An aresponses handler.
+    """
+
+    async def handler(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Respond to a GET /v1/sensors request.
+
+        Args:
+            request: An aiohttp Request.
+
+        Returns:
+            An aiohttp Response.
+        """
+        assert dict(request.query) == expected_query
+        return aiohttp.web_response.json_response(
+            {
+                "api_version": "V1.0.11-0.0.41",
+                "time_stamp": data_timestamp + 10,
+                "data_time_stamp": data_timestamp,
+                "max_age": 3600,
+                "firmware_default_version": "7.02",
+                "fields": ["sensor_index", "name", "last_modified", "last_seen"],
+                "data": rows,
+            },
+            status=200,
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_mirror(aresponses: ResponsesMockServer) -> None:
+    """Test syncing a sensor mirror.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    for data_timestamp, rows, query in (
+        (
+            DATA_TIMESTAMP,
+            [
+                [1, "A", DATA_TIMESTAMP - 100, DATA_TIMESTAMP - 100],
+                [2, "B", DATA_TIMESTAMP - 5000, DATA_TIMESTAMP - 10],
+            ],
+            {"fields": "name,last_seen", "max_age": "3600", "location_type": "0"},
+        ),
+        (
+            DATA_TIMESTAMP + 4000,
+            [
+                [2, "B2", DATA_TIMESTAMP + 3990, DATA_TIMESTAMP + 3990],
+                [3, "C", DATA_TIMESTAMP - 9000, DATA_TIMESTAMP + 3995],
+            ],
+            {
+                "fields": "name,last_seen",
+                "max_age": "3600",
+                "location_type": "0",
+                "modified_since": str(DATA_TIMESTAMP),
+            },
+        ),
+        (
+            DATA_TIMESTAMP + 4060,
+            [],
+            {
+                "fields": "name,last_seen",
+                "max_age": "3600",
+                "location_type": "0",
+                "modified_since": str(DATA_TIMESTAMP + 4000),
+            },
+        ),
+        (
+            DATA_TIMESTAMP + 4120,
+            [[3, "C", DATA_TIMESTAMP - 9000, DATA_TIMESTAMP + 3995]],
+            {"fields": "name,last_seen", "max_age": "3600", "location_type": "0"},
+        ),
+    ):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/sensors",
+            "get",
+            get_sensors_handler(data_timestamp, rows, query),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            mirror = SensorMirror(
+                api.sensors, ["name"], max_age=3600, location_type=LocationType.OUTSIDE
+            )
+
+            assert await mirror.async_sync() == {1, 2}
+            assert sorted(mirror.data) == [1, 2]
+            assert mirror.data_timestamp_utc == datetime(2022, 11, 3, 19, 25, 31)
+
+            # Sensor 1 hasn't been seen within the maximum age, so it's removed (while
+            # sensor 3 is kept, even though it hasn't been modified for much longer):
+            assert await mirror.async_sync() == {1, 2, 3}
+            assert sorted(mirror.data) == [2, 3]
+            assert mirror.data[2].name == "B2"
+
+            assert await mirror.async_sync() == set()
+            assert sorted(mirror.data) == [2, 3]
+
+            # A full sync drops sensors that no longer match:
+            assert await mirror.async_sync(full=True) == {2, 3}
+            assert sorted(mirror.data) == [3]
+
+            assert mirror.stats == SyncStats(
+                full_syncs=2, delta_syncs=2, sensors_received=5, sensors_removed=1
+            )
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_mirror_no_max_age(aresponses: ResponsesMockServer) -> None:
+    """Test that sensors never expire without a maximum age.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    for data_timestamp, rows, query in (
+        (
+            DATA_TIMESTAMP,
+            [[1, "A", DATA_TIMESTAMP - 100, DATA_TIMESTAMP - 100]],
+            {"fields": "name,last_modified,last_seen"},
+        ),
+        (
+            DATA_TIMESTAMP + 999999,
+            [],
+            {
+                "fields": "name,last_modified,last_seen",
+                "modified_since": str(DATA_TIMESTAMP),
+            },
+        ),
+    ):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/sensors",
+            "get",
+            get_sensors_handler(data_timestamp, rows, query),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            mirror = SensorMirror(api.sensors, ["name", "last_modified"])
+            await mirror.async_sync()
+            assert await mirror.async_sync() == set()
+            assert list(mirror.data) == [1]
+
+    aresponses.assert_plan_strictly_followed()
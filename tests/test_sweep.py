@@ -0,0 +1,207 @@
+"""Define tests for the region sweeper."""
+
+from __future__ import annotations
+
+import aiohttp
+import pytest
+from aresponses import ResponsesMockServer
+
+from aiopurpleair import API
+from aiopurpleair.const import LocationType
+from aiopurpleair.errors import RequestError
+from aiopurpleair.sweep import RegionSweeper, SweepSettings, SweepStats, Tile
+from aiopurpleair.testing import FakePurpleAirServer, FakeServerSettings
+from tests.common import TEST_API_KEY
+
+
+@pytest.mark.asyncio
+async def test_sweep() -> None:
+    """Test sweeping the whole world with a layout that adapts to the sensors."""
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=5000)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            everything = await api.sensors.async_get_sensors(["name"])
+            sweeper = RegionSweeper(
+                api.sensors,
+                ["name"],
+                settings=SweepSettings(max_concurrency=2, max_rows_per_tile=300),
+            )
+
+            sensors = await sweeper.async_sweep()
+            assert sensors.keys() == everything.data.keys()
+            assert all(
+                sensor.name == everything.data[sensor_index].name
+                for sensor_index, sensor in sensors.items()
+            )
+            assert sweeper.stats.requests == 4
+            assert sweeper.stats.tiles_split > 0
+            assert len(sweeper.layout) > 4
+            assert all(rows <= 300 for rows in sweeper.layout.values())
+
+            # The next sweep starts from the balanced layout:
+            layout = dict(sweeper.layout)
+            assert (await sweeper.async_sweep()).keys() == everything.data.keys()
+            assert sweeper.stats.requests == 4 + len(layout)
+            assert sweeper.layout == layout
+            assert sweeper.stats.sweeps == 2
+
+
+@pytest.mark.asyncio
+async def test_sweep_filters() -> None:
+    """Test that filters are applied to every tile."""
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=1000)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            sweeper = RegionSweeper(
+                api.sensors,
+                ["location_type"],
+                nw_latitude=50,
+                nw_longitude=-130,
+                se_latitude=20,
+                se_longitude=-60,
+                location_type=LocationType.INSIDE,
+            )
+            sensors = await sweeper.async_sweep()
+
+    assert sensors
+    assert all(
+        sensor.location_type is LocationType.INSIDE
+        and 20 <= sensor.latitude <= 50  # type: ignore[operator]
+        and -130 <= sensor.longitude <= -60  # type: ignore[operator]
+        for sensor in sensors.values()
+    )
+
+
+@pytest.mark.asyncio
+async def test_sweep_max_depth() -> None:
+    """Test that tiles aren't split beyond the maximum depth."""
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=1000)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            sweeper = RegionSweeper(
+                api.sensors,
+                ["name"],
+                settings=SweepSettings(max_depth=2, max_rows_per_tile=1),
+            )
+            await sweeper.async_sweep()
+
+    assert max(tile.depth for tile in sweeper.layout) == 2
+
+
+@pytest.mark.asyncio
+async def test_sweep_merge() -> None:
+    """Test that sparse tiles are merged."""
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=100)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            sweeper = RegionSweeper(
+                api.sensors, ["name"], settings=SweepSettings(initial_depth=2)
+            )
+            assert len(await sweeper.async_sweep()) == 100
+            assert sweeper.layout == {Tile(0, 0, 0): 100}
+
+            assert len(await sweeper.async_sweep()) == 100
+            assert sweeper.stats == SweepStats(
+                sweeps=2, requests=17, sensors_received=200, tiles_merged=5
+            )
+
+
+@pytest.mark.asyncio
+async def test_sweep_duplicates(aresponses: ResponsesMockServer) -> None:
+    """Test that sensors on the edges of tiles are only returned once.
+
+    Args:
+        aresponses: An aresponses server.
+    """
+    for _ in range(4):
+        aresponses.add(
+            "api.purpleair.com",
+            "/v1/sensors",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {
+                    "api_version": "V1.0.11-0.0.41",
+                    "time_stamp": 1667503541,
+                    "data_time_stamp": 1667503531,
+                    "max_age": 604800,
+                    "firmware_default_version": "7.02",
+                    "fields": ["sensor_index", "latitude", "longitude"],
+                    "data": [[131075, 5.0, 5.0], [131079, None, None]],
+                },
+                status=200,
+            ),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        async with API(TEST_API_KEY, session=session) as api:
+            sweeper = RegionSweeper(
+                api.sensors,
+                ["latitude", "longitude"],
+                nw_latitude=10,
+                nw_longitude=0,
+                se_latitude=0,
+                se_longitude=10,
+            )
+            sensors = await sweeper.async_sweep()
+            assert sorted(sensors) == [131075, 131079]
+            assert sweeper.stats.sensors_received == 8
+            assert sweeper.stats.duplicates == 6
+
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_tile_box() -> None:
+    """Test getting the bounding box of a tile."""
+    sweeper = RegionSweeper(
+        None,  # type: ignore[arg-type]
+        ["name"],
+        nw_latitude=50,
+        nw_longitude=-130,
+        se_latitude=20,
+        se_longitude=-60,
+    )
+    assert sweeper.get_tile_box(Tile(0, 0, 0)) == (50, -130, 20, -60)
+    assert sweeper.get_tile_box(Tile(1, 1, 0)) == (50, -95, 35, -60)
+    assert sweeper.get_tile_box(Tile(2, 0, 3)) == (27.5, -130, 20, -112.5)
+    assert Tile(2, 0, 3).parent.children == [
+        Tile(2, 0, 2),
+        Tile(2, 1, 2),
+        Tile(2, 0, 3),
+        Tile(2, 1, 3),
+    ]
+
+
+@pytest.mark.parametrize(
+    "nw_latitude,nw_longitude,se_latitude,se_longitude",
+    [(20, -130, 50, -60), (50, -60, 20, -130), (50, -130, 50, -60)],
+)
+def test_invalid_region(
+    nw_latitude: float, nw_longitude: float, se_latitude: float, se_longitude: float
+) -> None:
+    """Test that a region whose corners are swapped is rejected.
+
+    Args:
+        nw_latitude: The latitude of the NW corner of the region.
+        nw_longitude: The longitude of the NW corner of the region.
+        se_latitude: The latitude of the SE corner of the region.
+        se_longitude: The longitude of the SE corner of the region.
+    """
+    with pytest.raises(ValueError) as err:
+        RegionSweeper(
+            None,  # type: ignore[arg-type]
+            ["name"],
+            nw_latitude=nw_latitude,
+            nw_longitude=nw_longitude,
+            se_latitude=se_latitude,
+            se_longitude=se_longitude,
+        )
+    assert "The NW corner of the region must be NW of its SE corner" in str(err.value)
+
+
+@pytest.mark.asyncio
+async def test_sweep_failure() -> None:
+    """Test that a tile that can't be requested fails the sweep."""
+    async with FakePurpleAirServer(FakeServerSettings(error_rate=1.0)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            sweeper = RegionSweeper(api.sensors, ["name"])
+            with pytest.raises(RequestError):
+                await sweeper.async_sweep()
+
+    assert sweeper.stats.sweeps == 0
+    assert not any(sweeper.layout.values())
@@ -0,0 +1 @@
+"""Define tests for testing tools."""
@@ -0,0 +1,236 @@
+"""Define tests for the fake PurpleAir server."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import aiohttp
+import pytest
+
+from aiopurpleair import API
+from aiopurpleair.const import ChannelFlag, LocationType
+from aiopurpleair.errors import (
+    InvalidApiKeyError,
+    NotFoundError,
+    ServiceUnavailableError,
+)
+from aiopurpleair.models.keys import ApiKeyType, GetKeysResponse
+from aiopurpleair.testing import (
+    FakePurpleAirServer,
+    FakeServerSettings,
+    FakeServerStats,
+)
+from aiopurpleair.testing.server import FIRST_SENSOR_INDEX
+from tests.common import TEST_API_KEY, import_module_without
+
+
+@pytest.mark.asyncio
+async def test_api_key() -> None:
+    """Test that the server can require a specific API key."""
+    async with FakePurpleAirServer(FakeServerSettings(api_key=TEST_API_KEY)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            response = await api.async_check_api_key()
+            assert response.api_key_type == ApiKeyType.READ
+
+        async with API("bad_key", base_url=server.base_url) as api:
+            with pytest.raises(InvalidApiKeyError):
+                await api.async_check_api_key()
+
+        async with API("", base_url=server.base_url) as api:
+            with pytest.raises(InvalidApiKeyError):
+                await api.async_check_api_key()
+
+
+@pytest.mark.asyncio
+async def test_error_rate() -> None:
+    """Test injecting server errors."""
+    async with FakePurpleAirServer(FakeServerSettings(error_rate=1.0)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            with pytest.raises(ServiceUnavailableError):
+                await api.async_check_api_key()
+        assert server.stats == FakeServerStats(requests=1, errors=1)
+
+
+@pytest.mark.asyncio
+async def test_get_sensor() -> None:
+    """Test getting a single sensor."""
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=10)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            # Every field is returned by default:
+            response = await api.sensors.async_get_sensor(FIRST_SENSOR_INDEX + 3)
+            assert response.sensor.sensor_index == FIRST_SENSOR_INDEX + 3
+            assert response.sensor.name == f"Sensor {FIRST_SENSOR_INDEX + 3}"
+            assert isinstance(response.sensor.channel_flags, ChannelFlag)
+            assert response.sensor.stats is not None
+            assert response.sensor.is_owner is not None
+
+            response = await api.sensors.async_get_sensor(
+                FIRST_SENSOR_INDEX, fields=["humidity"]
+            )
+            assert response.sensor.humidity is not None
+            assert response.sensor.temperature is None
+
+            with pytest.raises(NotFoundError):
+                await api.sensors.async_get_sensor(FIRST_SENSOR_INDEX + 10)
+
+
+@pytest.mark.asyncio
+async def test_get_sensors() -> None:
+    """Test getting synthetic sensors at scale."""
+    settings = FakeServerSettings(num_sensors=10000, seed=42)
+    async with FakePurpleAirServer(settings) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            response = await api.sensors.async_get_sensors(
+                ["name", "latitude", "longitude", "pm2.5"], max_age=0
+            )
+            assert len(response.data) == 10000
+            sensor = response.data[FIRST_SENSOR_INDEX]
+            assert -60 <= sensor.latitude <= 70  # type: ignore[operator]
+            assert -180 <= sensor.longitude <= 180  # type: ignore[operator]
+            assert 0 <= sensor.pm2_5 <= 100  # type: ignore[operator]
+
+            # The same seed always generates the same data:
+            async with FakePurpleAirServer(settings) as other_server:
+                async with API(TEST_API_KEY, base_url=other_server.base_url) as other:
+                    other_response = await other.sensors.async_get_sensors(
+                        ["name", "latitude", "longitude", "pm2.5"], max_age=0
+                    )
+            assert other_response.data == response.data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs,field,check",
+    [
+        (
+            {"sensor_indices": [FIRST_SENSOR_INDEX + 5, FIRST_SENSOR_INDEX + 2, 1]},
+            "name",
+            lambda sensor: (
+                sensor.sensor_index in (FIRST_SENSOR_INDEX + 2, FIRST_SENSOR_INDEX + 5)
+            ),
+        ),
+        (
+            {"location_type": LocationType.INSIDE},
+            "location_type",
+            lambda sensor: sensor.location_type is LocationType.INSIDE,
+        ),
+        (
+            {"max_age": 3600},
+            "last_seen",
+            lambda sensor: (
+                (
+                    datetime.now(timezone.utc).replace(tzinfo=None)
+                    - sensor.last_seen_utc
+                ).total_seconds()
+                <= 3605
+            ),
+        ),
+        (
+            {"modified_since_utc": datetime.now(timezone.utc) - timedelta(days=1)},
+            "last_modified",
+            lambda sensor: (
+                (
+                    datetime.now(timezone.utc).replace(tzinfo=None)
+                    - sensor.last_modified_utc
+                ).total_seconds()
+                <= 86405
+            ),
+        ),
+        (
+            {
+                "nw_latitude": 50,
+                "nw_longitude": -130,
+                "se_latitude": 20,
+                "se_longitude": -60,
+            },
+            "latitude",
+            lambda sensor: (
+                20 <= sensor.latitude <= 50 and -130 <= sensor.longitude <= -60
+            ),
+        ),
+    ],
+)
+async def test_get_sensors_filters(
+    kwargs: dict[str, Any], field: str, check: Any
+) -> None:
+    """Test filtering sensors.
+
+    Args:
+        kwargs: The filters to apply.
+        field: A field to request.
+        check: A function that checks that a sensor matches the filters.
+    """
+    async with FakePurpleAirServer(FakeServerSettings(num_sensors=1000)) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            response = await api.sensors.async_get_sensors(
+                [field, "longitude"], **kwargs
+            )
+    assert 0 < len(response.data) < 1000
+    assert all(check(sensor) for sensor in response.data.values())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "endpoint,query",
+    [
+        ("/sensors", ""),
+        ("/sensors", "?fields=name,bogus"),
+        ("/sensors", "?fields=name&nwlat=50"),
+        ("/sensors", "?fields=name&max_age=soon"),
+        (f"/sensors/{FIRST_SENSOR_INDEX}", "?fields=name,bogus"),
+    ],
+)
+async def test_invalid_requests(endpoint: str, query: str) -> None:
+    """Test that invalid requests are rejected.
+
+    Args:
+        endpoint: A relative API endpoint.
+        query: The query string of the request.
+    """
+    async with FakePurpleAirServer() as server, aiohttp.ClientSession() as session:
+        async with session.get(f"{server.base_url}{endpoint}{query}") as resp:
+            assert resp.status == 400
+            assert "error" in await resp.json()
+
+
+@pytest.mark.asyncio
+async def test_latency() -> None:
+    """Test injecting latency."""
+    settings = FakeServerSettings(latency=0.05, latency_jitter=0.01)
+    async with FakePurpleAirServer(settings) as server:
+        async with API(TEST_API_KEY, base_url=server.base_url) as api:
+            await api.async_check_api_key()
+            total = api.instrumentation.snapshot()["total"]
+            assert total.minimum is not None and total.minimum >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_throttling() -> None:
+    """Test throttling requests beyond a rate."""
+    settings = FakeServerSettings(max_requests_per_second=2)
+    async with FakePurpleAirServer(settings) as server:
+        async with API(
+            TEST_API_KEY, base_url=server.base_url, coalesce_requests=False
+        ) as api:
+            results = await asyncio.gather(
+                *(api.async_check_api_key() for _ in range(3)), return_exceptions=True
+            )
+        assert all(isinstance(result, GetKeysResponse) for result in results[:2])
+        assert isinstance(results[2], ServiceUnavailableError)
+        assert results[2].retry_after == 1
+        assert server.stats == FakeServerStats(requests=3, throttled=1)
+
+    # Stopping a stopped server does nothing:
+    await server.async_stop()
+
+
+def test_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that responses are encoded with the json module when orjson isn't installed.
+
+    Args:
+        monkeypatch: A pytest MonkeyPatch object.
+    """
+    module = import_module_without(monkeypatch, "aiopurpleair.testing.server", "orjson")
+    assert module._dumps({"fields": ["name"]}) == b'{"fields": ["name"]}'
@@ -1,8 +1,35 @@
 """Define geographical util tests."""
 
+from __future__ import annotations
+
 import pytest
 
-from aiopurpleair.util.geo import GeoLocation
+from aiopurpleair.util import geo
+from aiopurpleair.util.geo import (
+    GeoLocation,
+    get_nearby_positions,
+    get_nearest_positions,
+    group_bounding_boxes,
+)
+
+
+@pytest.fixture(name="numpy_available", params=[True, False])
+def numpy_available_fixture(
+    monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> bool:
+    """Define a fixture that runs a test with and without NumPy.
+
+    Args:
+        monkeypatch: A pytest MonkeyPatch object.
+        request: A pytest FixtureRequest object.
+
+    Returns:
+        Whether NumPy is available.
+    """
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(geo, "NUMPY_AVAILABLE", request.param)
+    return bool(request.param)
 
 
 @pytest.mark.parametrize(
@@ -44,6 +71,15 @@ from aiopurpleair.util.geo import GeoLocation
             85.4084,
             180.0,
         ),
+        (
+            -89.9,
+            0.2,
+            500,
+            -85.4084,
+            -180.0,
+            -90.0,
+            180.0,
+        ),
     ],
 )
 def test_geo_location_bounding_box(  # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -75,6 +111,78 @@ def test_geo_location_bounding_box(  # pylint: disable=too-many-arguments,too-ma
     assert round(se_coordinate.longitude_degrees, 5) == se_longitude
 
 
+@pytest.mark.parametrize(
+    "latitude,longitude,distance_km,boxes",
+    [
+        (
+            51.5285582,
+            -0.2416796,
+            5,
+            [((51.57347, -0.31388), (51.48364, -0.16948))],
+        ),
+        (
+            0.2,
+            179.99999999999,
+            500,
+            [
+                ((4.6916, 175.50837), (-4.2916, 180.0)),
+                ((4.6916, -180.0), (-4.2916, -175.50837)),
+            ],
+        ),
+        (
+            0.2,
+            -179.99999999999,
+            500,
+            [
+                ((4.6916, 175.50837), (-4.2916, 180.0)),
+                ((4.6916, -180.0), (-4.2916, -175.50837)),
+            ],
+        ),
+        (
+            89.9,
+            0.2,
+            500,
+            [((90.0, -180.0), (85.4084, 180.0))],
+        ),
+        (
+            -89.9,
+            0.2,
+            500,
+            [((-85.4084, -180.0), (-90.0, 180.0))],
+        ),
+    ],
+)
+def test_geo_location_bounding_boxes(
+    latitude: float,
+    longitude: float,
+    distance_km: float,
+    boxes: list[tuple[tuple[float, float], tuple[float, float]]],
+) -> None:
+    """Test getting bounding boxes that never cross the antimeridian.
+
+    Args:
+        latitude: The central latitude.
+        longitude: The central longitude.
+        distance_km: The bounding box distance (in kilometers).
+        boxes: The expected NW and SE corners (as latitude/longitude pairs).
+    """
+    location = GeoLocation.from_degrees(latitude, longitude)
+    # We round to prevent floating point errors in CI:
+    assert [
+        (
+            (
+                round(nw_coordinate.latitude_degrees, 5),
+                round(nw_coordinate.longitude_degrees, 5),
+            ),
+            (
+                round(se_coordinate.latitude_degrees, 5),
+                round(se_coordinate.longitude_degrees, 5),
+            ),
+        )
+        for nw_coordinate, se_coordinate in location.bounding_boxes(distance_km)
+    ] == boxes
+
+
 def test_geo_location_bounding_box_invalid_distance() -> None:
     """Test an error with an invalid bounding box distance."""
     location = GeoLocation.from_degrees(51.5285582, -0.2416796)
@@ -88,7 +196,193 @@ def test_geo_location_distance_to() -> None:
     london = GeoLocation.from_degrees(51.5285582, -0.2416796)
     liverpool = GeoLocation.from_degrees(53.4121569, -2.9860979)
     distance = london.distance_to(liverpool)
-    assert distance == 280.31725082207095
+    assert distance == pytest.approx(280.31725082207095)
+
+
+def test_geo_location_distance_to_nearby() -> None:
+    """Test that the distance between very close points doesn't lose precision."""
+    location = GeoLocation.from_degrees(37.92122, -122.01889)
+    assert location.distance_to(location) == 0.0
+    # Roughly 1.1 centimeters:
+    nearby = GeoLocation.from_degrees(37.9212201, -122.01889)
+    assert location.distance_to(nearby) == pytest.approx(1.11317e-5, rel=1e-4)
+
+
+def test_geo_location_distances_to(numpy_available: bool) -> None:
+    """Test getting the distances between a GeoLocation and many coordinates.
+
+    Args:
+        numpy_available: Whether NumPy is available.
+    """
+    london = GeoLocation.from_degrees(51.5285582, -0.2416796)
+    coordinates = [
+        (53.4121569, -2.9860979),
+        (51.5285582, -0.2416796),
+        (-33.8688, 151.2093),
+        (-51.5285582, 179.7583204),
+    ]
+
+    distances = london.distances_to(
+        [latitude for latitude, _ in coordinates],
+        [longitude for _, longitude in coordinates],
+    )
+
+    assert list(distances) == pytest.approx(
+        [
+            london.distance_to(GeoLocation.from_degrees(latitude, longitude))
+            for latitude, longitude in coordinates
+        ]
+    )
+    # The last coordinate is antipodal to London:
+    assert distances[3] == pytest.approx(20037.4, abs=0.1)
+    assert not list(london.distances_to([], []))
+
+
+@pytest.mark.parametrize(
+    "distance_km,positions",
+    [
+        (0, [1]),
+        (300, [0, 1]),
+        (20000, [0, 1, 2]),
+        (30000, [0, 1, 2, 3]),
+    ],
+)
+def test_geo_location_distances_within(
+    numpy_available: bool, distance_km: float, positions: list[int]
+) -> None:
+    """Test finding the coordinates within a distance of a GeoLocation.
+
+    Args:
+        numpy_available: Whether NumPy is available.
+        distance_km: The distance (in kilometers).
+        positions: The expected positions of the coordinates within the distance.
+    """
+    london = GeoLocation.from_degrees(51.5285582, -0.2416796)
+    latitudes = [53.4121569, 51.5285582, -33.8688, -51.5285582]
+    longitudes = [-2.9860979, -0.2416796, 151.2093, 179.7583204]
+
+    within_positions, distances = london.distances_within(
+        latitudes, longitudes, distance_km
+    )
+    assert within_positions == positions
+    assert list(distances) == pytest.approx(
+        [list(london.distances_to(latitudes, longitudes))[i] for i in positions]
+    )
+    assert london.distances_within([], [], distance_km)[0] == []
+
+
+@pytest.mark.parametrize(
+    "limit,positions",
+    [
+        (None, [3, 1, 4, 0, 2, 5]),
+        (1, [3]),
+        (2, [3, 1]),
+        (3, [3, 1, 4]),
+        (6, [3, 1, 4, 0, 2, 5]),
+        (10, [3, 1, 4, 0, 2, 5]),
+        (0, []),
+    ],
+)
+def test_get_nearest_positions(
+    numpy_available: bool, limit: int | None, positions: list[int]
+) -> None:
+    """Test selecting the positions of the nearest distances.
+
+    Args:
+        numpy_available: Whether NumPy is available.
+        limit: The number of positions to select.
+        positions: The expected positions.
+    """
+    distances = [5.0, 2.0, 7.0, 1.0, 2.0, 9.0]
+    assert get_nearest_positions(distances, limit) == positions
+
+
+def test_group_bounding_boxes() -> None:
+    """Test grouping the bounding boxes of nearby points."""
+    origins = [
+        GeoLocation.from_degrees(37.92122, -122.01889),
+        GeoLocation.from_degrees(-17.7, 179.99),
+        GeoLocation.from_degrees(37.75315, -122.44364),
+        GeoLocation.from_degrees(51.5285582, -0.2416796),
+    ]
+
+    groups = group_bounding_boxes(origins, 10, 1000)
+    # The two points in the San Francisco Bay Area share a group, while the one near
+    # the antimeridian is in two groups (one for each side):
+    assert [list(group.members) for group in groups] == [[0, 2], [1], [1], [3]]
+
+    for group in groups:
+        for member, boxes in group.members.items():
+            assert all(box in origins[member].bounding_boxes(10) for box in boxes)
+            for nw_coordinate, se_coordinate in boxes:
+                assert (
+                    group.se_coordinate.latitude_degrees
+                    <= se_coordinate.latitude_degrees
+                    <= nw_coordinate.latitude_degrees
+                    <= group.nw_coordinate.latitude_degrees
+                )
+                assert (
+                    group.nw_coordinate.longitude_degrees
+                    <= nw_coordinate.longitude_degrees
+                    <= se_coordinate.longitude_degrees
+                    <= group.se_coordinate.longitude_degrees
+                )
+
+    # Smaller cells merge fewer points:
+    assert len(group_bounding_boxes(origins, 10, 100)) == 5
+
+
+@pytest.mark.parametrize("distance_km", [None, 50])
+@pytest.mark.parametrize("limit", [None, 2])
+def test_get_nearby_positions(
+    numpy_available: bool, distance_km: float | None, limit: int | None
+) -> None:
+    """Test getting the points within the bounding boxes of several origins.
+
+    Args:
+        numpy_available: Whether NumPy is available.
+        distance_km: An optional maximum distance.
+        limit: An optional limit.
+    """
+    origins = [
+        GeoLocation.from_degrees(37.92122, -122.01889),
+        GeoLocation.from_degrees(37.7749, -122.4194),
+        GeoLocation.from_degrees(-17.7, 179.9),
+    ]
+    boxes = [origin.bounding_boxes(60) for origin in origins]
+    latitudes = [37.93273, 37.75315, 38.287594, 33.51511, -17.5, -17.9]
+    longitudes = [-122.03972, -122.44364, -122.46281, -117.67972, -179.9, 179.5]
+
+    results = get_nearby_positions(
+        origins, boxes, latitudes, longitudes, distance_km=distance_km, limit=limit
+    )
+
+    for origin, origin_boxes, result in zip(origins, boxes, results):  # noqa: B905
+        distances = origin.distances_to(latitudes, longitudes)
+        expected = sorted(
+            (
+                (position, float(distances[position]))
+                for position, (latitude, longitude) in enumerate(
+                    zip(latitudes, longitudes)  # noqa: B905
+                )
+                if any(
+                    se.latitude_degrees <= latitude <= nw.latitude_degrees
+                    and nw.longitude_degrees <= longitude <= se.longitude_degrees
+                    for nw, se in origin_boxes
+                )
+                and (distance_km is None or distances[position] <= distance_km)
+            ),
+            key=lambda item: item[1],
+        )[:limit]
+        assert [position for position, _ in result] == [
+            position for position, _ in expected
+        ]
+        assert [distance for _, distance in result] == pytest.approx(
+            [distance for _, distance in expected]
+        )
+
+    assert results[2] and all(position in (4, 5) for position, _ in results[2])
+    assert get_nearby_positions(origins, boxes, [], []) == [[], [], []]
 
 
 def test_geo_location_from_degrees() -> None:
@@ -0,0 +1,97 @@
+"""Define spatial index tests."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from aiopurpleair.util.geo import GeoLocation
+from aiopurpleair.util.spatial import GridIndex
+
+
+def brute_force(
+    latitudes: list[float],
+    longitudes: list[float],
+    latitude: float,
+    longitude: float,
+) -> list[tuple[int, float]]:
+    """Get the distance to every coordinate, sorted from nearest to furthest.
+
+    Args:
+        latitudes: The latitudes of the coordinates.
+        longitudes: The longitudes of the coordinates.
+        latitude: The latitude of the point to measure from.
+        longitude: The longitude of the point to measure from.
+
+    Returns:
+        The positions of (and distances to) every coordinate.
+    """
+    distances = GeoLocation.from_degrees(latitude, longitude).distances_to(
+        latitudes, longitudes
+    )
+    return sorted(
+        ((position, float(distance)) for position, distance in enumerate(distances)),
+        key=lambda match: match[1],
+    )
+
+
+@pytest.mark.parametrize("cell_size_degrees", [0.25, 0.7, 5.0])
+@pytest.mark.parametrize(
+    "latitude,longitude,distance_km",
+    [
+        (37.92122, -122.01889, 50),
+        (0.2, 179.99, 500),
+        (-0.2, -179.99, 500),
+        (89.9, 0.2, 100),
+        (-89.99, 45.0, 2000),
+        (60.0, 10.0, 5000),
+    ],
+)
+def test_grid_index_matches_brute_force(
+    cell_size_degrees: float, latitude: float, longitude: float, distance_km: float
+) -> None:
+    """Test that radius and nearest-neighbor queries match a brute-force search.
+
+    Args:
+        cell_size_degrees: The size of each cell in the index.
+        latitude: The latitude of the search center.
+        longitude: The longitude of the search center.
+        distance_km: The search radius.
+    """
+    rand = random.Random(0)
+    latitudes = [rand.uniform(-90, 90) for _ in range(5000)]
+    longitudes = [rand.uniform(-180, 180) for _ in range(5000)]
+    # Cluster some coordinates around the search center:
+    latitudes += [min(max(latitude + rand.gauss(0, 1), -90), 90) for _ in range(500)]
+    longitudes += [(longitude + rand.gauss(0, 1) + 180) % 360 - 180 for _ in range(500)]
+
+    index = GridIndex(latitudes, longitudes, cell_size_degrees=cell_size_degrees)
+    expected = brute_force(latitudes, longitudes, latitude, longitude)
+
+    assert len(index) == 5500
+    assert index.within(latitude, longitude, distance_km) == [
+        match for match in expected if match[1] <= distance_km
+    ]
+    assert index.within(latitude, longitude, distance_km, limit=3) == expected[:3]
+    assert index.nearest(latitude, longitude, 10) == expected[:10]
+
+
+def test_grid_index_nearest_exhausted() -> None:
+    """Test asking for more neighbors than there are coordinates."""
+    index = GridIndex([10.0, -10.0], [20.0, -160.0])
+    assert [position for position, _ in index.nearest(10.0, 20.0, 5)] == [0, 1]
+    assert not index.nearest(10.0, 20.0, 0)
+    assert not GridIndex([], []).nearest(10.0, 20.0, 1)
+
+
+@pytest.mark.parametrize("cell_size_degrees", [0, -1, 181])
+def test_grid_index_invalid_cell_size(cell_size_degrees: float) -> None:
+    """Test an error with an invalid cell size.
+
+    Args:
+        cell_size_degrees: The size of each cell in the index.
+    """
+    with pytest.raises(ValueError) as err:
+        _ = GridIndex([], [], cell_size_degrees=cell_size_degrees)
+    assert "The cell size must be between 0 and 180 degrees" in str(err.value)